@@ -1,28 +1,68 @@
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
 from .__meta__ import __version__
-from .client import Platega
-from .enums import PaymentMethodInt, PaymentStatus
-from .exceptions import (
-    ClientDecodeError,
-    PlategaAPIError,
-    PlategaBadRequestError,
-    PlategaError,
-    PlategaForbiddenError,
-    PlategaNetworkError,
-    PlategaNotFoundError,
-    PlategaServerError,
-    PlategaUnauthorizedError,
-)
-from .types import (
-    CallbackPayload,
-    ConversionItem,
-    ConversionsResponse,
-    CreateTransactionRequest,
-    CreateTransactionResponse,
-    PaymentDetails,
-    PlategaObject,
-    RateResponse,
-    TransactionStatusResponse,
-)
+
+if TYPE_CHECKING:
+    from .client import Platega
+    from .enums import ParseMode, PaymentMethodInt, PaymentStatus
+    from .exceptions import (
+        ClientDecodeError,
+        PlategaAPIError,
+        PlategaBadRequestError,
+        PlategaCircuitOpenError,
+        PlategaDeadlineExceededError,
+        PlategaError,
+        PlategaForbiddenError,
+        PlategaNetworkError,
+        PlategaNotFoundError,
+        PlategaRateLimitError,
+        PlategaServerError,
+        PlategaTimeoutError,
+        PlategaUnauthorizedError,
+    )
+    from .types import (
+        CallbackPayload,
+        ConversionItem,
+        ConversionsResponse,
+        CreateTransactionRequest,
+        CreateTransactionResponse,
+        PaymentDetails,
+        PlategaObject,
+        RateResponse,
+        TransactionStatusResponse,
+    )
+
+# Public names are resolved on first access, so ``import aioplatega`` stays cheap
+# and e.g. parsing a webhook with ``CallbackPayload`` never imports aiohttp.
+_LAZY_IMPORTS = {
+    "CallbackPayload": ".types",
+    "ClientDecodeError": ".exceptions",
+    "ConversionItem": ".types",
+    "ConversionsResponse": ".types",
+    "CreateTransactionRequest": ".types",
+    "CreateTransactionResponse": ".types",
+    "ParseMode": ".enums",
+    "PaymentDetails": ".types",
+    "PaymentMethodInt": ".enums",
+    "PaymentStatus": ".enums",
+    "Platega": ".client",
+    "PlategaAPIError": ".exceptions",
+    "PlategaBadRequestError": ".exceptions",
+    "PlategaCircuitOpenError": ".exceptions",
+    "PlategaDeadlineExceededError": ".exceptions",
+    "PlategaError": ".exceptions",
+    "PlategaForbiddenError": ".exceptions",
+    "PlategaNetworkError": ".exceptions",
+    "PlategaNotFoundError": ".exceptions",
+    "PlategaObject": ".types",
+    "PlategaRateLimitError": ".exceptions",
+    "PlategaServerError": ".exceptions",
+    "PlategaTimeoutError": ".exceptions",
+    "PlategaUnauthorizedError": ".exceptions",
+    "RateResponse": ".types",
+    "TransactionStatusResponse": ".types",
+}
 
 __all__ = [
     "__version__",
@@ -32,19 +72,38 @@ __all__ = [
     "ConversionsResponse",
     "CreateTransactionRequest",
     "CreateTransactionResponse",
+    "ParseMode",
     "PaymentDetails",
     "PaymentMethodInt",
     "PaymentStatus",
     "Platega",
     "PlategaAPIError",
     "PlategaBadRequestError",
+    "PlategaCircuitOpenError",
+    "PlategaDeadlineExceededError",
     "PlategaError",
     "PlategaForbiddenError",
     "PlategaNetworkError",
     "PlategaNotFoundError",
     "PlategaObject",
+    "PlategaRateLimitError",
     "PlategaServerError",
+    "PlategaTimeoutError",
     "PlategaUnauthorizedError",
     "RateResponse",
     "TransactionStatusResponse",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,5 +1,27 @@
+from .batch import Batch, BatchItem, BatchStats
+from .export import COLUMNS, ConversionColumns, ConversionsExport
+from .pagination import ConversionsFetch, FetchStats, iter_conversion_pages
 from .platega import Platega
+from .sync import ConversionSync, SQLiteConversionStore, SyncCheckpoint, SyncReport
+from .watcher import PollSchedule, TransactionUpdate, TransactionWatcher, WatcherStats
 
 __all__ = [
+    "COLUMNS",
+    "Batch",
+    "BatchItem",
+    "BatchStats",
+    "ConversionColumns",
+    "ConversionSync",
+    "ConversionsExport",
+    "ConversionsFetch",
+    "FetchStats",
     "Platega",
+    "PollSchedule",
+    "SQLiteConversionStore",
+    "SyncCheckpoint",
+    "SyncReport",
+    "TransactionUpdate",
+    "TransactionWatcher",
+    "WatcherStats",
+    "iter_conversion_pages",
 ]
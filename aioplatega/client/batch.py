@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import math
+import random
+import time
+from collections.abc import (
+    AsyncGenerator,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Generator,
+    Iterable,
+)
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+
+T = TypeVar("T")
+
+# Latencies kept for percentiles; a uniform sample beyond that.
+_LATENCY_SAMPLES = 1024
+
+
+@dataclass(frozen=True)
+class BatchItem(Generic[T]):
+    """Outcome of one method of a :class:`Batch`.
+
+    Attributes:
+        index: Position of the method in the batch input.
+        method: The executed method.
+        result: Parsed response, or ``None`` if the call failed.
+        error: Exception raised by the call, or ``None`` if it succeeded.
+        elapsed: Seconds spent on the call.
+    """
+
+    index: int
+    method: PlategaMethod[T]
+    result: T | None = None
+    error: Exception | None = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def unwrap(self) -> T:
+        """Return the result, or raise the call's exception."""
+        if self.error is not None:
+            raise self.error
+        return self.result  # type: ignore[return-value]
+
+
+@dataclass(frozen=True)
+class BatchStats:
+    """Progress and throughput of a :class:`Batch`.
+
+    Attributes:
+        completed: Calls finished so far.
+        succeeded: Calls that returned a result.
+        failed: Calls that raised.
+        elapsed: Seconds since the batch started, or its total duration once done.
+        latency_p50: Median call latency in seconds, estimated from a sample
+            of at most 1024 calls.
+        latency_p95: 95th percentile call latency in seconds, estimated the same way.
+    """
+
+    completed: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    elapsed: float = 0.0
+    latency_p50: float = 0.0
+    latency_p95: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Completed calls per second."""
+        return self.completed / self.elapsed if self.elapsed > 0 else 0.0
+
+
+def _percentile(ordered: list[float], percentile: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, math.ceil(percentile * len(ordered)) - 1)]
+
+
+async def _iterate(items: Iterable[T] | AsyncIterable[T]) -> AsyncGenerator[T, None]:
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            yield item
+    else:
+        for item in items:
+            yield item
+
+
+class Batch(Generic[T]):
+    """Runs many methods with bounded concurrency.
+
+    Await the batch for results in input order, or iterate it for
+    :class:`BatchItem` objects as calls complete::
+
+        results = await client.batch(methods, concurrency=20)
+
+        async for item in client.batch(methods):
+            print(item.index, item.result or item.error)
+
+    At most ``concurrency`` calls are in flight; each goes through the client,
+    so the session's pool and middlewares apply. ``methods`` may be a regular
+    or an asynchronous iterable and is consumed lazily. When iterating, the
+    next method is only pulled once a completed item has been taken, so
+    memory stays bounded by ``concurrency`` however long the input is.
+
+    With ``return_exceptions`` (the default) a failing call does not affect
+    the others: its exception takes the place of the result, or is set on
+    :attr:`BatchItem.error`.
+    Otherwise the first failure cancels the remaining calls and is raised.
+
+    A batch runs once; :attr:`stats` reports its progress.
+    """
+
+    def __init__(
+        self,
+        execute: Callable[[PlategaMethod[T]], Awaitable[T]],
+        methods: Iterable[PlategaMethod[T]] | AsyncIterable[PlategaMethod[T]],
+        *,
+        concurrency: int = 10,
+        return_exceptions: bool = True,
+    ) -> None:
+        if concurrency < 1:
+            msg = "concurrency must be at least 1"
+            raise ValueError(msg)
+        self.concurrency = concurrency
+        self.return_exceptions = return_exceptions
+        self._execute = execute
+        self._methods = methods
+        self._latencies: list[float] = []
+        self._completed = 0
+        self._failed = 0
+        self._started: float | None = None
+        self._finished: float | None = None
+
+    @property
+    def stats(self) -> BatchStats:
+        if self._started is None:
+            return BatchStats()
+        finished = self._finished if self._finished is not None else time.monotonic()
+        ordered = sorted(self._latencies)
+        return BatchStats(
+            completed=self._completed,
+            succeeded=self._completed - self._failed,
+            failed=self._failed,
+            elapsed=finished - self._started,
+            latency_p50=_percentile(ordered, 0.5),
+            latency_p95=_percentile(ordered, 0.95),
+        )
+
+    async def _call(self, index: int, method: PlategaMethod[T]) -> BatchItem[T]:
+        started = time.monotonic()
+        try:
+            result = await self._execute(method)
+        except Exception as exc:
+            item = BatchItem(index, method, error=exc, elapsed=time.monotonic() - started)
+            self._failed += 1
+        else:
+            item = BatchItem(index, method, result=result, elapsed=time.monotonic() - started)
+        self._completed += 1
+        # Reservoir sampling keeps memory constant however long the input is.
+        if len(self._latencies) < _LATENCY_SAMPLES:
+            self._latencies.append(item.elapsed)
+        else:
+            slot = random.randrange(self._completed)
+            if slot < _LATENCY_SAMPLES:
+                self._latencies[slot] = item.elapsed
+        return item
+
+    async def _run(
+        self,
+        on_item: Callable[[BatchItem[T]], None],
+        slots: asyncio.Semaphore | None = None,
+    ) -> None:
+        if self._started is not None:
+            msg = "A batch can only run once"
+            raise RuntimeError(msg)
+        self._started = time.monotonic()
+        # Workers share one iterator, so the input is consumed lazily and
+        # exactly ``concurrency`` tasks exist regardless of its size.
+        methods = _iterate(self._methods)
+        indexes = itertools.count()
+        lock = asyncio.Lock()
+
+        async def worker() -> None:
+            while True:
+                if slots is not None:
+                    await slots.acquire()
+                async with lock:
+                    method = await anext(methods, None)
+                    index = next(indexes)
+                if method is None:
+                    return
+                on_item(await self._call(index, method))
+
+        workers = [asyncio.ensure_future(worker()) for _ in range(self.concurrency)]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            await methods.aclose()
+            self._finished = time.monotonic()
+
+    def _check(self, item: BatchItem[T]) -> None:
+        if item.error is not None and not self.return_exceptions:
+            raise item.error
+
+    async def results(self) -> list[T | Exception]:
+        """Run the batch and return results (or exceptions) in input order."""
+        items: dict[int, BatchItem[T]] = {}
+
+        def collect(item: BatchItem[T]) -> None:
+            self._check(item)
+            items[item.index] = item
+
+        await self._run(collect)
+        return [
+            items[index].result if items[index].error is None else items[index].error  # type: ignore[misc]
+            for index in range(len(items))
+        ]
+
+    async def as_completed(self) -> AsyncIterator[BatchItem[T]]:
+        """Run the batch and yield items in completion order."""
+        # Each slot covers one item from pulling its method until the consumer
+        # takes it, bounding calls in flight plus items waiting in the queue.
+        slots = asyncio.Semaphore(self.concurrency)
+        queue: asyncio.Queue[BatchItem[T] | None] = asyncio.Queue()
+        runner = asyncio.ensure_future(self._run(queue.put_nowait, slots))
+        runner.add_done_callback(lambda _: queue.put_nowait(None))
+        try:
+            while (item := await queue.get()) is not None:
+                slots.release()
+                self._check(item)
+                yield item
+            await runner
+        finally:
+            runner.cancel()
+            await asyncio.gather(runner, return_exceptions=True)
+
+    def __await__(self) -> Generator[Any, None, list[T | Exception]]:
+        return self.results().__await__()
+
+    def __aiter__(self) -> AsyncIterator[BatchItem[T]]:
+        return self.as_completed()
@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+import csv
+import json
+from collections.abc import AsyncGenerator, Iterator, Sequence
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, TextIO
+
+from aioplatega.enums import ParseMode
+from aioplatega.types.trusted import TrustedList
+
+from .pagination import iter_conversion_pages
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+    from .platega import Platega
+
+COLUMNS: tuple[str, ...] = ("id", "amount", "currency", "status", "created_at")
+"""Names of the exported columns, in order."""
+
+
+def _require(module: str, extra: str, feature: str) -> Any:
+    try:
+        return import_module(module)
+    except ImportError as exc:
+        msg = f'{feature} requires {module}: pip install "aioplatega[{extra}]"'
+        raise ImportError(msg) from exc
+
+
+def _utc_naive(value: Any) -> str | None:
+    """ISO 8601 text of a timestamp in UTC, without offset."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        if value.endswith("Z"):
+            return value[:-1]
+        value = datetime.fromisoformat(value)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return str(value.isoformat())
+
+
+def _records(content: Sequence[Any]) -> list[dict[str, Any]]:
+    if isinstance(content, TrustedList):
+        return content.raw
+    # Validated or compact items, e.g. from a session that ignores parse modes.
+    return [
+        {
+            "id": item.id,
+            "amount": item.amount,
+            "currency": item.currency,
+            "status": item.status,
+            "createdAt": item.created_at,
+        }
+        for item in content
+    ]
+
+
+@dataclass(frozen=True)
+class ConversionColumns:
+    """One page of conversion operations as columns.
+
+    Attributes:
+        id: Operation IDs.
+        amount: Amounts, ``None`` where missing.
+        currency: Currency codes.
+        status: Statuses.
+        created_at: Creation times as UTC ISO 8601 text without offset.
+    """
+
+    id: list[int | None] = field(default_factory=list)
+    amount: list[float | None] = field(default_factory=list)
+    currency: list[str | None] = field(default_factory=list)
+    status: list[str | None] = field(default_factory=list)
+    created_at: list[str | None] = field(default_factory=list)
+
+    @classmethod
+    def from_content(cls, content: Sequence[Any]) -> ConversionColumns:
+        """Build columns from the ``content`` of a conversions page."""
+        records = _records(content)
+        return cls(
+            id=[record.get("id") for record in records],
+            amount=[record.get("amount") for record in records],
+            currency=[record.get("currency") for record in records],
+            status=[record.get("status") for record in records],
+            created_at=[_utc_naive(record.get("createdAt")) for record in records],
+        )
+
+    def __len__(self) -> int:
+        return len(self.id)
+
+    def rows(self) -> Iterator[tuple[Any, ...]]:
+        """Iterate over the operations as tuples in :data:`COLUMNS` order."""
+        return zip(self.id, self.amount, self.currency, self.status, self.created_at, strict=True)
+
+    def to_numpy(self) -> dict[str, NDArray[Any]]:
+        """Convert to NumPy arrays.
+
+        IDs become ``int64`` with ``-1`` where missing, amounts ``float64``
+        with ``NaN``, codes fixed-width strings with ``""`` and times
+        ``datetime64[us]`` with ``NaT``.
+        """
+        np = _require("numpy", "numpy", "NumPy export")
+        return {
+            "id": np.array([-1 if value is None else value for value in self.id], np.int64),
+            "amount": np.array(self.amount, np.float64),
+            "currency": np.array(["" if value is None else value for value in self.currency], str),
+            "status": np.array(["" if value is None else value for value in self.status], str),
+            "created_at": np.array(self.created_at, "datetime64[us]"),
+        }
+
+
+class ConversionsExport:
+    """Exports conversion operations as columns, one page at a time.
+
+    Pages are requested in :attr:`~aioplatega.enums.ParseMode.TRUSTED` mode
+    and their JSON is copied straight into columns, so no model is built per
+    operation. The next ``prefetch`` pages are fetched while the current one
+    is converted. Streaming writers hold one page at a time; NumPy and Arrow
+    results hold the converted columns plus one page.
+
+    An export can be run more than once; every run fetches the pages again.
+    """
+
+    def __init__(
+        self,
+        client: Platega,
+        *,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        size: int = 1000,
+        prefetch: int = 1,
+    ) -> None:
+        self.client = client
+        self.from_date = from_date
+        self.to_date = to_date
+        self.size = size
+        self.prefetch = prefetch
+
+    async def batches(self) -> AsyncGenerator[ConversionColumns, None]:
+        """Yield the columns of each page in order."""
+        pages = iter_conversion_pages(
+            self.client,
+            from_date=self.from_date,
+            to_date=self.to_date,
+            size=self.size,
+            prefetch=self.prefetch,
+            parse_mode=ParseMode.TRUSTED,
+        )
+        try:
+            async for page in pages:
+                yield ConversionColumns.from_content(page.content)
+        finally:
+            await pages.aclose()
+
+    async def to_numpy(self) -> dict[str, NDArray[Any]]:
+        """Return every operation as NumPy arrays keyed by column name.
+
+        Requires NumPy: ``pip install "aioplatega[numpy]"``. See
+        :meth:`ConversionColumns.to_numpy` for the dtypes.
+        """
+        np = _require("numpy", "numpy", "NumPy export")
+        chunks = [batch.to_numpy() async for batch in self.batches()]
+        if not chunks:
+            return ConversionColumns().to_numpy()
+        return {name: np.concatenate([chunk[name] for chunk in chunks]) for name in COLUMNS}
+
+    async def to_arrow(self) -> Any:
+        """Return every operation as a :class:`pyarrow.Table`.
+
+        Requires pyarrow: ``pip install "aioplatega[arrow]"``. ``created_at``
+        is a UTC ``timestamp[us]`` column.
+        """
+        pa = _require("pyarrow", "arrow", "Arrow export")
+        schema = pa.schema(
+            [
+                ("id", pa.int64()),
+                ("amount", pa.float64()),
+                ("currency", pa.string()),
+                ("status", pa.string()),
+                ("created_at", pa.timestamp("us", tz="UTC")),
+            ]
+        )
+        batches = [
+            pa.record_batch(
+                [
+                    pa.array(batch.id, pa.int64()),
+                    pa.array(batch.amount, pa.float64()),
+                    pa.array(batch.currency, pa.string()),
+                    pa.array(batch.status, pa.string()),
+                    pa.array(batch.created_at, pa.string())
+                    .cast(pa.timestamp("us"))
+                    .cast(pa.timestamp("us", tz="UTC")),
+                ],
+                schema=schema,
+            )
+            async for batch in self.batches()
+        ]
+        return pa.Table.from_batches(batches, schema=schema)
+
+    async def write_csv(self, file: TextIO, *, header: bool = True) -> int:
+        """Write every operation to ``file`` as CSV and return the row count.
+
+        Missing values are written as empty fields and times as UTC ISO 8601
+        with a ``Z`` suffix.
+        """
+        writer = csv.writer(file)
+        if header:
+            writer.writerow(COLUMNS)
+        count = 0
+        async for batch in self.batches():
+            writer.writerows(
+                (id_, amount, currency, status, None if created_at is None else created_at + "Z")
+                for id_, amount, currency, status, created_at in batch.rows()
+            )
+            count += len(batch)
+        return count
+
+    async def write_ndjson(self, file: TextIO) -> int:
+        """Write every operation to ``file`` as one JSON object per line.
+
+        Returns the number of lines written.
+        """
+        count = 0
+        async for batch in self.batches():
+            file.writelines(
+                json.dumps(
+                    {
+                        "id": id_,
+                        "amount": amount,
+                        "currency": currency,
+                        "status": status,
+                        "created_at": None if created_at is None else created_at + "Z",
+                    },
+                    separators=(",", ":"),
+                    ensure_ascii=False,
+                )
+                + "\n"
+                for id_, amount, currency, status, created_at in batch.rows()
+            )
+            count += len(batch)
+        return count
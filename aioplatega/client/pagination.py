@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import time
+from collections import deque
+from collections.abc import AsyncGenerator, AsyncIterator, Generator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from aioplatega.methods import GetConversions
+from aioplatega.session.middlewares.retry import RetryBudget, RetryMiddleware, RetryPolicy
+
+if TYPE_CHECKING:
+    from aioplatega.enums import ParseMode
+    from aioplatega.methods.base import PlategaMethod
+    from aioplatega.types import ConversionItem, ConversionsResponse
+
+    from .platega import Platega
+
+
+async def iter_conversion_pages(
+    client: Platega,
+    *,
+    from_date: str | None = None,
+    to_date: str | None = None,
+    size: int = 100,
+    prefetch: int = 1,
+    parse_mode: ParseMode | None = None,
+) -> AsyncGenerator[ConversionsResponse, None]:
+    """Yield every page of conversions, fetching up to ``prefetch`` pages ahead.
+
+    Page 0 is fetched first; its ``total_pages`` bounds the pages requested
+    next, and every later page updates that bound. Iteration stops after the
+    last page or at the first empty one. Pages still being prefetched when
+    the consumer stops are cancelled. Pages are parsed in ``parse_mode``,
+    the client's mode by default.
+    """
+    if size < 1:
+        msg = "size must be at least 1"
+        raise ValueError(msg)
+    if prefetch < 0:
+        msg = "prefetch must not be negative"
+        raise ValueError(msg)
+
+    def fetch(page: int) -> asyncio.Future[ConversionsResponse]:
+        method = GetConversions(from_date=from_date, to_date=to_date, page=page, size=size)
+        return asyncio.ensure_future(client(method, parse_mode=parse_mode))
+
+    pending: deque[asyncio.Future[ConversionsResponse]] = deque([fetch(0)])
+    next_page = 1
+    try:
+        while pending:
+            response = await pending.popleft()
+            if not response.content:
+                return
+            while next_page < response.total_pages and len(pending) < prefetch:
+                pending.append(fetch(next_page))
+                next_page += 1
+            yield response
+            if not pending and next_page < response.total_pages:
+                pending.append(fetch(next_page))
+                next_page += 1
+    finally:
+        for future in pending:
+            future.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+
+
+@dataclass(frozen=True)
+class FetchStats:
+    """Progress of a :class:`ConversionsFetch`.
+
+    Attributes:
+        pages: Pages fetched so far.
+        total_pages: Pages to fetch, as reported by page 0.
+        items: Items fetched so far.
+        retries: Page requests repeated after a transient failure.
+        elapsed: Seconds since the fetch started, or its total duration once done.
+    """
+
+    pages: int = 0
+    total_pages: int = 0
+    items: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def pages_per_second(self) -> float:
+        return self.pages / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class ConversionsFetch:
+    """Fetches every page of conversions concurrently, in page order.
+
+    Page 0 is fetched first; its ``total_pages`` tells which pages follow,
+    and those are requested by at most ``concurrency`` concurrent calls.
+    Pages are delivered strictly in order. While a page is late, later pages
+    are buffered, up to ``2 * concurrency`` pages in flight or waiting, so
+    streaming memory stays bounded however long the history is.
+
+    A page failing with one of ``retry.retry_on`` is requested again with
+    backoff, without restarting the fetch, through a
+    :class:`~aioplatega.session.middlewares.retry.RetryMiddleware`: retries
+    draw from ``budget`` and stop at the active
+    :func:`~aioplatega.session.deadline.deadline`. Once a page cannot be
+    retried its error is raised and the remaining pages are cancelled.
+
+    Await the fetch for a list of items, or iterate it to stream them::
+
+        items = await client.fetch_conversions(from_date=..., to_date=...)
+
+        async for page in client.fetch_conversions(...).pages():
+            ...
+
+    A fetch runs once; :attr:`stats` reports its progress.
+    """
+
+    def __init__(
+        self,
+        client: Platega,
+        *,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        size: int = 100,
+        concurrency: int = 8,
+        retry: RetryPolicy | None = None,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        if size < 1:
+            msg = "size must be at least 1"
+            raise ValueError(msg)
+        if concurrency < 1:
+            msg = "concurrency must be at least 1"
+            raise ValueError(msg)
+        self.client = client
+        self.from_date = from_date
+        self.to_date = to_date
+        self.size = size
+        self.concurrency = concurrency
+        self.retry = retry or RetryPolicy(max_attempts=5, base_delay=0.5, max_delay=10.0)
+        self._retrying = RetryMiddleware(self.retry, budget)
+        self._pages = 0
+        self._total_pages = 0
+        self._items = 0
+        self._started: float | None = None
+        self._finished: float | None = None
+
+    @property
+    def stats(self) -> FetchStats:
+        if self._started is None:
+            return FetchStats()
+        finished = self._finished if self._finished is not None else time.monotonic()
+        return FetchStats(
+            pages=self._pages,
+            total_pages=self._total_pages,
+            items=self._items,
+            retries=self._retrying.stats.retries,
+            elapsed=finished - self._started,
+        )
+
+    async def _fetch(self, page: int, slots: asyncio.Semaphore) -> ConversionsResponse:
+        async def request(merchant_id: str, secret: str, method: PlategaMethod[Any]) -> Any:
+            async with slots:
+                return await self.client(method)
+
+        method = GetConversions(
+            from_date=self.from_date, to_date=self.to_date, page=page, size=self.size
+        )
+        response: ConversionsResponse = await self._retrying(
+            request, self.client._merchant_id, self.client._secret, method
+        )
+        self._pages += 1
+        self._items += len(response.content)
+        return response
+
+    async def pages(self) -> AsyncGenerator[ConversionsResponse, None]:
+        """Run the fetch and yield pages in order."""
+        if self._started is not None:
+            msg = "A fetch can only run once"
+            raise RuntimeError(msg)
+        self._started = time.monotonic()
+        slots = asyncio.Semaphore(self.concurrency)
+        pending: deque[asyncio.Future[ConversionsResponse]] = deque()
+        try:
+            first = await self._fetch(0, slots)
+            self._total_pages = max(first.total_pages, 1)
+            remaining = iter(range(1, self._total_pages))
+            # Tasks queue on ``slots`` in page order, so lower pages are
+            # requested first and at most ``concurrency`` run at once.
+            pending.extend(
+                asyncio.ensure_future(self._fetch(page, slots))
+                for page in itertools.islice(remaining, 2 * self.concurrency)
+            )
+            yield first
+            while pending:
+                response = await pending.popleft()
+                pending.extend(
+                    asyncio.ensure_future(self._fetch(page, slots))
+                    for page in itertools.islice(remaining, 1)
+                )
+                yield response
+        finally:
+            for future in pending:
+                future.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            self._finished = time.monotonic()
+
+    async def items(self) -> AsyncGenerator[ConversionItem, None]:
+        """Run the fetch and yield items in page order."""
+        pages = self.pages()
+        try:
+            async for page in pages:
+                for item in page.content:
+                    yield item
+        finally:
+            await pages.aclose()
+
+    async def to_list(self) -> list[ConversionItem]:
+        """Run the fetch and return every item in page order."""
+        items: list[ConversionItem] = []
+        async for page in self.pages():
+            items.extend(page.content)
+        return items
+
+    def __await__(self) -> Generator[Any, None, list[ConversionItem]]:
+        return self.to_list().__await__()
+
+    def __aiter__(self) -> AsyncIterator[ConversionItem]:
+        return self.items()
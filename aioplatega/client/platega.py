@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator, AsyncIterable, AsyncIterator, Iterable
+from contextlib import nullcontext
 from typing import TypeVar
+from uuid import UUID
 
-from aioplatega.enums import PaymentMethodInt
+from aioplatega.enums import ParseMode, PaymentMethodInt
 from aioplatega.methods import (
     CreateTransaction,
     GetConversions,
@@ -12,7 +15,14 @@ from aioplatega.methods import (
 from aioplatega.methods.base import PlategaMethod
 from aioplatega.session.aiohttp import AiohttpSession
 from aioplatega.session.base import BaseSession
+from aioplatega.session.deadline import deadline as deadline_scope
+from aioplatega.session.middlewares.rate_limiter import RateLimiterMiddleware
+from aioplatega.session.middlewares.retry import RetryBudget, RetryPolicy
+from aioplatega.session.parsing import use_parse_mode
+from aioplatega.session.pool import PoolConfig
+from aioplatega.session.warmup import WarmupReport
 from aioplatega.types import (
+    ConversionItem,
     ConversionsResponse,
     CreateTransactionResponse,
     PaymentDetails,
@@ -20,6 +30,10 @@ from aioplatega.types import (
     TransactionStatusResponse,
 )
 
+from .batch import Batch, BatchItem
+from .export import ConversionsExport
+from .pagination import ConversionsFetch, iter_conversion_pages
+
 T = TypeVar("T")
 
 
@@ -37,6 +51,8 @@ class Platega:
         merchant_id: str,
         secret: str,
         session: BaseSession | None = None,
+        pool: PoolConfig | None = None,
+        parse_mode: ParseMode | None = None,
     ) -> None:
         """Initialize the Platega client.
 
@@ -44,27 +60,54 @@ class Platega:
             merchant_id: Your Platega merchant identifier.
             secret: Your Platega secret key.
             session: Optional custom session. If not provided, an
-                :class:`~aioplatega.session.aiohttp.AiohttpSession` is created automatically.
+                :class:`~aioplatega.session.aiohttp.AiohttpSession` is created
+                automatically, with a
+                :class:`~aioplatega.session.middlewares.rate_limiter.RateLimiterMiddleware`
+                that pauses an endpoint after HTTP 429 for its ``Retry-After``.
+                Register one yourself on a custom session for the same behaviour.
+            pool: Connection pool settings for the automatically created session.
+                Ignored when ``session`` is given.
+            parse_mode: How responses to this client's calls are parsed, e.g.
+                :attr:`ParseMode.COMPACT <aioplatega.enums.ParseMode.COMPACT>` for
+                slotted dataclasses. Defaults to the session's own mode.
         """
         self._merchant_id = merchant_id
         self._secret = secret
         self._session = session
+        self._pool = pool
+        self._parse_mode = parse_mode
         self._owns_session = session is None
 
     def _get_session(self) -> BaseSession:
         if self._session is None:
-            self._session = AiohttpSession()
+            self._session = AiohttpSession(pool=self._pool)
+            # Without limits it only applies the pauses requested by 429 responses.
+            self._session.middleware(RateLimiterMiddleware())
             self._owns_session = True
         return self._session
 
-    async def __call__(self, method: PlategaMethod[T]) -> T:
-        """Dispatch a method object (aiogram-style command pattern)."""
+    async def __call__(
+        self,
+        method: PlategaMethod[T],
+        *,
+        deadline: float | None = None,
+        parse_mode: ParseMode | None = None,
+    ) -> T:
+        """Dispatch a method object (aiogram-style command pattern).
+
+        Args:
+            method: API method to execute.
+            deadline: Optional time budget in seconds for the whole call,
+                including retries. See :func:`~aioplatega.session.deadline.deadline`.
+            parse_mode: Parse mode for this call only, overriding the client's.
+        """
         session = self._get_session()
-        return await session.make_request(  # type: ignore[no-any-return]
-            merchant_id=self._merchant_id,
-            secret=self._secret,
-            method=method,
-        )
+        parse_mode = parse_mode or self._parse_mode
+        with (
+            nullcontext() if deadline is None else deadline_scope(deadline),
+            nullcontext() if parse_mode is None else use_parse_mode(parse_mode),
+        ):
+            return await session(self._merchant_id, self._secret, method)  # type: ignore[no-any-return]
 
     async def create_transaction(
         self,
@@ -170,6 +213,228 @@ class Platega:
             )
         )
 
+    def iter_conversion_pages(
+        self,
+        *,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        size: int = 100,
+        prefetch: int = 1,
+    ) -> AsyncGenerator[ConversionsResponse, None]:
+        """Iterate over every page of conversion operations.
+
+        While a page is being consumed, the next ``prefetch`` pages are
+        already being fetched. Iteration stops after ``total_pages`` pages.
+
+        Args:
+            from_date: Start date filter (ISO format string).
+            to_date: End date filter (ISO format string).
+            size: Number of items per page.
+            prefetch: Pages fetched ahead of the consumer; ``0`` fetches
+                each page only when asked for.
+        """
+        return iter_conversion_pages(
+            self, from_date=from_date, to_date=to_date, size=size, prefetch=prefetch
+        )
+
+    async def iter_conversions(
+        self,
+        *,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        size: int = 100,
+        prefetch: int = 1,
+    ) -> AsyncGenerator[ConversionItem, None]:
+        """Iterate over conversion operations across all pages.
+
+        Usage::
+
+            async for item in client.iter_conversions(from_date="2025-01-01T00:00:00Z"):
+                print(item.id, item.amount)
+
+        When stopping early, close the iterator (e.g. with
+        :func:`contextlib.aclosing`) to cancel prefetched pages right away.
+
+        Arguments are those of :meth:`iter_conversion_pages`.
+        """
+        pages = iter_conversion_pages(
+            self, from_date=from_date, to_date=to_date, size=size, prefetch=prefetch
+        )
+        try:
+            async for page in pages:
+                for item in page.content:
+                    yield item
+        finally:
+            await pages.aclose()
+
+    def fetch_conversions(
+        self,
+        *,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        size: int = 100,
+        concurrency: int = 8,
+        retry: RetryPolicy | None = None,
+        retry_budget: RetryBudget | None = None,
+    ) -> ConversionsFetch:
+        """Fetch every page of conversion operations concurrently.
+
+        Page 0 is read first; the remaining ``total_pages - 1`` pages are then
+        requested by up to ``concurrency`` concurrent calls and delivered in
+        page order. Await the returned
+        :class:`~aioplatega.client.pagination.ConversionsFetch` for a list of
+        items, or iterate it to stream them::
+
+            fetch = client.fetch_conversions(from_date=start, to_date=end, concurrency=16)
+            async for item in fetch:
+                ...
+            print(fetch.stats.pages_per_second)
+
+        Args:
+            from_date: Start date filter (ISO format string).
+            to_date: End date filter (ISO format string).
+            size: Number of items per page.
+            concurrency: Maximum number of page requests in flight.
+            retry: How failed pages are requested again; by default up to
+                five attempts on transient errors.
+            retry_budget: Caps page retries; by default a fresh
+                :class:`~aioplatega.session.middlewares.retry.RetryBudget`.
+        """
+        return ConversionsFetch(
+            self,
+            from_date=from_date,
+            to_date=to_date,
+            size=size,
+            concurrency=concurrency,
+            retry=retry,
+            budget=retry_budget,
+        )
+
+    def export_conversions(
+        self,
+        *,
+        from_date: str | None = None,
+        to_date: str | None = None,
+        size: int = 1000,
+        prefetch: int = 1,
+    ) -> ConversionsExport:
+        """Export conversion operations as columns without building models.
+
+        The returned :class:`~aioplatega.client.export.ConversionsExport`
+        produces NumPy arrays, an Arrow table, or streams CSV or NDJSON,
+        holding one page at a time::
+
+            arrays = await client.export_conversions(from_date=start).to_numpy()
+
+            with open("conversions.csv", "w", newline="") as file:
+                await client.export_conversions(from_date=start).write_csv(file)
+
+        Args:
+            from_date: Start date filter (ISO format string).
+            to_date: End date filter (ISO format string).
+            size: Number of items per page.
+            prefetch: Pages fetched ahead of the conversion.
+        """
+        return ConversionsExport(
+            self, from_date=from_date, to_date=to_date, size=size, prefetch=prefetch
+        )
+
+    def batch(
+        self,
+        methods: Iterable[PlategaMethod[T]] | AsyncIterable[PlategaMethod[T]],
+        *,
+        concurrency: int = 10,
+        return_exceptions: bool = True,
+    ) -> Batch[T]:
+        """Run many methods with at most ``concurrency`` in flight.
+
+        Await the returned :class:`~aioplatega.client.batch.Batch` for results
+        in input order, or iterate it to receive items as they complete::
+
+            statuses = await client.batch(
+                GetTransactionStatus(transaction_id=tid) for tid in ids
+            )
+
+        Args:
+            methods: Methods to execute, as a regular or asynchronous iterable;
+                consumed lazily.
+            concurrency: Maximum number of calls in flight.
+            return_exceptions: Return each failure in place of its result
+                instead of cancelling the batch and raising it.
+        """
+        return Batch(
+            self.__call__,
+            methods,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        )
+
+    def stream_transaction_statuses(
+        self,
+        transaction_ids: AsyncIterable[UUID | str],
+        *,
+        concurrency: int = 10,
+        return_exceptions: bool = True,
+    ) -> AsyncIterator[BatchItem[TransactionStatusResponse]]:
+        """Look up the status of every transaction ID from an async stream.
+
+        IDs are pulled only as capacity frees up: at most ``concurrency``
+        lookups are in flight and a new ID is read only after a finished
+        lookup has been consumed, so memory stays constant however many IDs
+        the stream produces. Items are yielded as lookups complete::
+
+            async for item in client.stream_transaction_statuses(ids_from_cursor()):
+                if item.ok:
+                    print(item.result.id, item.result.status)
+                else:
+                    print(item.method.transaction_id, item.error)
+
+        A malformed ID fails only its own item, with a
+        :class:`pydantic.ValidationError`; ``item.method.transaction_id``
+        holds the ID as it was read.
+
+        Args:
+            transaction_ids: Transaction UUIDs, e.g. read from a database cursor.
+            concurrency: Maximum number of lookups in flight.
+            return_exceptions: Yield failed lookups as items with
+                :attr:`~aioplatega.client.batch.BatchItem.error` set instead
+                of stopping the stream and raising.
+        """
+        # IDs are validated in ``lookup``, not while pulling them, so that a
+        # malformed ID fails its own item instead of ending the stream.
+        methods = (
+            GetTransactionStatus.model_construct(transaction_id=transaction_id)  # type: ignore[arg-type]
+            async for transaction_id in transaction_ids
+        )
+
+        async def lookup(
+            method: PlategaMethod[TransactionStatusResponse],
+        ) -> TransactionStatusResponse:
+            if isinstance(method, GetTransactionStatus):
+                method = GetTransactionStatus(transaction_id=method.transaction_id)
+            return await self(method)
+
+        return Batch(
+            lookup,
+            methods,
+            concurrency=concurrency,
+            return_exceptions=return_exceptions,
+        ).as_completed()
+
+    async def warmup(self, connections: int = 1) -> WarmupReport:
+        """Prepare the client for traffic, e.g. on worker startup.
+
+        Builds every validator and, with the default session, loads the SSL
+        context, resolves the API host and opens keep-alive connections.
+
+        Args:
+            connections: Number of keep-alive connections to open.
+
+        Returns:
+            Time spent in each warmup phase.
+        """
+        return await self._get_session().warmup(connections=connections)
+
     async def close(self) -> None:
         """Close the underlying HTTP session and release resources."""
         if self._session is not None and self._owns_session:
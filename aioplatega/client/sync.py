@@ -0,0 +1,330 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import time
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from .pagination import iter_conversion_pages
+
+if TYPE_CHECKING:
+    from .platega import Platega
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversions (
+    id INTEGER PRIMARY KEY,
+    amount REAL,
+    currency TEXT,
+    status TEXT,
+    created_at TEXT
+);
+CREATE INDEX IF NOT EXISTS conversions_created_at ON conversions (created_at);
+CREATE TABLE IF NOT EXISTS sync_checkpoint (
+    name TEXT PRIMARY KEY,
+    created_at TEXT,
+    last_id INTEGER,
+    window_end TEXT
+);
+CREATE TABLE IF NOT EXISTS sync_windows (
+    window_start TEXT NOT NULL,
+    window_end TEXT NOT NULL,
+    PRIMARY KEY (window_start, window_end)
+);
+"""
+
+_UPSERT = """
+INSERT INTO conversions (id, amount, currency, status, created_at)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (id) DO UPDATE SET
+    amount = excluded.amount,
+    currency = excluded.currency,
+    status = excluded.status,
+    created_at = excluded.created_at
+"""
+
+T = TypeVar("T")
+
+_Row = tuple[int, Any, Any, Any, "str | None"]
+
+
+def _utc(moment: datetime) -> datetime:
+    if moment.tzinfo is None:
+        return moment.replace(tzinfo=timezone.utc)
+    return moment.astimezone(timezone.utc)
+
+
+def _to_text(moment: datetime) -> str:
+    # Fixed-width UTC timestamps sort chronologically as text.
+    return _utc(moment).isoformat(timespec="microseconds")
+
+
+def _from_text(value: str | None) -> datetime | None:
+    return None if value is None else datetime.fromisoformat(value)
+
+
+def _api_date(moment: datetime) -> str:
+    return _utc(moment).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+def _row(item: Any) -> _Row | None:
+    if item.id is None:
+        return None
+    created_at = item.created_at
+    if isinstance(created_at, str):
+        created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
+    return (
+        item.id,
+        item.amount,
+        item.currency,
+        item.status,
+        None if created_at is None else _to_text(created_at),
+    )
+
+
+@dataclass(frozen=True)
+class SyncCheckpoint:
+    """Where the last synchronisation stopped.
+
+    Attributes:
+        created_at: ``created_at`` of the newest stored operation.
+        last_id: ``id`` of the newest stored operation.
+        window_end: End of the date range covered by the last planned run.
+    """
+
+    created_at: datetime | None = None
+    last_id: int | None = None
+    window_end: datetime | None = None
+
+
+@dataclass(frozen=True)
+class SyncReport:
+    """Outcome of :meth:`ConversionSync.run`.
+
+    Attributes:
+        windows: Date windows fetched, including ones resumed from an interrupted run.
+        pages: Pages fetched.
+        items: Operations upserted.
+        skipped: Operations ignored because they have no ``id``.
+        elapsed: Seconds the run took.
+        checkpoint: Checkpoint after the run.
+    """
+
+    windows: int = 0
+    pages: int = 0
+    items: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+    checkpoint: SyncCheckpoint = SyncCheckpoint()
+
+
+class SQLiteConversionStore:
+    """SQLite database holding synchronised conversion operations.
+
+    Operations live in the ``conversions`` table keyed by ``id``; the sync
+    checkpoint and the date windows still to fetch are stored alongside
+    them, so an interrupted run resumes where it stopped. Timestamps are
+    stored as UTC ISO 8601 text.
+
+    Methods are blocking; :class:`ConversionSync` runs them in a worker thread.
+    """
+
+    def __init__(self, path: str | Path, *, name: str = "conversions") -> None:
+        self.path = path
+        self.name = name
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def __len__(self) -> int:
+        (count,) = self._connection.execute("SELECT COUNT(*) FROM conversions").fetchone()
+        return int(count)
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return self._connection
+
+    def checkpoint(self) -> SyncCheckpoint:
+        row = self._connection.execute(
+            "SELECT created_at, last_id, window_end FROM sync_checkpoint WHERE name = ?",
+            (self.name,),
+        ).fetchone()
+        if row is None:
+            return SyncCheckpoint()
+        created_at, last_id, window_end = row
+        return SyncCheckpoint(_from_text(created_at), last_id, _from_text(window_end))
+
+    def plan(self, windows: Iterable[tuple[datetime, datetime]], window_end: datetime) -> None:
+        """Record ``windows`` as pending and move the covered range to ``window_end``."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO sync_windows VALUES (?, ?)",
+                [(_to_text(start), _to_text(end)) for start, end in windows],
+            )
+            self._connection.execute(
+                "INSERT INTO sync_checkpoint (name, window_end) VALUES (?, ?) "
+                "ON CONFLICT (name) DO UPDATE SET window_end = excluded.window_end",
+                (self.name, _to_text(window_end)),
+            )
+
+    def pending_windows(self) -> list[tuple[datetime, datetime]]:
+        """Windows planned but not fetched yet, oldest first."""
+        rows = self._connection.execute(
+            "SELECT window_start, window_end FROM sync_windows ORDER BY window_start"
+        ).fetchall()
+        return [
+            (datetime.fromisoformat(start), datetime.fromisoformat(end)) for start, end in rows
+        ]
+
+    def complete(self, start: datetime, end: datetime) -> None:
+        """Mark a window as fetched."""
+        with self._connection:
+            self._connection.execute(
+                "DELETE FROM sync_windows WHERE window_start = ? AND window_end = ?",
+                (_to_text(start), _to_text(end)),
+            )
+
+    def upsert(self, rows: list[_Row]) -> None:
+        """Insert or update operations and advance the checkpoint past them."""
+        dated = [(row[4], row[0]) for row in rows if row[4] is not None]
+        with self._connection:
+            self._connection.executemany(_UPSERT, rows)
+            if dated:
+                created_at, last_id = max(dated)
+                self._connection.execute(
+                    "INSERT INTO sync_checkpoint (name, created_at, last_id) VALUES (?, ?, ?) "
+                    "ON CONFLICT (name) DO UPDATE SET "
+                    "created_at = excluded.created_at, last_id = excluded.last_id "
+                    "WHERE sync_checkpoint.created_at IS NULL "
+                    "OR (excluded.created_at, excluded.last_id) "
+                    "> (sync_checkpoint.created_at, sync_checkpoint.last_id)",
+                    (self.name, created_at, last_id),
+                )
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+class ConversionSync:
+    """Keeps a :class:`SQLiteConversionStore` up to date with the API.
+
+    Each :meth:`run` fetches only the date range since the previous one,
+    starting ``overlap`` earlier to catch operations that became visible
+    late; re-fetched operations are upserted, not duplicated. The first run
+    starts at ``since``.
+
+    The range is split into windows of ``window``, fetched by up to
+    ``concurrency`` concurrent paginators. Windows are recorded in the store
+    before fetching and removed once stored, so a backfill interrupted by a
+    crash or cancellation resumes with the windows it had not finished.
+
+    Usage::
+
+        store = SQLiteConversionStore("conversions.db")
+        sync = ConversionSync(client, store, window=timedelta(days=7))
+        report = await sync.run(since=datetime(2024, 1, 1, tzinfo=timezone.utc))
+    """
+
+    def __init__(
+        self,
+        client: Platega,
+        store: SQLiteConversionStore,
+        *,
+        window: timedelta = timedelta(days=1),
+        overlap: timedelta = timedelta(minutes=10),
+        concurrency: int = 4,
+        size: int = 500,
+    ) -> None:
+        if window <= timedelta(0):
+            msg = "window must be positive"
+            raise ValueError(msg)
+        if concurrency < 1:
+            msg = "concurrency must be at least 1"
+            raise ValueError(msg)
+        self.client = client
+        self.store = store
+        self.window = window
+        self.overlap = overlap
+        self.concurrency = concurrency
+        self.size = size
+        self._lock = asyncio.Lock()
+
+    def split(self, start: datetime, end: datetime) -> list[tuple[datetime, datetime]]:
+        """Split ``[start, end)`` into windows of at most :attr:`window`."""
+        windows = []
+        while start < end:
+            windows.append((start, min(start + self.window, end)))
+            start += self.window
+        return windows
+
+    async def _store(self, function: Callable[..., T], *args: Any) -> T:
+        # One connection serves every window, one statement batch at a time.
+        async with self._lock:
+            return await asyncio.to_thread(function, *args)
+
+    async def run(
+        self,
+        *,
+        since: datetime | None = None,
+        until: datetime | None = None,
+    ) -> SyncReport:
+        """Fetch everything created since the last run and upsert it.
+
+        Args:
+            since: Start of the history on the first run; ignored once a
+                checkpoint exists.
+            until: End of the range to fetch, now by default.
+        """
+        started = time.monotonic()
+        end = _utc(until or datetime.now(timezone.utc))
+        checkpoint = await self._store(self.store.checkpoint)
+        if checkpoint.window_end is not None:
+            start = checkpoint.window_end - self.overlap
+        elif since is not None:
+            start = _utc(since)
+        else:
+            msg = "since is required on the first run"
+            raise ValueError(msg)
+        await self._store(self.store.plan, self.split(start, end), max(end, start))
+        windows = await self._store(self.store.pending_windows)
+
+        pages = items = skipped = 0
+        queue = iter(windows)
+
+        async def worker() -> None:
+            nonlocal pages, items, skipped
+            for window_start, window_end in queue:
+                async for page in iter_conversion_pages(
+                    self.client,
+                    from_date=_api_date(window_start),
+                    to_date=_api_date(window_end),
+                    size=self.size,
+                ):
+                    rows = [row for row in map(_row, page.content) if row is not None]
+                    await self._store(self.store.upsert, rows)
+                    pages += 1
+                    items += len(rows)
+                    skipped += len(page.content) - len(rows)
+                await self._store(self.store.complete, window_start, window_end)
+
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(min(self.concurrency, len(windows)))
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # Unfinished windows stay pending in the store for the next run.
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return SyncReport(
+            windows=len(windows),
+            pages=pages,
+            items=items,
+            skipped=skipped,
+            elapsed=time.monotonic() - started,
+            checkpoint=await self._store(self.store.checkpoint),
+        )
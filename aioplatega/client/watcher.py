@@ -0,0 +1,391 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import re
+from collections.abc import AsyncIterator, Callable
+from contextlib import suppress
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+from uuid import UUID
+
+from aioplatega.enums import PaymentStatus
+from aioplatega.methods import GetTransactionStatus
+
+if TYPE_CHECKING:
+    from .platega import Platega
+
+logger = logging.getLogger(__name__)
+
+TERMINAL_STATUSES: frozenset[str] = frozenset(
+    status.value
+    for status in (PaymentStatus.CONFIRMED, PaymentStatus.CANCELED, PaymentStatus.CHARGEBACKED)
+)
+
+_DURATION = re.compile(r"^(?:(\d+)\.)?(\d+):(\d{1,2}):(\d{1,2}(?:\.\d+)?)$")
+
+
+def _parse_expires_in(value: str | None) -> float | None:
+    """Seconds until expiry from an ``expiresIn`` value.
+
+    Accepts a number of seconds, a ``[D.]HH:MM:SS`` duration or an ISO 8601 timestamp.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    match = _DURATION.match(value)
+    if match is not None:
+        days, hours, minutes, seconds = match.groups()
+        return (int(days or 0) * 24 + int(hours)) * 3600 + int(minutes) * 60 + float(seconds)
+    try:
+        moment = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - datetime.now(timezone.utc)).total_seconds()
+
+
+@dataclass(frozen=True)
+class PollSchedule:
+    """Adaptive polling intervals of a :class:`TransactionWatcher`.
+
+    A transaction is polled again after ``age * age_factor`` seconds, clamped
+    to ``[min_interval, max_interval]``: every few seconds right after creation,
+    then less and less often as the payment ages.
+
+    Attributes:
+        min_interval: Shortest delay between two polls of a transaction.
+        max_interval: Longest delay between two polls of a transaction.
+        age_factor: Delay as a fraction of the transaction's age.
+        expiry_grace: Seconds after ``expiresIn`` during which the
+            transaction is still polled for a late final status.
+        max_age: Stop watching transactions older than this many seconds,
+            or ``None`` to watch until a final status or expiry.
+    """
+
+    min_interval: float = 2.0
+    max_interval: float = 60.0
+    age_factor: float = 0.1
+    expiry_grace: float = 5.0
+    max_age: float | None = None
+
+    def interval(self, age: float) -> float:
+        return min(self.max_interval, max(self.min_interval, age * self.age_factor))
+
+
+@dataclass(frozen=True)
+class TransactionUpdate:
+    """A change observed by a :class:`TransactionWatcher`.
+
+    Attributes:
+        transaction_id: The watched transaction.
+        status: Latest known status.
+        previous_status: Status before this update, ``None`` if it was unknown.
+        response: The response that revealed the change, ``None`` on expiry.
+        final: Whether the transaction is no longer watched.
+        expired: Whether watching stopped because the transaction expired or
+            exceeded :attr:`PollSchedule.max_age` without a final status.
+    """
+
+    transaction_id: UUID
+    status: str | None
+    previous_status: str | None
+    response: Any = None
+    final: bool = False
+    expired: bool = False
+
+
+@dataclass(frozen=True)
+class WatcherStats:
+    """Counters of a :class:`TransactionWatcher`.
+
+    Attributes:
+        watched: Transactions currently watched.
+        polls: Status requests that succeeded.
+        errors: Status requests that failed; the transaction is polled again later.
+        updates: Status changes delivered.
+        callback_errors: Exceptions raised by ``on_update``; they are logged
+            and watching continues.
+        finished: Transactions that reached a final status.
+        expired: Transactions dropped on expiry or ``max_age``.
+        max_lag: Longest delay, in seconds, between a poll being due and being sent.
+    """
+
+    watched: int = 0
+    polls: int = 0
+    errors: int = 0
+    updates: int = 0
+    callback_errors: int = 0
+    finished: int = 0
+    expired: int = 0
+    max_lag: float = 0.0
+
+
+@dataclass(eq=False)
+class _Watch:
+    transaction_id: UUID
+    status: str | None
+    added_at: float
+    expires_at: float | None
+
+
+class TransactionWatcher:
+    """Polls many pending transactions from one scheduler until they settle.
+
+    Transactions sit in a single heap ordered by their next poll time; one
+    scheduler task moves due transactions to a fixed pool of ``concurrency``
+    workers. There is no task or timer per transaction, so watching 100k
+    transactions costs a heap entry each and CPU time grows only with the
+    number of polls actually sent.
+
+    Polling intervals follow the :class:`PollSchedule`. A transaction stops
+    being watched once it reaches one of ``terminal_statuses``, when its
+    ``expiresIn`` has passed (plus the grace period), or on :meth:`unwatch`.
+
+    Every status change is passed to ``on_update`` and to each consumer
+    iterating the watcher. Exceptions from ``on_update`` are logged and
+    counted in :attr:`WatcherStats.callback_errors`::
+
+        async with TransactionWatcher(client) as watcher:
+            watcher.watch(result.transaction_id, status=result.status)
+            async for update in watcher:
+                print(update.transaction_id, update.previous_status, "->", update.status)
+    """
+
+    def __init__(
+        self,
+        client: Platega,
+        *,
+        schedule: PollSchedule | None = None,
+        concurrency: int = 10,
+        terminal_statuses: frozenset[str] = TERMINAL_STATUSES,
+        on_update: Callable[[TransactionUpdate], Any] | None = None,
+    ) -> None:
+        self.client = client
+        self.schedule = schedule or PollSchedule()
+        self.concurrency = concurrency
+        self.terminal_statuses = terminal_statuses
+        self.on_update = on_update
+        self._watched: dict[UUID, _Watch] = {}
+        self._heap: list[tuple[float, int, _Watch]] = []
+        self._sequence = itertools.count()
+        self._wakeup = asyncio.Event()
+        self._idle = asyncio.Event()
+        self._idle.set()
+        self._due: asyncio.Queue[_Watch] = asyncio.Queue(maxsize=concurrency)
+        self._subscribers: set[asyncio.Queue[TransactionUpdate | None]] = set()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._polls = 0
+        self._errors = 0
+        self._updates = 0
+        self._callback_errors = 0
+        self._finished = 0
+        self._expired = 0
+        self._max_lag = 0.0
+
+    @property
+    def stats(self) -> WatcherStats:
+        return WatcherStats(
+            watched=len(self._watched),
+            polls=self._polls,
+            errors=self._errors,
+            updates=self._updates,
+            callback_errors=self._callback_errors,
+            finished=self._finished,
+            expired=self._expired,
+            max_lag=self._max_lag,
+        )
+
+    def __len__(self) -> int:
+        return len(self._watched)
+
+    def __contains__(self, transaction_id: object) -> bool:
+        return transaction_id in self._watched
+
+    def watch(
+        self,
+        transaction_id: UUID | str,
+        *,
+        status: str | None = None,
+        age: float = 0.0,
+        expires_in: str | float | None = None,
+    ) -> None:
+        """Start watching a transaction.
+
+        Watching an already watched transaction does nothing.
+
+        Args:
+            transaction_id: The transaction to poll.
+            status: Last known status; the first poll reports a change from it.
+            age: Seconds since the transaction was created.
+            expires_in: ``expiresIn`` from the create response, or seconds
+                until expiry. Later polls can only bring it forward.
+        """
+        transaction_id = UUID(str(transaction_id))
+        if transaction_id in self._watched:
+            return
+        now = asyncio.get_running_loop().time()
+        remaining = (
+            expires_in if isinstance(expires_in, (int, float)) else _parse_expires_in(expires_in)
+        )
+        watch = _Watch(
+            transaction_id=transaction_id,
+            status=status,
+            added_at=now - age,
+            expires_at=None if remaining is None else now + remaining,
+        )
+        self._watched[transaction_id] = watch
+        self._idle.clear()
+        self._push(watch, now + self.schedule.interval(age))
+
+    def unwatch(self, transaction_id: UUID | str) -> None:
+        """Stop watching a transaction without emitting an update."""
+        self._forget(UUID(str(transaction_id)))
+
+    def start(self) -> None:
+        """Start the scheduler and workers; called by ``async with``."""
+        if self._tasks:
+            return
+        self._tasks.append(asyncio.ensure_future(self._schedule()))
+        self._tasks.extend(asyncio.ensure_future(self._work()) for _ in range(self.concurrency))
+
+    async def close(self) -> None:
+        """Stop polling and end every iteration over the watcher."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+
+    async def join(self) -> None:
+        """Wait until no transaction is watched."""
+        await self._idle.wait()
+
+    async def updates(self) -> AsyncIterator[TransactionUpdate]:
+        """Yield every update from now on, until the watcher is closed."""
+        queue: asyncio.Queue[TransactionUpdate | None] = asyncio.Queue()
+        self._subscribers.add(queue)
+        try:
+            while (update := await queue.get()) is not None:
+                yield update
+        finally:
+            self._subscribers.discard(queue)
+
+    def __aiter__(self) -> AsyncIterator[TransactionUpdate]:
+        return self.updates()
+
+    async def __aenter__(self) -> TransactionWatcher:
+        self.start()
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        await self.close()
+
+    def _push(self, watch: _Watch, due: float) -> None:
+        if watch.expires_at is not None:
+            due = min(due, watch.expires_at + self.schedule.expiry_grace)
+        heapq.heappush(self._heap, (due, next(self._sequence), watch))
+        if self._heap[0][2] is watch:
+            self._wakeup.set()
+
+    def _forget(self, transaction_id: UUID) -> None:
+        # Heap entries of forgotten watches are skipped when they come due.
+        self._watched.pop(transaction_id, None)
+        if not self._watched:
+            self._idle.set()
+
+    def _emit(self, update: TransactionUpdate) -> None:
+        self._updates += 1
+        if self.on_update is not None:
+            # A failing callback must not take a worker down with it.
+            try:
+                self.on_update(update)
+            except Exception:
+                self._callback_errors += 1
+                logger.exception("on_update failed for transaction %s", update.transaction_id)
+        for queue in self._subscribers:
+            queue.put_nowait(update)
+
+    async def _schedule(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            self._wakeup.clear()
+            if not self._heap:
+                await self._wakeup.wait()
+                continue
+            due, _, watch = self._heap[0]
+            delay = due - loop.time()
+            if delay > 0:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), delay)
+                continue
+            heapq.heappop(self._heap)
+            if self._watched.get(watch.transaction_id) is not watch:
+                continue
+            self._max_lag = max(self._max_lag, -delay)
+            await self._due.put(watch)
+
+    async def _work(self) -> None:
+        while True:
+            watch = await self._due.get()
+            await self._poll(watch)
+
+    async def _poll(self, watch: _Watch) -> None:
+        loop = asyncio.get_running_loop()
+        try:
+            response = await self.client(GetTransactionStatus(transaction_id=watch.transaction_id))
+        except Exception:
+            self._errors += 1
+            response = None
+        else:
+            self._polls += 1
+        if self._watched.get(watch.transaction_id) is not watch:
+            return
+
+        now = loop.time()
+        if response is not None:
+            remaining = _parse_expires_in(response.expires_in)
+            if remaining is not None:
+                # Keep the earliest expiry so that a lifetime reported again
+                # on every poll cannot postpone it.
+                expires_at = now + remaining
+                if watch.expires_at is None or expires_at < watch.expires_at:
+                    watch.expires_at = expires_at
+            status = response.status
+            final = status in self.terminal_statuses
+            if final or status != watch.status:
+                previous, watch.status = watch.status, status
+                if final:
+                    self._finished += 1
+                    self._forget(watch.transaction_id)
+                self._emit(
+                    TransactionUpdate(
+                        watch.transaction_id, status, previous, response=response, final=final
+                    )
+                )
+                if final:
+                    return
+
+        age = now - watch.added_at
+        expired = (
+            watch.expires_at is not None and now >= watch.expires_at + self.schedule.expiry_grace
+        )
+        if expired or (self.schedule.max_age is not None and age >= self.schedule.max_age):
+            self._expired += 1
+            self._forget(watch.transaction_id)
+            self._emit(
+                TransactionUpdate(
+                    watch.transaction_id, watch.status, watch.status, final=True, expired=True
+                )
+            )
+            return
+        self._push(watch, now + self.schedule.interval(age))
@@ -1,4 +1,5 @@
+from .parse_mode import ParseMode
 from .payment_method_int import PaymentMethodInt
 from .payment_status import PaymentStatus
 
-__all__ = ["PaymentMethodInt", "PaymentStatus"]
+__all__ = ["ParseMode", "PaymentMethodInt", "PaymentStatus"]
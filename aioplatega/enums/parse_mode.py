@@ -0,0 +1,20 @@
+from enum import Enum
+
+
+class ParseMode(str, Enum):
+    """How a session turns response bodies into objects.
+
+    ``VALIDATE`` builds the regular pydantic models from :mod:`aioplatega.types`.
+    ``COMPACT`` builds slotted dataclasses from :mod:`aioplatega.types.compact`
+    with the same field names; they take a fraction of the memory but drop
+    fields unknown to the schema.
+    ``TRUSTED`` skips validation and returns read-only views from
+    :mod:`aioplatega.types.trusted` that resolve attributes from the decoded
+    JSON on access; values keep their JSON types (e.g. UUIDs and datetimes stay
+    strings) and unknown fields remain reachable. Use it for bulk reads of data
+    you trust.
+    """
+
+    VALIDATE = "validate"
+    COMPACT = "compact"
+    TRUSTED = "trusted"
@@ -2,11 +2,15 @@ from .base import (
     ClientDecodeError,
     PlategaAPIError,
     PlategaBadRequestError,
+    PlategaCircuitOpenError,
+    PlategaDeadlineExceededError,
     PlategaError,
     PlategaForbiddenError,
     PlategaNetworkError,
     PlategaNotFoundError,
+    PlategaRateLimitError,
     PlategaServerError,
+    PlategaTimeoutError,
     PlategaUnauthorizedError,
 )
 
@@ -14,10 +18,14 @@ __all__ = [
     "ClientDecodeError",
     "PlategaAPIError",
     "PlategaBadRequestError",
+    "PlategaCircuitOpenError",
+    "PlategaDeadlineExceededError",
     "PlategaError",
     "PlategaForbiddenError",
     "PlategaNetworkError",
     "PlategaNotFoundError",
+    "PlategaRateLimitError",
     "PlategaServerError",
+    "PlategaTimeoutError",
     "PlategaUnauthorizedError",
 ]
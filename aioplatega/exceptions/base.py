@@ -46,6 +46,25 @@ class PlategaNotFoundError(PlategaAPIError):
     """HTTP 404 Not Found."""
 
 
+class PlategaRateLimitError(PlategaAPIError):
+    """HTTP 429 Too Many Requests.
+
+    ``retry_after`` holds the delay in seconds parsed from the ``Retry-After``
+    header, or ``None`` when the server did not send one.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        method: str | None = None,
+        status_code: int | None = None,
+        body: Any = None,
+        retry_after: float | None = None,
+    ) -> None:
+        self.retry_after = retry_after
+        super().__init__(message, method=method, status_code=status_code, body=body)
+
+
 class PlategaServerError(PlategaAPIError):
     """HTTP 5xx Server Error."""
 
@@ -54,5 +73,27 @@ class PlategaNetworkError(PlategaError):
     """Network-level error (connection refused, timeout, DNS failure, etc.)."""
 
 
+class PlategaTimeoutError(PlategaNetworkError):
+    """Request exceeded its timeout or the caller's deadline."""
+
+
+class PlategaDeadlineExceededError(PlategaTimeoutError):
+    """The caller's deadline expired before the request reached the API.
+
+    Raised while waiting for a rate limit, a concurrency slot or a shared
+    request, or when no time was left to send it. It says nothing about the
+    health of the endpoint.
+    """
+
+
+class PlategaCircuitOpenError(PlategaError):
+    """Request rejected without a network call because the endpoint's circuit is open."""
+
+    def __init__(self, method: str, retry_after: float) -> None:
+        self.method = method
+        self.retry_after = retry_after
+        super().__init__(f"Circuit for {method} is open, retry in {retry_after:.2f}s")
+
+
 class ClientDecodeError(PlategaError):
     """Failed to decode/parse the API response."""
@@ -1,8 +1,21 @@
-from .base import PlategaMethod
-from .create_transaction import CreateTransaction
-from .get_conversions import GetConversions
-from .get_rate import GetRate
-from .get_transaction_status import GetTransactionStatus
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import PlategaMethod, RequestTimeout
+    from .create_transaction import CreateTransaction
+    from .get_conversions import GetConversions
+    from .get_rate import GetRate
+    from .get_transaction_status import GetTransactionStatus
+
+_LAZY_IMPORTS = {
+    "CreateTransaction": ".create_transaction",
+    "GetConversions": ".get_conversions",
+    "GetRate": ".get_rate",
+    "GetTransactionStatus": ".get_transaction_status",
+    "PlategaMethod": ".base",
+    "RequestTimeout": ".base",
+}
 
 __all__ = [
     "CreateTransaction",
@@ -10,4 +23,19 @@ __all__ = [
     "GetRate",
     "GetTransactionStatus",
     "PlategaMethod",
+    "RequestTimeout",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
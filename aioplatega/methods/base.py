@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, ClassVar, Generic, TypeVar
 
 from aioplatega.types.base import PlategaObject
@@ -7,6 +8,21 @@ from aioplatega.types.base import PlategaObject
 PlategaType = TypeVar("PlategaType")
 
 
+@dataclass(frozen=True)
+class RequestTimeout:
+    """Timeouts (in seconds) applied to a single HTTP attempt.
+
+    Attributes:
+        connect: Time to obtain a connection, including waiting for a free pool slot.
+        read: Time to wait for the first byte and between subsequent reads.
+        total: Time for the whole attempt, from connecting to reading the body.
+    """
+
+    connect: float | None = 5.0
+    read: float | None = 15.0
+    total: float | None = 30.0
+
+
 class PlategaMethod(PlategaObject, Generic[PlategaType]):
     """Base class for all Platega API methods (command pattern).
 
@@ -14,8 +30,12 @@ class PlategaMethod(PlategaObject, Generic[PlategaType]):
       - ``__api_method__``: URL path (may contain ``{field_name}`` placeholders).
       - ``__http_method__``: ``"GET"`` or ``"POST"``.
       - ``__returning__``: response model class.
+
+    Subclasses may also set ``__timeout__`` to a :class:`RequestTimeout`
+    overriding the session default for this method.
     """
 
     __api_method__: ClassVar[str]
     __http_method__: ClassVar[str]
     __returning__: ClassVar[type[Any]]
+    __timeout__: ClassVar[RequestTimeout | None] = None
@@ -5,13 +5,14 @@ from pydantic import Field
 from aioplatega.enums import PaymentMethodInt
 from aioplatega.types import CreateTransactionResponse, PaymentDetails
 
-from .base import PlategaMethod
+from .base import PlategaMethod, RequestTimeout
 
 
 class CreateTransaction(PlategaMethod[CreateTransactionResponse]):
     __api_method__: ClassVar[str] = "/transaction/process"
     __http_method__: ClassVar[str] = "POST"
     __returning__: ClassVar[type] = CreateTransactionResponse
+    __timeout__: ClassVar[RequestTimeout] = RequestTimeout(connect=2.0, read=8.0, total=10.0)
 
     payment_method: PaymentMethodInt = Field(alias="paymentMethod")
     payment_details: PaymentDetails = Field(alias="paymentDetails")
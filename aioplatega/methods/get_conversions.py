@@ -4,13 +4,14 @@ from pydantic import Field
 
 from aioplatega.types import ConversionsResponse
 
-from .base import PlategaMethod
+from .base import PlategaMethod, RequestTimeout
 
 
 class GetConversions(PlategaMethod[ConversionsResponse]):
     __api_method__: ClassVar[str] = "/transaction/balance-unlock-operations"
     __http_method__: ClassVar[str] = "GET"
     __returning__: ClassVar[type] = ConversionsResponse
+    __timeout__: ClassVar[RequestTimeout] = RequestTimeout(connect=5.0, read=30.0, total=60.0)
 
     from_date: Optional[str] = Field(None, alias="from")
     to_date: Optional[str] = Field(None, alias="to")
@@ -0,0 +1,22 @@
+"""Vectorized reporting over conversion and transaction columns.
+
+Requires NumPy: ``pip install "aioplatega[numpy]"``.
+"""
+
+try:
+    import numpy  # noqa: F401
+except ImportError as exc:  # pragma: no cover
+    msg = 'aioplatega.reporting requires numpy: pip install "aioplatega[numpy]"'
+    raise ImportError(msg) from exc
+
+from .aggregate import DAY, GroupReport, commission_totals, group_by
+from .columns import TRANSACTION_COLUMNS, transaction_columns
+
+__all__ = [
+    "DAY",
+    "TRANSACTION_COLUMNS",
+    "GroupReport",
+    "commission_totals",
+    "group_by",
+    "transaction_columns",
+]
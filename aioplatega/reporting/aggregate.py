@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Mapping, Sequence
+from dataclasses import dataclass, field
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+DAY = "day"
+"""Derived grouping key: the UTC date of ``created_at``."""
+
+_DENSE_SPAN = 1 << 22
+_SAMPLE = 4096
+_RADIX_GROUPS = 1 << 16
+_MAX_ITEMSIZE = 8
+
+
+def _key_column(columns: Mapping[str, NDArray[Any]], name: str) -> NDArray[Any]:
+    if name in columns:
+        return columns[name]
+    if name == DAY and "created_at" in columns:
+        return columns["created_at"].astype("datetime64[D]")
+    msg = f"Unknown column {name!r}"
+    raise KeyError(msg)
+
+
+def _percentile_name(value: str, percentile: float) -> str:
+    return f"{value}_p{percentile * 100:g}"
+
+
+def _dense(column: NDArray[Any]) -> tuple[NDArray[Any], NDArray[np.intp]] | None:
+    """Factorize integers or times spanning a small range with ``bincount``, in O(n)."""
+    if (
+        not len(column)
+        or column.dtype.kind not in "biuMm"
+        or column.dtype.itemsize > _MAX_ITEMSIZE
+    ):
+        return None
+    integers = column.view(np.int64) if column.dtype.kind in "Mm" else column.astype(np.int64)
+    low, high = int(integers.min()), int(integers.max())
+    if high - low >= max(_DENSE_SPAN, len(column)):
+        return None
+    offsets = (integers - low).astype(np.intp)
+    present = np.bincount(offsets) > 0
+    uniques = np.flatnonzero(present).astype(np.int64) + low
+    uniques = (
+        uniques.view(column.dtype) if column.dtype.kind in "Mm" else uniques.astype(column.dtype)
+    )
+    return uniques, (np.cumsum(present) - 1)[offsets]
+
+
+def _factorize(column: NDArray[Any]) -> tuple[NDArray[Any], NDArray[np.intp]]:
+    """Sorted distinct values of ``column`` and the index of every row among them.
+
+    Equivalent to ``np.unique(column, return_inverse=True)``, which sorts the
+    whole column. Keys usually take few distinct values, so they are looked
+    up among those of a sample instead, falling back to sorting when the
+    sample misses too many rows.
+    """
+    dense = _dense(column)
+    if dense is not None:
+        return dense
+    sample = np.unique(column[:: max(1, len(column) // _SAMPLE)])
+    if len(sample):
+        codes = np.minimum(np.searchsorted(sample, column), len(sample) - 1)
+        missing = sample[codes] != column
+        if np.count_nonzero(missing) * 8 < len(column):
+            if missing.any():
+                sample = np.union1d(sample, column[missing])
+                codes = np.searchsorted(sample, column)
+            return sample, codes
+    uniques, codes = np.unique(column, return_inverse=True)
+    return uniques, codes.ravel()
+
+
+def _groups(keys: list[NDArray[Any]], rows: int) -> tuple[list[NDArray[Any]], NDArray[np.intp]]:
+    """Distinct key combinations, sorted, and the group index of every row."""
+    if not keys:
+        return [], np.zeros(rows, np.intp)
+    uniques, codes = zip(*(_factorize(key) for key in keys), strict=True)
+    if len(keys) == 1:
+        return list(uniques), codes[0]
+    shape = tuple(len(unique) for unique in uniques)
+    combined = np.asarray(np.ravel_multi_index(codes, shape)) if rows else codes[0]
+    present, groups = _factorize(combined)
+    positions = np.unravel_index(present, shape)
+    return [unique[position] for unique, position in zip(uniques, positions, strict=True)], groups
+
+
+def _percentiles(
+    values: NDArray[np.float64],
+    groups: NDArray[np.intp],
+    count: int,
+    percentiles: Sequence[float],
+) -> list[NDArray[np.float64]]:
+    """Linearly interpolated percentiles of ``values`` per group, ignoring ``NaN``."""
+    valid = ~np.isnan(values)
+    values, groups = values[valid], groups[valid]
+    # Sort by value, then stably by group: each group becomes a sorted slice.
+    # Small group indexes are narrowed so that the stable sort is a radix sort.
+    order = np.argsort(values)
+    narrow = groups[order].astype(np.uint16 if count <= _RADIX_GROUPS else np.intp)
+    ordered = values[order[np.argsort(narrow, kind="stable")]]
+    sizes = np.bincount(groups, minlength=count)
+    starts = np.cumsum(sizes) - sizes
+    empty = sizes == 0
+    last = max(len(ordered) - 1, 0)
+    padded = ordered if len(ordered) else np.zeros(1)
+    results = []
+    for percentile in percentiles:
+        position = starts + percentile * np.maximum(sizes - 1, 0)
+        low = np.clip(np.floor(position).astype(np.intp), 0, last)
+        high = np.clip(np.ceil(position).astype(np.intp), 0, last)
+        fraction = position - np.floor(position)
+        result = padded[low] * (1 - fraction) + padded[high] * fraction
+        result[empty] = np.nan
+        results.append(result)
+    return results
+
+
+@dataclass(frozen=True)
+class GroupReport:
+    """Result of :func:`group_by`: one row per group, as columns.
+
+    Columns are the grouping keys, ``count``, then ``{value}_sum`` for every
+    value column followed by its percentiles, e.g. ``amount_p95``.
+    """
+
+    columns: dict[str, NDArray[Any]] = field(default_factory=dict)
+
+    def __len__(self) -> int:
+        return len(self.columns["count"])
+
+    def __getitem__(self, name: str) -> NDArray[Any]:
+        return self.columns[name]
+
+    def rows(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the groups as dictionaries of Python values."""
+        names = list(self.columns)
+        for values in zip(*(self.columns[name].tolist() for name in names), strict=True):
+            yield dict(zip(names, values, strict=True))
+
+
+def group_by(
+    columns: Mapping[str, NDArray[Any]],
+    by: str | Sequence[str] = (),
+    *,
+    values: str | Sequence[str] = (),
+    percentiles: Sequence[float] = (),
+) -> GroupReport:
+    """Group rows by key columns and aggregate value columns, without Python loops.
+
+    Works on column arrays such as those of
+    :meth:`~aioplatega.client.export.ConversionsExport.to_numpy` or
+    :func:`~aioplatega.reporting.columns.transaction_columns`.
+
+    Usage::
+
+        arrays = await client.export_conversions(from_date=start).to_numpy()
+        report = group_by(arrays, ["currency", "day"], values="amount", percentiles=[0.5, 0.95])
+        for row in report.rows():
+            print(row["currency"], row["day"], row["count"], row["amount_sum"], row["amount_p95"])
+
+    Args:
+        columns: Equally long arrays keyed by column name.
+        by: Key columns; ``"day"`` is derived from ``created_at``. With no
+            keys, every row falls into one group.
+        values: Numeric columns to sum; ``NaN`` values are skipped.
+        percentiles: Fractions between 0 and 1 computed for every value
+            column, by linear interpolation over its non-``NaN`` values.
+
+    Returns:
+        One row per distinct key combination, sorted by key.
+    """
+    by = [by] if isinstance(by, str) else list(by)
+    values = [values] if isinstance(values, str) else list(values)
+    if any(not 0 <= percentile <= 1 for percentile in percentiles):
+        msg = "percentiles must be between 0 and 1"
+        raise ValueError(msg)
+    keys = [_key_column(columns, name) for name in by]
+    rows = len(keys[0]) if keys else len(next(iter(columns.values()), ()))
+
+    group_keys, groups = _groups(keys, rows)
+    count = len(group_keys[0]) if group_keys else 1
+    result: dict[str, NDArray[Any]] = dict(zip(by, group_keys, strict=True))
+    result["count"] = np.bincount(groups, minlength=count)
+    for name in values:
+        column = np.asarray(_key_column(columns, name), np.float64)
+        weights = np.where(np.isnan(column), 0.0, column)
+        result[f"{name}_sum"] = np.bincount(groups, weights, count).astype(np.float64)
+        if not percentiles:
+            continue
+        for percentile, computed in zip(
+            percentiles, _percentiles(column, groups, count, percentiles), strict=True
+        ):
+            result[_percentile_name(name, percentile)] = computed
+    return GroupReport(result)
+
+
+def commission_totals(
+    columns: Mapping[str, NDArray[Any]],
+    by: str | Sequence[str] = ("currency",),
+) -> GroupReport:
+    """Sum ``commission`` and ``commission_usdt`` of transactions per group.
+
+    ``columns`` are typically built with
+    :func:`~aioplatega.reporting.columns.transaction_columns`.
+    """
+    return group_by(columns, by, values=("commission", "commission_usdt"))
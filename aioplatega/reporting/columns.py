@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from collections.abc import Iterable
+from enum import Enum
+from typing import Any
+
+import numpy as np
+from numpy.typing import NDArray
+
+TRANSACTION_COLUMNS: tuple[str, ...] = (
+    "status",
+    "payment_method",
+    "currency",
+    "amount",
+    "amount_usdt",
+    "commission",
+    "commission_usdt",
+)
+"""Names of the columns built by :func:`transaction_columns`, in order."""
+
+
+def _code(value: Any) -> str:
+    if value is None:
+        return ""
+    return str(value.value if isinstance(value, Enum) else value)
+
+
+def _text(values: list[Any]) -> NDArray[np.str_]:
+    return np.array([_code(value) for value in values], str)
+
+
+def transaction_columns(responses: Iterable[Any]) -> dict[str, NDArray[Any]]:
+    """Turn transaction status responses into column arrays.
+
+    Accepts validated, compact or trusted
+    :class:`~aioplatega.types.TransactionStatusResponse` objects. Codes
+    become fixed-width strings with ``""`` where missing and numbers
+    ``float64`` with ``NaN``; ``currency`` and ``amount`` come from
+    ``payment_details``.
+    """
+    status: list[Any] = []
+    payment_method: list[Any] = []
+    currency: list[Any] = []
+    amount: list[Any] = []
+    amount_usdt: list[Any] = []
+    commission: list[Any] = []
+    commission_usdt: list[Any] = []
+    for response in responses:
+        details = response.payment_details
+        status.append(response.status)
+        payment_method.append(response.payment_method)
+        currency.append(None if details is None else details.currency)
+        amount.append(None if details is None else details.amount)
+        amount_usdt.append(response.amount_usdt)
+        commission.append(response.commission)
+        commission_usdt.append(response.commission_usdt)
+    return {
+        "status": _text(status),
+        "payment_method": _text(payment_method),
+        "currency": _text(currency),
+        "amount": np.array(amount, np.float64),
+        "amount_usdt": np.array(amount_usdt, np.float64),
+        "commission": np.array(commission, np.float64),
+        "commission_usdt": np.array(commission_usdt, np.float64),
+    }
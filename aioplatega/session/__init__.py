@@ -1,7 +1,70 @@
-from .aiohttp import AiohttpSession
-from .base import BaseSession
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+# Imported eagerly: the function shadows its submodule name, and the module
+# only depends on the standard library.
+from .deadline import deadline, no_deadline, remaining_time
+
+if TYPE_CHECKING:
+    from .aiohttp import AiohttpSession
+    from .base import BaseSession
+    from .codec import BaseJSONCodec, MsgspecCodec, OrjsonCodec, StdlibJSONCodec
+    from .parsing import current_parse_mode, parse_response, use_parse_mode
+    from .pool import PoolConfig, PoolStats, get_ssl_context
+    from .request_plan import RequestPlan, get_request_plan
+    from .warmup import WarmupReport, build_schemas
+
+_LAZY_IMPORTS = {
+    "AiohttpSession": ".aiohttp",
+    "BaseJSONCodec": ".codec",
+    "BaseSession": ".base",
+    "MsgspecCodec": ".codec",
+    "OrjsonCodec": ".codec",
+    "PoolConfig": ".pool",
+    "PoolStats": ".pool",
+    "RequestPlan": ".request_plan",
+    "StdlibJSONCodec": ".codec",
+    "WarmupReport": ".warmup",
+    "build_schemas": ".warmup",
+    "current_parse_mode": ".parsing",
+    "get_request_plan": ".request_plan",
+    "get_ssl_context": ".pool",
+    "parse_response": ".parsing",
+    "use_parse_mode": ".parsing",
+}
 
 __all__ = [
     "AiohttpSession",
+    "BaseJSONCodec",
     "BaseSession",
+    "MsgspecCodec",
+    "OrjsonCodec",
+    "PoolConfig",
+    "PoolStats",
+    "RequestPlan",
+    "StdlibJSONCodec",
+    "WarmupReport",
+    "build_schemas",
+    "current_parse_mode",
+    "deadline",
+    "get_request_plan",
+    "get_ssl_context",
+    "no_deadline",
+    "parse_response",
+    "remaining_time",
+    "use_parse_mode",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,30 +1,46 @@
 from __future__ import annotations
 
-import ssl
+import asyncio
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Final
 
-import certifi
-from aiohttp import ClientSession, TCPConnector
+from aiohttp import ClientSession, ClientTimeout, TCPConnector
+from pydantic import ValidationError
+from yarl import URL
 
+from aioplatega.enums import ParseMode
 from aioplatega.exceptions import (
     ClientDecodeError,
     PlategaAPIError,
     PlategaBadRequestError,
+    PlategaDeadlineExceededError,
+    PlategaError,
     PlategaForbiddenError,
     PlategaNetworkError,
     PlategaNotFoundError,
+    PlategaRateLimitError,
     PlategaServerError,
+    PlategaTimeoutError,
     PlategaUnauthorizedError,
 )
-from aioplatega.methods.base import PlategaMethod
+from aioplatega.methods.base import PlategaMethod, RequestTimeout
 
 from .base import API_URL, BaseSession
+from .codec import BaseJSONCodec, StdlibJSONCodec
+from .deadline import remaining_time
+from .parsing import current_parse_mode, parse_response
+from .pool import PoolConfig, PoolStats, get_ssl_context
+from .request_plan import get_request_plan
+from .warmup import WarmupReport, build_schemas
 
 _STATUS_MAP: Final[dict[int, type[PlategaAPIError]]] = {
     400: PlategaBadRequestError,
     401: PlategaUnauthorizedError,
     403: PlategaForbiddenError,
     404: PlategaNotFoundError,
+    429: PlategaRateLimitError,
 }
 
 
@@ -32,23 +48,136 @@ _HTTP_CLIENT_ERROR = 400
 _HTTP_SERVER_ERROR = 500
 
 
-def _build_ssl_context() -> ssl.SSLContext:
-    return ssl.create_default_context(cafile=certifi.where())
+def _parse_retry_after(value: str | None) -> float | None:
+    """Parse a ``Retry-After`` header given either in seconds or as an HTTP date."""
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return max(0.0, (moment - datetime.now(timezone.utc)).total_seconds())
 
 
 class AiohttpSession(BaseSession):
     """``aiohttp``-backed session with lazy connection pool creation."""
 
-    def __init__(self, api_url: str = API_URL) -> None:
+    def __init__(
+        self,
+        api_url: str = API_URL,
+        pool: PoolConfig | None = None,
+        timeout: RequestTimeout | None = None,
+        codec: BaseJSONCodec | None = None,
+        *,
+        parse_mode: ParseMode = ParseMode.VALIDATE,
+    ) -> None:
+        """Initialize the session.
+
+        Args:
+            api_url: Base URL of the Platega API.
+            pool: Connection pool settings. Defaults to :class:`PoolConfig` defaults.
+            timeout: Default timeouts for methods that do not define ``__timeout__``.
+            codec: JSON codec for request bodies and error responses.
+                Defaults to :class:`~aioplatega.session.codec.StdlibJSONCodec`.
+            parse_mode: How successful response bodies are turned into objects.
+        """
+        super().__init__(parse_mode=parse_mode)
         self._api_url = api_url
+        self._pool = pool or PoolConfig()
+        self._timeout = timeout or RequestTimeout()
+        self._codec = codec or StdlibJSONCodec()
+        self._headers: dict[tuple[str, str, str], dict[str, str]] = {}
         self._session: ClientSession | None = None
 
     def _get_session(self) -> ClientSession:
         if self._session is None or self._session.closed:
-            connector = TCPConnector(ssl=_build_ssl_context())
+            connector = TCPConnector(
+                ssl=get_ssl_context(),
+                limit=self._pool.limit,
+                limit_per_host=self._pool.limit_per_host,
+                keepalive_timeout=None if self._pool.force_close else self._pool.keepalive_timeout,
+                ttl_dns_cache=self._pool.ttl_dns_cache,
+                force_close=self._pool.force_close,
+            )
             self._session = ClientSession(connector=connector)
         return self._session
 
+    @property
+    def pool_stats(self) -> PoolStats:
+        """Current state of the connection pool (all zeros before the first request)."""
+        if self._session is None or self._session.closed:
+            return PoolStats(limit=self._pool.limit, limit_per_host=self._pool.limit_per_host)
+        connector = self._session.connector
+        # aiohttp exposes no public counters, so read the connector bookkeeping directly.
+        acquired = getattr(connector, "_acquired", ())
+        conns = getattr(connector, "_conns", {})
+        waiters = getattr(connector, "_waiters", {})
+        return PoolStats(
+            active=len(acquired),
+            idle=sum(len(items) for items in conns.values()),
+            waiting=sum(len(items) for items in waiters.values()),
+            limit=self._pool.limit,
+            limit_per_host=self._pool.limit_per_host,
+        )
+
+    async def warmup(self, connections: int = 1) -> WarmupReport:
+        """Build validators, load TLS, resolve DNS and open keep-alive connections.
+
+        Args:
+            connections: Number of connections to open to the API host. They are
+                left idle in the pool for the first requests to reuse.
+
+        Returns:
+            Time spent in each phase. Connections that could not be opened are
+            not retried; compare :attr:`WarmupReport.opened` with ``connections``.
+
+        Raises:
+            PlategaNetworkError: If the API host cannot be resolved.
+        """
+        schemas = build_schemas()
+
+        started = time.monotonic()
+        get_ssl_context()
+        ssl_context = time.monotonic() - started
+
+        url = URL(self._api_url)
+        port = url.port or (443 if url.scheme == "https" else 80)
+        started = time.monotonic()
+        try:
+            await asyncio.get_running_loop().getaddrinfo(url.host, port)
+        except OSError as exc:
+            raise PlategaNetworkError(f"Failed to resolve {url.host}: {exc}") from exc
+        dns = time.monotonic() - started
+
+        session = self._get_session()
+        timeout = ClientTimeout(
+            total=self._timeout.total, connect=self._timeout.connect, sock_read=self._timeout.read
+        )
+
+        async def open_connection() -> None:
+            async with session.head(self._api_url, timeout=timeout) as response:
+                await response.read()
+
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(open_connection() for _ in range(connections)), return_exceptions=True
+        )
+        opened = sum(1 for result in results if result is None)
+        return WarmupReport(
+            schemas=schemas,
+            ssl_context=ssl_context,
+            dns=dns,
+            connections=time.monotonic() - started,
+            opened=opened,
+        )
+
     async def make_request(
         self,
         merchant_id: str,
@@ -57,72 +186,99 @@ class AiohttpSession(BaseSession):
     ) -> Any:
         session = self._get_session()
 
-        url = self._build_url(method)
-        headers = {
-            "X-MerchantId": merchant_id,
-            "X-Secret": secret,
-        }
-
-        data = method.model_dump(by_alias=True, exclude_none=True)
+        plan = get_request_plan(type(method))
+        path, data = plan.build(method)
+        url = f"{self._api_url}{path}"
+        headers = self._get_headers(merchant_id, secret, plan.http_method)
+        timeout = self._client_timeout(method)
 
         try:
-            if method.__http_method__ == "POST":
-                response = await session.post(url, json=data, headers=headers)
+            if plan.http_method == "POST":
+                response = await session.post(
+                    url, data=self._codec.dumps(data), headers=headers, timeout=timeout
+                )
             else:
-                response = await session.get(url, params=data, headers=headers)
+                response = await session.get(url, params=data, headers=headers, timeout=timeout)
+            return await self._handle_response(response, method)
+        except asyncio.TimeoutError as exc:
+            raise PlategaTimeoutError(f"Request to {method.__api_method__} timed out") from exc
+        except PlategaError:
+            raise
         except Exception as exc:
             raise PlategaNetworkError(str(exc)) from exc
 
-        return await self._handle_response(response, method)
+    def _client_timeout(self, method: PlategaMethod[Any]) -> ClientTimeout:
+        timeout = method.__timeout__ or self._timeout
+        total = timeout.total
+        remaining = remaining_time()
+        if remaining is not None:
+            if remaining <= 0:
+                raise PlategaDeadlineExceededError(
+                    f"Deadline exceeded before calling {method.__api_method__}"
+                )
+            total = remaining if total is None else min(total, remaining)
+        return ClientTimeout(total=total, connect=timeout.connect, sock_read=timeout.read)
 
-    def _build_url(self, method: PlategaMethod[Any]) -> str:
-        path = method.__api_method__
-        data = method.model_dump(by_alias=False, exclude_none=True)
-        for key, value in data.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in path:
-                path = path.replace(placeholder, str(value))
-        return f"{self._api_url}{path}"
+    def _get_headers(self, merchant_id: str, secret: str, http_method: str) -> dict[str, str]:
+        key = (merchant_id, secret, http_method)
+        headers = self._headers.get(key)
+        if headers is None:
+            headers = {"X-MerchantId": merchant_id, "X-Secret": secret}
+            if http_method == "POST":
+                headers["Content-Type"] = "application/json"
+            self._headers[key] = headers
+        return headers
 
-    @staticmethod
     async def _handle_response(
+        self,
         response: Any,
         method: PlategaMethod[Any],
     ) -> Any:
         status = response.status
         api_method = method.__api_method__
-
-        try:
-            body = await response.json()
-        except Exception as decode_exc:
-            text = await response.text()
-            if status >= _HTTP_CLIENT_ERROR:
-                raise PlategaAPIError(
-                    message=text,
-                    method=api_method,
-                    status_code=status,
-                    body=text,
-                ) from decode_exc
-            raise ClientDecodeError(
-                f"Failed to decode response from {api_method}: {text}"
-            ) from decode_exc
+        # The body is read once; the same buffer serves error reporting and validation.
+        raw: bytes = await response.read()
 
         if status >= _HTTP_CLIENT_ERROR:
+            try:
+                body = self._codec.loads(raw)
+            except Exception as decode_exc:
+                text = raw.decode(errors="replace")
+                raise self._api_error(response, api_method, text, text) from decode_exc
             message = body.get("message", "") if isinstance(body, dict) else str(body)
-            exc_cls = _STATUS_MAP.get(status)
-            if exc_cls is None:
-                exc_cls = PlategaServerError if status >= _HTTP_SERVER_ERROR else PlategaAPIError
-            raise exc_cls(
+            raise self._api_error(response, api_method, message, body)
+
+        try:
+            mode = current_parse_mode() or self.parse_mode
+            return parse_response(method.__returning__, raw, mode)
+        except ValidationError as exc:
+            if any(error["type"] == "json_invalid" for error in exc.errors()):
+                text = raw.decode(errors="replace")
+                raise ClientDecodeError(
+                    f"Failed to decode response from {api_method}: {text}"
+                ) from exc
+            raise ClientDecodeError(f"Failed to parse response from {api_method}: {exc}") from exc
+
+    @staticmethod
+    def _api_error(response: Any, api_method: str, message: str, body: Any) -> PlategaAPIError:
+        status = response.status
+        exc_cls = _STATUS_MAP.get(status)
+        if exc_cls is None:
+            exc_cls = PlategaServerError if status >= _HTTP_SERVER_ERROR else PlategaAPIError
+        if exc_cls is PlategaRateLimitError:
+            return PlategaRateLimitError(
                 message=message,
                 method=api_method,
                 status_code=status,
                 body=body,
+                retry_after=_parse_retry_after(response.headers.get("Retry-After")),
             )
-
-        try:
-            return method.__returning__.model_validate(body)
-        except Exception as exc:
-            raise ClientDecodeError(f"Failed to parse response from {api_method}: {exc}") from exc
+        return exc_cls(
+            message=message,
+            method=api_method,
+            status_code=status,
+            body=body,
+        )
 
     async def close(self) -> None:
         if self._session is not None and not self._session.closed:
@@ -3,6 +3,11 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Any
 
+from aioplatega.enums import ParseMode
+
+from .middlewares.manager import RequestMiddlewareManager
+from .warmup import WarmupReport, build_schemas
+
 if TYPE_CHECKING:
     from aioplatega.methods.base import PlategaMethod
 
@@ -14,8 +19,40 @@ class BaseSession(ABC):
 
     Implement this class to provide a custom HTTP transport.
     The default implementation is :class:`~aioplatega.session.aiohttp.AiohttpSession`.
+
+    Requests dispatched through :meth:`__call__` pass through the registered
+    :attr:`middleware` chain before reaching :meth:`make_request`.
+
+    Args:
+        parse_mode: Default :class:`~aioplatega.enums.ParseMode` for response bodies.
+            A :func:`~aioplatega.session.parsing.use_parse_mode` block overrides it.
     """
 
+    parse_mode: ParseMode = ParseMode.VALIDATE
+    _middleware: RequestMiddlewareManager | None = None
+
+    def __init__(self, parse_mode: ParseMode = ParseMode.VALIDATE) -> None:
+        self._middleware = RequestMiddlewareManager()
+        self.parse_mode = ParseMode(parse_mode)
+
+    @property
+    def middleware(self) -> RequestMiddlewareManager:
+        """Middlewares wrapping :meth:`make_request`, outermost first."""
+        # Created on first use for subclasses that do not call ``super().__init__()``.
+        if self._middleware is None:
+            self._middleware = RequestMiddlewareManager()
+        return self._middleware
+
+    async def __call__(
+        self,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        """Execute an API method through the middleware chain."""
+        make_request = self.middleware.wrap_middlewares(self.make_request)
+        return await make_request(merchant_id, secret, method)
+
     @abstractmethod
     async def make_request(
         self,
@@ -25,6 +62,17 @@ class BaseSession(ABC):
     ) -> Any:
         """Execute an API method and return the parsed response."""
 
+    async def warmup(self, connections: int = 1) -> WarmupReport:
+        """Prepare for traffic before the first request.
+
+        The base implementation builds every validator and request plan.
+        Transports extend it with connection-level work.
+
+        Args:
+            connections: Number of keep-alive connections to open, if supported.
+        """
+        return WarmupReport(schemas=build_schemas())
+
     @abstractmethod
     async def close(self) -> None:
         """Release underlying resources (connection pool, etc.)."""
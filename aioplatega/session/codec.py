@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+
+class BaseJSONCodec(ABC):
+    """JSON encoder/decoder used by :class:`~aioplatega.session.aiohttp.AiohttpSession`.
+
+    Implement this class to plug in another JSON library.
+    """
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize ``obj`` to UTF-8 encoded JSON."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Deserialize a JSON document."""
+
+
+class StdlibJSONCodec(BaseJSONCodec):
+    """Codec based on the standard library :mod:`json` module."""
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(BaseJSONCodec):
+    """Codec based on `orjson <https://github.com/ijl/orjson>`_.
+
+    Requires the ``orjson`` extra: ``pip install "aioplatega[orjson]"``.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import orjson
+        except ImportError as exc:
+            msg = 'OrjsonCodec requires orjson: pip install "aioplatega[orjson]"'
+            raise ImportError(msg) from exc
+        self._orjson = orjson
+
+    def dumps(self, obj: Any) -> bytes:
+        encoded: bytes = self._orjson.dumps(obj)
+        return encoded
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(BaseJSONCodec):
+    """Codec based on `msgspec <https://jcristharif.com/msgspec/>`_.
+
+    Requires the ``msgspec`` extra: ``pip install "aioplatega[msgspec]"``.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import msgspec
+        except ImportError as exc:
+            msg = 'MsgspecCodec requires msgspec: pip install "aioplatega[msgspec]"'
+            raise ImportError(msg) from exc
+        self._encoder = msgspec.json.Encoder()
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        encoded: bytes = self._encoder.encode(obj)
+        return encoded
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
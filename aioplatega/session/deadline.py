@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+_deadline: ContextVar[float | None] = ContextVar("aioplatega_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Limit every request made inside the block to ``seconds`` from now.
+
+    The budget spans retries and nested calls; an inner deadline can only
+    shorten an outer one.
+
+    Usage::
+
+        with deadline(0.8):
+            status = await client.get_transaction_status(transaction_id)
+    """
+    expires_at = time.monotonic() + seconds
+    current = _deadline.get()
+    if current is not None:
+        expires_at = min(expires_at, current)
+    token = _deadline.set(expires_at)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+@contextmanager
+def no_deadline() -> Iterator[None]:
+    """Lift the current deadline inside the block.
+
+    For work that outlives its caller, such as a shared background refresh
+    that must not inherit the budget of whoever happened to start it.
+    """
+    token = _deadline.set(None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def remaining_time() -> float | None:
+    """Seconds left until the current deadline, or ``None`` when no deadline is set."""
+    expires_at = _deadline.get()
+    if expires_at is None:
+        return None
+    return expires_at - time.monotonic()
@@ -0,0 +1,47 @@
+from .adaptive_concurrency import AdaptiveConcurrencyMiddleware, AdaptiveLimit
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+from .circuit_breaker import CircuitBreakerMiddleware, CircuitState
+from .coalescing import CoalescingMiddleware, CoalescingStats
+from .hedging import HedgingMiddleware, HedgingStats
+from .manager import RequestMiddlewareManager
+from .rate_cache import RateCacheMiddleware, RateCacheStats
+from .rate_limiter import (
+    RateLimit,
+    RateLimiterMiddleware,
+    RateLimiterStats,
+    TokenBucket,
+)
+from .retry import RetryBudget, RetryMiddleware, RetryPolicy, RetryStats
+from .status_cache import DEFAULT_STATUS_TTLS, StatusCacheMiddleware, StatusCacheStats
+from .storage import BaseCacheStorage, CacheEntry, MemoryCacheStorage, credentials_digest
+
+__all__ = [
+    "DEFAULT_STATUS_TTLS",
+    "AdaptiveConcurrencyMiddleware",
+    "AdaptiveLimit",
+    "BaseCacheStorage",
+    "BaseRequestMiddleware",
+    "CacheEntry",
+    "CircuitBreakerMiddleware",
+    "CircuitState",
+    "CoalescingMiddleware",
+    "CoalescingStats",
+    "HedgingMiddleware",
+    "HedgingStats",
+    "MemoryCacheStorage",
+    "NextRequestMiddlewareType",
+    "RateCacheMiddleware",
+    "RateCacheStats",
+    "RateLimit",
+    "RateLimiterMiddleware",
+    "RateLimiterStats",
+    "RequestMiddlewareManager",
+    "RetryBudget",
+    "RetryMiddleware",
+    "RetryPolicy",
+    "RetryStats",
+    "StatusCacheMiddleware",
+    "StatusCacheStats",
+    "TokenBucket",
+    "credentials_digest",
+]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+from aioplatega.exceptions import (
+    PlategaDeadlineExceededError,
+    PlategaRateLimitError,
+    PlategaServerError,
+    PlategaTimeoutError,
+)
+
+from ..deadline import remaining_time
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+
+LimitChangeCallback = Callable[[str, int], None]
+
+
+class AdaptiveLimit:
+    """Semaphore-like gate whose capacity can change while requests are queued.
+
+    Waiters are admitted in FIFO order. A waiter gives up when the active
+    :func:`~aioplatega.session.deadline.deadline` expires.
+    """
+
+    def __init__(self, limit: float) -> None:
+        self.limit = limit
+        self.in_flight = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for a slot.
+
+        Raises:
+            PlategaDeadlineExceededError: The current deadline expired while queued.
+        """
+        if not self._waiters and self.in_flight < int(self.limit):
+            self.in_flight += 1
+            return
+        waiter: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        remaining = remaining_time()
+        try:
+            if remaining is None:
+                await waiter
+            else:
+                await asyncio.wait_for(waiter, max(remaining, 0))
+        except (asyncio.CancelledError, asyncio.TimeoutError) as exc:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation; pass it on.
+                self.release()
+            elif waiter in self._waiters:
+                self._waiters.remove(waiter)
+            if isinstance(exc, asyncio.TimeoutError):
+                raise PlategaDeadlineExceededError(
+                    "Deadline exceeded while waiting for a concurrency slot"
+                ) from exc
+            raise
+
+    def release(self) -> None:
+        self.in_flight -= 1
+        self.wake()
+
+    def wake(self) -> None:
+        """Admit queued waiters while capacity allows."""
+        while self._waiters and self.in_flight < int(self.limit):
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.in_flight += 1
+                waiter.set_result(None)
+
+
+class AdaptiveConcurrencyMiddleware(BaseRequestMiddleware):
+    """Adjusts the number of in-flight requests per endpoint using AIMD.
+
+    Each ``__api_method__`` gets its own limit. A successful call faster than
+    ``latency_target`` grows the limit by ``increase / limit`` (about
+    ``increase`` per round of requests). A timeout, 5xx or 429 response
+    multiplies it by ``decrease_factor``, at most once per round: failures of
+    requests started before the last cut are ignored. A caller's deadline
+    expiring before the request reaches the API is not a congestion signal.
+    """
+
+    def __init__(
+        self,
+        *,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 200,
+        latency_target: float = 0.5,
+        increase: float = 1.0,
+        decrease_factor: float = 0.5,
+        on_limit_change: LimitChangeCallback | None = None,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            initial_limit: Starting in-flight limit of every endpoint.
+            min_limit: Lower bound of the limit.
+            max_limit: Upper bound of the limit.
+            latency_target: Calls slower than this many seconds do not raise the limit.
+            increase: Additive increase per round of successful requests.
+            decrease_factor: Multiplier applied on a congestion signal.
+            on_limit_change: Called with ``(api_method, new_limit)`` whenever the
+                integer limit changes.
+        """
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.increase = increase
+        self.decrease_factor = decrease_factor
+        self.on_limit_change = on_limit_change
+        self._limits: dict[str, AdaptiveLimit] = {}
+        self._last_decrease: dict[str, float] = {}
+
+    def limit(self, api_method: str) -> int:
+        """Current in-flight limit of ``api_method``."""
+        gate = self._limits.get(api_method)
+        return int(gate.limit) if gate is not None else self.initial_limit
+
+    @property
+    def limits(self) -> dict[str, int]:
+        """Current limits of every endpoint that has seen traffic."""
+        return {api_method: int(gate.limit) for api_method, gate in self._limits.items()}
+
+    def _gate(self, api_method: str) -> AdaptiveLimit:
+        gate = self._limits.get(api_method)
+        if gate is None:
+            gate = self._limits[api_method] = AdaptiveLimit(self.initial_limit)
+        return gate
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        api_method = method.__api_method__
+        gate = self._gate(api_method)
+        await gate.acquire()
+        started = time.monotonic()
+        try:
+            result = await make_request(merchant_id, secret, method)
+        except PlategaDeadlineExceededError:
+            # The caller ran out of time before the endpoint saw the request.
+            raise
+        except (PlategaTimeoutError, PlategaServerError, PlategaRateLimitError):
+            if started >= self._last_decrease.get(api_method, 0.0):
+                self._last_decrease[api_method] = time.monotonic()
+                self._set_limit(api_method, gate, gate.limit * self.decrease_factor)
+            raise
+        finally:
+            gate.release()
+        if time.monotonic() - started <= self.latency_target:
+            self._set_limit(api_method, gate, gate.limit + self.increase / gate.limit)
+        return result
+
+    def _set_limit(self, api_method: str, gate: AdaptiveLimit, limit: float) -> None:
+        previous = int(gate.limit)
+        gate.limit = min(float(self.max_limit), max(float(self.min_limit), limit))
+        gate.wake()
+        if self.on_limit_change is not None and int(gate.limit) != previous:
+            self.on_limit_change(api_method, int(gate.limit))
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+
+NextRequestMiddlewareType = Callable[[str, str, "PlategaMethod[Any]"], Awaitable[Any]]
+
+
+class BaseRequestMiddleware(ABC):
+    """Base class for request middlewares.
+
+    A middleware wraps :meth:`~aioplatega.session.base.BaseSession.make_request`
+    and decides if, when and how often the next handler in the chain is called.
+    """
+
+    @abstractmethod
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        """Handle a request, delegating to ``make_request`` for the actual call."""
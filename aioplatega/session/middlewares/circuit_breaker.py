@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+from typing import TYPE_CHECKING, Any
+
+from aioplatega.exceptions import (
+    PlategaCircuitOpenError,
+    PlategaDeadlineExceededError,
+    PlategaNetworkError,
+    PlategaServerError,
+)
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+
+StateChangeCallback = Callable[[str, "CircuitState", "CircuitState"], None]
+
+
+class CircuitState(str, Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class _Circuit:
+    def __init__(self, window_size: int) -> None:
+        self.state = CircuitState.CLOSED
+        self.outcomes: deque[bool] = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+
+
+class CircuitBreakerMiddleware(BaseRequestMiddleware):
+    """Fails fast while an endpoint is unhealthy.
+
+    One circuit is kept per ``__api_method__``. A circuit opens when, over the
+    last ``window_size`` calls (and at least ``minimum_calls``), the share of
+    failed or slow calls reaches ``failure_rate_threshold``. While open, calls
+    raise :class:`~aioplatega.exceptions.PlategaCircuitOpenError` without
+    touching the network. After ``open_timeout`` seconds the circuit becomes
+    half-open and lets ``half_open_max_calls`` probes through: if they all
+    succeed it closes, any failure opens it again.
+    """
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_threshold: float | None = None,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        failure_exceptions: tuple[type[BaseException], ...] = (
+            PlategaServerError,
+            PlategaNetworkError,
+        ),
+        on_state_change: StateChangeCallback | None = None,
+    ) -> None:
+        """Initialize the breaker.
+
+        Args:
+            failure_rate_threshold: Share of failed calls (0..1) that opens the circuit.
+            slow_call_threshold: Calls taking longer than this many seconds count
+                as failures. ``None`` disables latency tracking.
+            window_size: Number of most recent calls considered.
+            minimum_calls: Calls required in the window before the rate is evaluated.
+            open_timeout: Seconds the circuit stays open before probing.
+            half_open_max_calls: Concurrent probes allowed while half-open.
+            failure_exceptions: Exception types counted as failures.
+                :class:`~aioplatega.exceptions.PlategaDeadlineExceededError`
+                never is, since the request did not reach the API.
+            on_state_change: Called with ``(api_method, old_state, new_state)``.
+        """
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold = slow_call_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_timeout = open_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.failure_exceptions = failure_exceptions
+        self.on_state_change = on_state_change
+        self._circuits: dict[str, _Circuit] = {}
+
+    def state(self, api_method: str) -> CircuitState:
+        """Current state of the circuit for ``api_method``."""
+        circuit = self._circuits.get(api_method)
+        if circuit is None:
+            return CircuitState.CLOSED
+        self._refresh(api_method, circuit)
+        return circuit.state
+
+    @property
+    def states(self) -> dict[str, CircuitState]:
+        """States of every circuit that has seen traffic."""
+        return {api_method: self.state(api_method) for api_method in self._circuits}
+
+    def reset(self, api_method: str | None = None) -> None:
+        """Close one circuit, or all of them, and forget their history."""
+        names = [api_method] if api_method is not None else list(self._circuits)
+        for name in names:
+            circuit = self._circuits.pop(name, None)
+            if circuit is not None and circuit.state is not CircuitState.CLOSED:
+                self._notify(name, circuit.state, CircuitState.CLOSED)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        api_method = method.__api_method__
+        circuit = self._circuits.get(api_method)
+        if circuit is None:
+            circuit = self._circuits[api_method] = _Circuit(self.window_size)
+        self._refresh(api_method, circuit)
+
+        probe = circuit.state is CircuitState.HALF_OPEN
+        if circuit.state is CircuitState.OPEN or (
+            probe and circuit.probes >= self.half_open_max_calls
+        ):
+            retry_after = max(0.0, circuit.opened_at + self.open_timeout - time.monotonic())
+            raise PlategaCircuitOpenError(api_method, retry_after)
+
+        if probe:
+            circuit.probes += 1
+        started = time.monotonic()
+        try:
+            result = await make_request(merchant_id, secret, method)
+        except PlategaDeadlineExceededError:
+            # The caller ran out of time before the endpoint saw the request.
+            if probe:
+                circuit.probes -= 1
+            raise
+        except self.failure_exceptions:
+            self._record(api_method, circuit, success=False, probe=probe)
+            raise
+        except BaseException:
+            # Cancellation and non-transient errors say nothing about endpoint health.
+            if probe:
+                circuit.probes -= 1
+            raise
+        elapsed = time.monotonic() - started
+        success = self.slow_call_threshold is None or elapsed <= self.slow_call_threshold
+        self._record(api_method, circuit, success=success, probe=probe)
+        return result
+
+    def _refresh(self, api_method: str, circuit: _Circuit) -> None:
+        if (
+            circuit.state is CircuitState.OPEN
+            and time.monotonic() - circuit.opened_at >= self.open_timeout
+        ):
+            circuit.probes = 0
+            circuit.probe_successes = 0
+            self._transition(api_method, circuit, CircuitState.HALF_OPEN)
+
+    def _record(self, api_method: str, circuit: _Circuit, *, success: bool, probe: bool) -> None:
+        if probe:
+            circuit.probes -= 1
+            if circuit.state is not CircuitState.HALF_OPEN:
+                return
+            if not success:
+                self._open(api_method, circuit)
+                return
+            circuit.probe_successes += 1
+            if circuit.probe_successes >= self.half_open_max_calls:
+                circuit.outcomes.clear()
+                self._transition(api_method, circuit, CircuitState.CLOSED)
+            return
+
+        if circuit.state is not CircuitState.CLOSED:
+            return
+        circuit.outcomes.append(success)
+        calls = len(circuit.outcomes)
+        if calls < self.minimum_calls:
+            return
+        failures = calls - sum(circuit.outcomes)
+        if failures / calls >= self.failure_rate_threshold:
+            self._open(api_method, circuit)
+
+    def _open(self, api_method: str, circuit: _Circuit) -> None:
+        circuit.opened_at = time.monotonic()
+        circuit.outcomes.clear()
+        self._transition(api_method, circuit, CircuitState.OPEN)
+
+    def _transition(self, api_method: str, circuit: _Circuit, state: CircuitState) -> None:
+        previous = circuit.state
+        circuit.state = state
+        self._notify(api_method, previous, state)
+
+    def _notify(self, api_method: str, previous: CircuitState, state: CircuitState) -> None:
+        if self.on_state_change is not None:
+            self.on_state_change(api_method, previous, state)
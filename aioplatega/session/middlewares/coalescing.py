@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from aioplatega.exceptions import PlategaDeadlineExceededError
+
+from ..deadline import no_deadline, remaining_time
+from ..parsing import current_parse_mode
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from aioplatega.enums import ParseMode
+    from aioplatega.methods.base import PlategaMethod
+
+_Key = tuple[str, str, type, str, "ParseMode | None"]
+
+
+@dataclass(frozen=True)
+class CoalescingStats:
+    """Counters of a :class:`CoalescingMiddleware`.
+
+    Attributes:
+        hits: Calls served by joining a request already in flight.
+        misses: Calls that started a new request.
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class CoalescingMiddleware(BaseRequestMiddleware):
+    """Shares one in-flight request between identical concurrent calls.
+
+    Calls are identical when they use the same credentials, the same method
+    class, the same field values and the same parse mode. Only HTTP methods listed in
+    ``http_methods`` (``GET`` by default) are coalesced. Every waiter receives
+    the same parsed model or the same exception.
+
+    The shared request is shielded: cancelling one waiter, or all of them,
+    does not cancel it. It runs in the context of the call that started it
+    (keeping e.g. its parse mode) but without its
+    :func:`~aioplatega.session.deadline.deadline`, so a caller with a short
+    budget cannot fail the others; every waiter stops at its own deadline.
+    """
+
+    def __init__(self, http_methods: frozenset[str] = frozenset({"GET"})) -> None:
+        self.http_methods = http_methods
+        self._in_flight: dict[_Key, asyncio.Future[Any]] = {}
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def stats(self) -> CoalescingStats:
+        return CoalescingStats(hits=self._hits, misses=self._misses)
+
+    @property
+    def in_flight(self) -> int:
+        """Number of distinct requests currently shared."""
+        return len(self._in_flight)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        if method.__http_method__ not in self.http_methods:
+            return await make_request(merchant_id, secret, method)
+
+        key = (
+            merchant_id,
+            secret,
+            type(method),
+            method.model_dump_json(exclude_none=True),
+            current_parse_mode(),
+        )
+        future = self._in_flight.get(key)
+        if future is None:
+            self._misses += 1
+            future = asyncio.ensure_future(self._shared(make_request, merchant_id, secret, method))
+            self._in_flight[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+        else:
+            self._hits += 1
+
+        remaining = remaining_time()
+        if remaining is None:
+            return await asyncio.shield(future)
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), max(remaining, 0))
+        except asyncio.TimeoutError as exc:
+            raise PlategaDeadlineExceededError(
+                f"Deadline exceeded while waiting for {method.__api_method__}"
+            ) from exc
+
+    @staticmethod
+    async def _shared(
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        with no_deadline():
+            return await make_request(merchant_id, secret, method)
+
+    def _forget(self, key: _Key, future: asyncio.Future[Any]) -> None:
+        if self._in_flight.get(key) is future:
+            del self._in_flight[key]
+        if not future.cancelled():
+            # Mark the exception as retrieved in case every waiter went away.
+            future.exception()
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+from .retry import RetryBudget
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """Counters of a :class:`HedgingMiddleware`.
+
+    Attributes:
+        requests: Calls eligible for hedging.
+        hedges: Second attempts sent.
+        hedge_wins: Hedges that answered before the first attempt.
+        skipped: Hedges not sent because the budget was empty.
+    """
+
+    requests: int = 0
+    hedges: int = 0
+    hedge_wins: int = 0
+    skipped: int = 0
+
+
+class HedgingMiddleware(BaseRequestMiddleware):
+    """Sends a second attempt when the first one is slow, keeping whichever wins.
+
+    If the first attempt has not completed after the hedge delay, a second
+    one is started (on another pooled connection, since the first is busy).
+    The first successful answer is returned and the other attempt is
+    cancelled. If one attempt fails, the other is still awaited.
+
+    The hedge delay is ``delay`` when given, otherwise the ``percentile`` of
+    the latencies observed over the last ``window`` calls to the same
+    ``__api_method__`` (``initial_delay`` until ``min_samples`` calls were
+    seen), so slow bulk endpoints do not delay hedges of quick lookups. The
+    percentile is recomputed every ``refresh_every`` calls, not on each one.
+    Hedges draw from a
+    :class:`~aioplatega.session.middlewares.retry.RetryBudget`, so by default
+    at most about 5% extra requests are sent.
+
+    Only idempotent methods should be hedged; ``http_methods`` defaults to ``GET``.
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: float | None = None,
+        percentile: float = 0.95,
+        initial_delay: float = 0.5,
+        min_samples: int = 20,
+        window: int = 1000,
+        refresh_every: int = 50,
+        budget: RetryBudget | None = None,
+        http_methods: frozenset[str] = frozenset({"GET"}),
+    ) -> None:
+        self.delay = delay
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_samples = min_samples
+        self.budget = budget or RetryBudget(ratio=0.05, burst=5)
+        self.http_methods = http_methods
+        self.window = window
+        self.refresh_every = refresh_every
+        self._latencies: dict[str, deque[float]] = {}
+        self._delays: dict[str, float] = {}
+        self._since_refresh: dict[str, int] = {}
+        self._requests = 0
+        self._hedges = 0
+        self._hedge_wins = 0
+        self._skipped = 0
+
+    @property
+    def stats(self) -> HedgingStats:
+        return HedgingStats(
+            requests=self._requests,
+            hedges=self._hedges,
+            hedge_wins=self._hedge_wins,
+            skipped=self._skipped,
+        )
+
+    def hedge_delay(self, api_method: str) -> float:
+        """Seconds to wait for the first attempt to ``api_method`` before hedging."""
+        if self.delay is not None:
+            return self.delay
+        return self._delays.get(api_method, self.initial_delay)
+
+    def _record(self, api_method: str, latency: float) -> None:
+        latencies = self._latencies.get(api_method)
+        if latencies is None:
+            latencies = self._latencies[api_method] = deque(maxlen=self.window)
+        latencies.append(latency)
+        if len(latencies) < self.min_samples:
+            return
+        since_refresh = self._since_refresh.get(api_method, 0) + 1
+        if api_method in self._delays and since_refresh < self.refresh_every:
+            self._since_refresh[api_method] = since_refresh
+            return
+        self._since_refresh[api_method] = 0
+        ordered = sorted(latencies)
+        index = min(len(ordered) - 1, math.ceil(self.percentile * len(ordered)) - 1)
+        self._delays[api_method] = ordered[max(index, 0)]
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        if method.__http_method__ not in self.http_methods:
+            return await make_request(merchant_id, secret, method)
+
+        api_method = method.__api_method__
+        self._requests += 1
+        self.budget.deposit()
+        started = time.monotonic()
+        primary = asyncio.ensure_future(make_request(merchant_id, secret, method))
+        attempts = [primary]
+        pending: set[asyncio.Future[Any]] = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=self.hedge_delay(api_method))
+            if not done:
+                if self.budget.withdraw():
+                    self._hedges += 1
+                    hedge = asyncio.ensure_future(make_request(merchant_id, secret, method))
+                    attempts.append(hedge)
+                    pending.add(hedge)
+                else:
+                    self._skipped += 1
+
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    # An attempt cancelled from below counts as failed.
+                    if not attempt.cancelled() and attempt.exception() is None:
+                        if attempt is not primary:
+                            self._hedge_wins += 1
+                        self._record(api_method, time.monotonic() - started)
+                        return attempt.result()
+            # Every attempt failed: raise the error of the first one that
+            # was not cancelled, or CancelledError if none was.
+            failed = [attempt for attempt in attempts if not attempt.cancelled()]
+            return (failed[0] if failed else primary).result()
+        finally:
+            for attempt in pending:
+                attempt.cancel()
@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from functools import partial
+from typing import overload
+
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+
+class RequestMiddlewareManager(Sequence[BaseRequestMiddleware]):
+    """Ordered collection of request middlewares.
+
+    Middlewares registered first run outermost: with ``[retry, breaker]``
+    every retry attempt passes through the circuit breaker.
+    """
+
+    def __init__(self) -> None:
+        self._middlewares: list[BaseRequestMiddleware] = []
+
+    def register(self, middleware: BaseRequestMiddleware) -> BaseRequestMiddleware:
+        """Append a middleware to the chain and return it."""
+        self._middlewares.append(middleware)
+        return middleware
+
+    def unregister(self, middleware: BaseRequestMiddleware) -> None:
+        """Remove a previously registered middleware."""
+        self._middlewares.remove(middleware)
+
+    def __call__(self, middleware: BaseRequestMiddleware) -> BaseRequestMiddleware:
+        return self.register(middleware)
+
+    @overload
+    def __getitem__(self, item: int) -> BaseRequestMiddleware: ...
+
+    @overload
+    def __getitem__(self, item: slice) -> Sequence[BaseRequestMiddleware]: ...
+
+    def __getitem__(
+        self, item: int | slice
+    ) -> BaseRequestMiddleware | Sequence[BaseRequestMiddleware]:
+        return self._middlewares[item]
+
+    def __len__(self) -> int:
+        return len(self._middlewares)
+
+    def __iter__(self) -> Iterator[BaseRequestMiddleware]:
+        return iter(self._middlewares)
+
+    def wrap_middlewares(self, callback: NextRequestMiddlewareType) -> NextRequestMiddlewareType:
+        """Build the call chain ending in ``callback``."""
+        for middleware in reversed(self._middlewares):
+            callback = partial(middleware, callback)
+        return callback
@@ -0,0 +1,219 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from aioplatega.enums import ParseMode
+from aioplatega.exceptions import PlategaDeadlineExceededError
+
+from ..deadline import no_deadline, remaining_time
+from ..parsing import current_parse_mode
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+from .storage import BaseCacheStorage, CacheEntry, MemoryCacheStorage, credentials_digest
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+    from aioplatega.methods.get_rate import GetRate
+
+
+@dataclass(frozen=True)
+class RateCacheStats:
+    """Counters of a :class:`RateCacheMiddleware`.
+
+    Attributes:
+        fresh_hits: Calls served a fresh rate from the cache.
+        stale_hits: Calls served a stale rate while it was being refreshed.
+        misses: Calls that waited for the API, because no usable rate was cached.
+        refreshes: Requests sent to the API.
+        refresh_errors: Requests that failed.
+        last_age: Age in seconds of the most recently served rate.
+        max_age: Largest age in seconds of any served rate.
+    """
+
+    fresh_hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    refreshes: int = 0
+    refresh_errors: int = 0
+    last_age: float = 0.0
+    max_age: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.fresh_hits + self.stale_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class RateCacheMiddleware(BaseRequestMiddleware):
+    """Stale-while-revalidate cache of ``GetRate`` responses.
+
+    Rates are cached per credentials, ``(payment_method, currency_from,
+    currency_to)`` and parse mode. A rate younger than ``fresh_for`` seconds
+    is returned straight away. An older one is still returned straight away
+    for up to ``max_staleness`` more seconds, while a background request
+    refreshes it. Past that, or when nothing is cached, callers wait for the
+    API. ``max_staleness=None`` serves a cached rate indefinitely.
+
+    At most one request per key and credentials is in flight: concurrent
+    callers needing a rate join it, each within its own
+    :func:`~aioplatega.session.deadline.deadline`. The request itself runs
+    without a deadline so that a short caller budget cannot keep a rate from
+    ever being refreshed. A failed background refresh keeps the stale rate;
+    the next call past ``fresh_for`` tries again.
+
+    Other methods pass through untouched.
+    """
+
+    def __init__(
+        self,
+        storage: BaseCacheStorage | None = None,
+        *,
+        fresh_for: float = 30.0,
+        max_staleness: float | None = 300.0,
+        maxsize: int = 1024,
+    ) -> None:
+        self.storage = MemoryCacheStorage(maxsize) if storage is None else storage
+        self.fresh_for = fresh_for
+        self.max_staleness = max_staleness
+        self._refreshing: dict[tuple[str, str], asyncio.Task[Any]] = {}
+        self._fresh_hits = 0
+        self._stale_hits = 0
+        self._misses = 0
+        self._refreshes = 0
+        self._refresh_errors = 0
+        self._last_age = 0.0
+        self._max_age = 0.0
+
+    @property
+    def stats(self) -> RateCacheStats:
+        return RateCacheStats(
+            fresh_hits=self._fresh_hits,
+            stale_hits=self._stale_hits,
+            misses=self._misses,
+            refreshes=self._refreshes,
+            refresh_errors=self._refresh_errors,
+            last_age=self._last_age,
+            max_age=self._max_age,
+        )
+
+    @property
+    def refreshing(self) -> int:
+        """Number of refresh requests currently in flight."""
+        return len(self._refreshing)
+
+    @staticmethod
+    def key(merchant_id: str, method: GetRate, mode: ParseMode | None) -> str:
+        """Storage key of a rate response."""
+        mode_name = "session" if mode is None else ParseMode(mode).value
+        return (
+            f"rate:{merchant_id}:{method.payment_method}:"
+            f"{method.currency_from}:{method.currency_to}:{mode_name}"
+        )
+
+    async def invalidate(self, merchant_id: str, method: GetRate) -> None:
+        """Drop the cached rate requested by ``method``."""
+        for mode in (None, *ParseMode):
+            await self.storage.delete(self.key(merchant_id, method, mode))
+
+    async def clear(self) -> None:
+        """Drop every cached rate."""
+        await self.storage.clear()
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        from aioplatega.methods.get_rate import GetRate
+
+        if not isinstance(method, GetRate):
+            return await make_request(merchant_id, secret, method)
+
+        key = self.key(merchant_id, method, current_parse_mode())
+        owner = credentials_digest(merchant_id, secret)
+
+        def request() -> Awaitable[Any]:
+            return make_request(merchant_id, secret, method)
+
+        entry = await self.storage.get(key)
+        if entry is not None and entry.owner == owner:
+            age = entry.age(time.time())
+            if age < self.fresh_for:
+                self._fresh_hits += 1
+                return self._serve(entry, age)
+            if self.max_staleness is None or age < self.fresh_for + self.max_staleness:
+                self._stale_hits += 1
+                self._refresh(key, owner, request)
+                return self._serve(entry, age)
+
+        self._misses += 1
+        task = self._refresh(key, owner, request)
+        remaining = remaining_time()
+        if remaining is None:
+            entry = await asyncio.shield(task)
+        else:
+            try:
+                entry = await asyncio.wait_for(asyncio.shield(task), max(remaining, 0))
+            except asyncio.TimeoutError as exc:
+                raise PlategaDeadlineExceededError(
+                    f"Deadline exceeded while waiting for {method.__api_method__}"
+                ) from exc
+        return self._serve(entry, 0.0)
+
+    def _serve(self, entry: CacheEntry, age: float) -> Any:
+        self._last_age = age
+        self._max_age = max(self._max_age, age)
+        return entry.value
+
+    def _refresh(
+        self,
+        key: str,
+        owner: str,
+        request: Callable[[], Awaitable[Any]],
+    ) -> asyncio.Task[CacheEntry]:
+        # Callers only join requests made with the same credentials.
+        flight = (key, owner)
+        task = self._refreshing.get(flight)
+        if task is None:
+            self._refreshes += 1
+            task = asyncio.ensure_future(self._fetch(key, owner, request))
+            self._refreshing[flight] = task
+            task.add_done_callback(lambda done: self._forget(flight, done))
+        return task
+
+    async def _fetch(
+        self,
+        key: str,
+        owner: str,
+        request: Callable[[], Awaitable[Any]],
+    ) -> CacheEntry:
+        # The task runs in a copy of the caller's context: keep its parse
+        # mode, drop its deadline.
+        with no_deadline():
+            response = await request()
+        now = time.time()
+        entry = CacheEntry(
+            value=response,
+            stored_at=now,
+            expires_at=(
+                None if self.max_staleness is None else now + self.fresh_for + self.max_staleness
+            ),
+            owner=owner,
+        )
+        await self.storage.set(key, entry)
+        return entry
+
+    def _forget(self, flight: tuple[str, str], task: asyncio.Task[Any]) -> None:
+        if self._refreshing.get(flight) is task:
+            del self._refreshing[flight]
+        if not task.cancelled() and task.exception() is not None:
+            self._refresh_errors += 1
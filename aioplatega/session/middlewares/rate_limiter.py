@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from collections.abc import Callable, Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from aioplatega.exceptions import PlategaDeadlineExceededError, PlategaRateLimitError
+
+from ..deadline import remaining_time
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+
+WaitCallback = Callable[[str, float], None]
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket parameters.
+
+    Attributes:
+        rate: Tokens added per second (sustained requests per second).
+        burst: Bucket capacity, i.e. requests allowed back to back.
+    """
+
+    rate: float
+    burst: int = 1
+
+    def __post_init__(self) -> None:
+        if self.rate <= 0:
+            msg = "rate must be positive"
+            raise ValueError(msg)
+        if self.burst < 1:
+            msg = "burst must be at least 1"
+            raise ValueError(msg)
+
+
+class TokenBucket:
+    """Async token bucket with FIFO waiting.
+
+    Waiters are served strictly in arrival order. A waiter cancelled while
+    queued leaves without consuming a token.
+    """
+
+    def __init__(self, limit: RateLimit) -> None:
+        self.limit = limit
+        self._tokens = float(limit.burst)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            float(self.limit.burst),
+            self._tokens + (now - self._updated) * self.limit.rate,
+        )
+        self._updated = now
+
+    async def acquire(self) -> float:
+        """Wait for and take one token; return the seconds spent queued."""
+        started = time.monotonic()
+        delayed = self._lock.locked()
+        async with self._lock:
+            self._refill()
+            while self._tokens < 1:
+                delayed = True
+                await asyncio.sleep((1 - self._tokens) / self.limit.rate)
+                self._refill()
+            self._tokens -= 1
+        return time.monotonic() - started if delayed else 0.0
+
+    def release(self) -> None:
+        """Return a token taken by :meth:`acquire` that ended up unused."""
+        self._refill()
+        self._tokens = min(float(self.limit.burst), self._tokens + 1)
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Queueing counters of a :class:`RateLimiterMiddleware`.
+
+    Attributes:
+        requests: Requests that passed the limiter.
+        delayed: Requests that had to wait for a token.
+        total_wait: Seconds spent waiting, summed over all requests.
+        max_wait: Longest single wait in seconds.
+    """
+
+    requests: int = 0
+    delayed: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+class RateLimiterMiddleware(BaseRequestMiddleware):
+    """Client-side rate limiting shared by every coroutine using the session.
+
+    A request first takes a token from its endpoint bucket (if one is
+    configured for its ``__api_method__``), then from the global bucket.
+
+    When the API answers with HTTP 429 the endpoint is paused for the
+    ``Retry-After`` period (or ``default_retry_after``), so queued coroutines
+    wait instead of hitting the API again. A limiter without any limits only
+    applies these pauses.
+
+    Waiting is bounded by the active
+    :func:`~aioplatega.session.deadline.deadline`: a request that cannot get
+    its tokens in time raises
+    :class:`~aioplatega.exceptions.PlategaDeadlineExceededError`
+    without consuming any.
+
+    Usage::
+
+        session.middleware(
+            RateLimiterMiddleware(
+                global_limit=RateLimit(rate=50, burst=10),
+                per_method={CreateTransaction.__api_method__: RateLimit(rate=5)},
+            )
+        )
+    """
+
+    def __init__(
+        self,
+        global_limit: RateLimit | None = None,
+        per_method: Mapping[str, RateLimit] | None = None,
+        on_wait: WaitCallback | None = None,
+        default_retry_after: float = 1.0,
+    ) -> None:
+        """Initialize the limiter.
+
+        Args:
+            global_limit: Limit applied to all requests together.
+            per_method: Limits keyed by ``__api_method__``.
+            on_wait: Called with ``(api_method, seconds_waited)`` for every request.
+            default_retry_after: Pause in seconds applied after a 429 response
+                without a ``Retry-After`` header.
+        """
+        self._global = TokenBucket(global_limit) if global_limit is not None else None
+        self._buckets = {
+            api_method: TokenBucket(limit) for api_method, limit in (per_method or {}).items()
+        }
+        self.on_wait = on_wait
+        self.default_retry_after = default_retry_after
+        self._paused_until: dict[str, float] = {}
+        self._requests = 0
+        self._delayed = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        return RateLimiterStats(
+            requests=self._requests,
+            delayed=self._delayed,
+            total_wait=self._total_wait,
+            max_wait=self._max_wait,
+        )
+
+    def pause(self, api_method: str, seconds: float) -> None:
+        """Hold back requests to ``api_method`` for ``seconds``."""
+        until = time.monotonic() + seconds
+        self._paused_until[api_method] = max(self._paused_until.get(api_method, 0.0), until)
+
+    def paused_for(self, api_method: str) -> float:
+        """Seconds left until ``api_method`` is resumed (``0`` when not paused)."""
+        return max(0.0, self._paused_until.get(api_method, 0.0) - time.monotonic())
+
+    async def acquire(self, api_method: str) -> float:
+        """Wait until a request to ``api_method`` may be sent; return the seconds waited.
+
+        Raises:
+            PlategaDeadlineExceededError: The current deadline expired while waiting.
+        """
+        remaining = remaining_time()
+        if remaining is None:
+            return await self._acquire(api_method)
+        try:
+            # Cancelling ``_acquire`` gives back any token it already took.
+            return await asyncio.wait_for(self._acquire(api_method), max(remaining, 0))
+        except asyncio.TimeoutError as exc:
+            raise PlategaDeadlineExceededError(
+                f"Deadline exceeded while waiting for the {api_method} rate limit"
+            ) from exc
+
+    async def _acquire(self, api_method: str) -> float:
+        waited = 0.0
+        while (delay := self.paused_for(api_method)) > 0:
+            await asyncio.sleep(delay)
+            waited += delay
+        bucket = self._buckets.get(api_method)
+        if bucket is not None:
+            waited += await bucket.acquire()
+        if self._global is not None:
+            try:
+                waited += await self._global.acquire()
+            except asyncio.CancelledError:
+                if bucket is not None:
+                    bucket.release()
+                raise
+        self._record(api_method, waited)
+        return waited
+
+    def _record(self, api_method: str, waited: float) -> None:
+        self._requests += 1
+        if waited > 0:
+            self._delayed += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        if self.on_wait is not None:
+            self.on_wait(api_method, waited)
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        api_method = method.__api_method__
+        await self.acquire(api_method)
+        try:
+            return await make_request(merchant_id, secret, method)
+        except PlategaRateLimitError as exc:
+            retry_after = exc.retry_after
+            if retry_after is None:
+                retry_after = self.default_retry_after
+            self.pause(api_method, retry_after)
+            raise
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import random
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from aioplatega.exceptions import (
+    PlategaNetworkError,
+    PlategaRateLimitError,
+    PlategaServerError,
+)
+
+from ..deadline import remaining_time
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """When and how often a failed request is repeated.
+
+    Attributes:
+        max_attempts: Total attempts per call, including the first one.
+        base_delay: Backoff ceiling for the first retry, doubled on every attempt.
+        max_delay: Upper bound of the backoff ceiling.
+        http_methods: HTTP methods that may be retried. ``POST`` is not retried
+            unless it is listed explicitly.
+        retry_on: Exception types that trigger a retry. A
+            :class:`~aioplatega.exceptions.PlategaRateLimitError` is never retried
+            sooner than its ``retry_after``.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.1
+    max_delay: float = 2.0
+    http_methods: frozenset[str] = frozenset({"GET"})
+    retry_on: tuple[type[BaseException], ...] = field(
+        default=(PlategaServerError, PlategaNetworkError, PlategaRateLimitError),
+    )
+
+    def backoff(self, retry: int) -> float:
+        """Delay before retry number ``retry`` (starting at 0), using full jitter."""
+        ceiling = min(self.max_delay, self.base_delay * 2**retry)
+        return random.uniform(0, ceiling)
+
+
+class RetryBudget:
+    """Caps retries to a fraction of the regular traffic of a client.
+
+    Every first attempt deposits ``ratio`` tokens and every retry withdraws one.
+    The balance never exceeds ``burst``, which is also the initial balance, so at
+    most ``burst`` retries can happen back to back.
+    """
+
+    def __init__(self, ratio: float = 0.2, burst: int = 10) -> None:
+        self.ratio = ratio
+        self.burst = burst
+        self._tokens = float(burst)
+
+    @property
+    def tokens(self) -> float:
+        return self._tokens
+
+    def deposit(self) -> None:
+        self._tokens = min(float(self.burst), self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Take one token; return ``False`` when the budget is exhausted."""
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+
+@dataclass(frozen=True)
+class RetryStats:
+    """Retry counters of a :class:`RetryMiddleware`.
+
+    Attributes:
+        requests: Calls that went through the middleware.
+        retries: Extra attempts made on top of the first ones.
+        exhausted: Retries skipped because the budget was empty.
+    """
+
+    requests: int = 0
+    retries: int = 0
+    exhausted: int = 0
+
+
+class RetryMiddleware(BaseRequestMiddleware):
+    """Retries transient failures with exponential backoff and full jitter.
+
+    Usage::
+
+        session = AiohttpSession()
+        session.middleware(RetryMiddleware(RetryPolicy(max_attempts=4)))
+    """
+
+    def __init__(
+        self,
+        policy: RetryPolicy | None = None,
+        budget: RetryBudget | None = None,
+    ) -> None:
+        self.policy = policy or RetryPolicy()
+        self.budget = budget or RetryBudget()
+        self._requests = 0
+        self._retries = 0
+        self._exhausted = 0
+
+    @property
+    def stats(self) -> RetryStats:
+        return RetryStats(
+            requests=self._requests,
+            retries=self._retries,
+            exhausted=self._exhausted,
+        )
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        self._requests += 1
+        self.budget.deposit()
+        if method.__http_method__ not in self.policy.http_methods:
+            return await make_request(merchant_id, secret, method)
+
+        retry = 0
+        while True:
+            try:
+                return await make_request(merchant_id, secret, method)
+            except self.policy.retry_on as exc:
+                if retry + 1 >= self.policy.max_attempts:
+                    raise
+                delay = self.policy.backoff(retry)
+                if isinstance(exc, PlategaRateLimitError) and exc.retry_after is not None:
+                    delay = max(delay, exc.retry_after)
+                remaining = remaining_time()
+                if remaining is not None and delay >= remaining:
+                    raise
+                if not self.budget.withdraw():
+                    self._exhausted += 1
+                    raise
+            retry += 1
+            self._retries += 1
+            await asyncio.sleep(delay)
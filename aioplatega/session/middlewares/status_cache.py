@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Final
+from uuid import UUID
+
+from aioplatega.enums import ParseMode, PaymentStatus
+
+from ..parsing import current_parse_mode
+from .base import BaseRequestMiddleware, NextRequestMiddlewareType
+from .storage import BaseCacheStorage, CacheEntry, MemoryCacheStorage, credentials_digest
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+
+DEFAULT_STATUS_TTLS: Final[Mapping[str, float | None]] = {
+    PaymentStatus.PENDING.value: 5.0,
+    # A confirmed payment can still be charged back.
+    PaymentStatus.CONFIRMED.value: 3600.0,
+    PaymentStatus.CANCELED.value: None,
+    PaymentStatus.CHARGEBACKED.value: None,
+}
+"""Seconds a status response is cached, by status; ``None`` caches until evicted."""
+
+_SESSION_MODE: Final = "session"
+
+
+@dataclass(frozen=True)
+class StatusCacheStats:
+    """Counters of a :class:`StatusCacheMiddleware`.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups sent to the API.
+        invalidations: Calls to :meth:`StatusCacheMiddleware.invalidate`.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class StatusCacheMiddleware(BaseRequestMiddleware):
+    """Caches ``GetTransactionStatus`` responses for a time depending on the status.
+
+    Pending transactions are cached for seconds, settled ones for much
+    longer (see :data:`DEFAULT_STATUS_TTLS`); statuses missing from ``ttls``
+    use ``default_ttl``. Other methods pass through untouched.
+
+    Entries live in a pluggable :class:`~aioplatega.session.middlewares.storage.BaseCacheStorage`,
+    by default an LRU-bounded :class:`~aioplatega.session.middlewares.storage.MemoryCacheStorage`
+    of ``maxsize`` entries. A cached response is only served to callers using
+    the credentials that fetched it, and only in the parse mode it was parsed with.
+
+    Call :meth:`invalidate` when a transaction is known to have changed,
+    e.g. on receiving its callback.
+    """
+
+    def __init__(
+        self,
+        storage: BaseCacheStorage | None = None,
+        *,
+        ttls: Mapping[str, float | None] = DEFAULT_STATUS_TTLS,
+        default_ttl: float | None = 5.0,
+        maxsize: int = 10_000,
+    ) -> None:
+        self.storage = MemoryCacheStorage(maxsize) if storage is None else storage
+        self.ttls = ttls
+        self.default_ttl = default_ttl
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    @property
+    def stats(self) -> StatusCacheStats:
+        return StatusCacheStats(
+            hits=self._hits, misses=self._misses, invalidations=self._invalidations
+        )
+
+    @staticmethod
+    def key(merchant_id: str, transaction_id: UUID | str, mode: ParseMode | None) -> str:
+        """Storage key of a status response."""
+        mode_name = _SESSION_MODE if mode is None else ParseMode(mode).value
+        return f"transaction_status:{merchant_id}:{transaction_id}:{mode_name}"
+
+    def ttl(self, status: str | None) -> float | None:
+        """Seconds a response with ``status`` is cached."""
+        if status is None:
+            return self.default_ttl
+        return self.ttls.get(status, self.default_ttl)
+
+    async def invalidate(self, merchant_id: str, transaction_id: UUID | str) -> None:
+        """Drop the cached status of a transaction."""
+        self._invalidations += 1
+        transaction_id = UUID(str(transaction_id))
+        for mode in (None, *ParseMode):
+            await self.storage.delete(self.key(merchant_id, transaction_id, mode))
+
+    async def clear(self) -> None:
+        """Drop every cached entry."""
+        await self.storage.clear()
+
+    async def __call__(
+        self,
+        make_request: NextRequestMiddlewareType,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        from aioplatega.methods.get_transaction_status import GetTransactionStatus
+
+        if not isinstance(method, GetTransactionStatus):
+            return await make_request(merchant_id, secret, method)
+
+        key = self.key(merchant_id, method.transaction_id, current_parse_mode())
+        owner = credentials_digest(merchant_id, secret)
+        entry = await self.storage.get(key)
+        if entry is not None and entry.owner == owner and not entry.expired(time.time()):
+            self._hits += 1
+            return entry.value
+
+        self._misses += 1
+        response = await make_request(merchant_id, secret, method)
+        ttl = self.ttl(response.status)
+        if ttl is None or ttl > 0:
+            now = time.time()
+            await self.storage.set(
+                key,
+                CacheEntry(
+                    value=response,
+                    stored_at=now,
+                    expires_at=None if ttl is None else now + ttl,
+                    owner=owner,
+                ),
+            )
+        return response
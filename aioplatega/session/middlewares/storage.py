@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import hashlib
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any
+
+
+def credentials_digest(merchant_id: str, secret: str) -> str:
+    """Digest identifying a pair of credentials, used as :attr:`CacheEntry.owner`."""
+    return hashlib.sha256(f"{merchant_id}:{secret}".encode()).hexdigest()
+
+
+@dataclass(frozen=True)
+class CacheEntry:
+    """A cached response.
+
+    Times are wall-clock timestamps (:func:`time.time`) so that entries stay
+    meaningful in stores shared between processes.
+
+    Attributes:
+        value: The parsed response.
+        stored_at: When the response was received.
+        expires_at: When the entry stops being served, or ``None`` to keep it
+            until it is evicted or invalidated.
+        owner: Digest of the credentials that fetched the response; entries
+            are only served to callers with the same credentials.
+    """
+
+    value: Any
+    stored_at: float
+    expires_at: float | None = None
+    owner: str = ""
+
+    def age(self, now: float) -> float:
+        return max(0.0, now - self.stored_at)
+
+    def expired(self, now: float) -> bool:
+        return self.expires_at is not None and now >= self.expires_at
+
+
+class BaseCacheStorage(ABC):
+    """Storage backend of the caching middlewares.
+
+    Implement it to keep entries on disk or in a store shared between
+    processes; such backends are responsible for serializing
+    :attr:`CacheEntry.value`, e.g. with ``model_dump_json``. Backends may drop
+    entries at any time and may use :attr:`CacheEntry.expires_at` as a native TTL.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> CacheEntry | None:
+        """Return the entry stored under ``key``, if any."""
+
+    @abstractmethod
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        """Store ``entry`` under ``key``, replacing any previous entry."""
+
+    @abstractmethod
+    async def delete(self, key: str) -> None:
+        """Remove the entry stored under ``key``, if any."""
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryCacheStorage(BaseCacheStorage):
+    """In-process storage holding at most ``maxsize`` entries.
+
+    When full, the least recently used entry is evicted.
+    """
+
+    def __init__(self, maxsize: int = 10_000) -> None:
+        if maxsize < 1:
+            msg = "maxsize must be at least 1"
+            raise ValueError(msg)
+        self.maxsize = maxsize
+        self.evictions = 0
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> CacheEntry | None:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    async def set(self, key: str, entry: CacheEntry) -> None:
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import cache
+from typing import TYPE_CHECKING, Any
+
+from pydantic import TypeAdapter, ValidationError
+from pydantic_core import from_json
+
+from aioplatega.enums import ParseMode
+from aioplatega.types.trusted import trusted_type
+
+if TYPE_CHECKING:
+    from aioplatega.types.base import PlategaObject
+
+_parse_mode: ContextVar[ParseMode | None] = ContextVar("aioplatega_parse_mode", default=None)
+
+
+@contextmanager
+def use_parse_mode(mode: ParseMode) -> Iterator[None]:
+    """Parse every response received inside the block with ``mode``.
+
+    Overrides the session's own :attr:`~aioplatega.session.base.BaseSession.parse_mode`.
+
+    Usage::
+
+        with use_parse_mode(ParseMode.COMPACT):
+            page = await client.get_conversions(...)
+    """
+    token = _parse_mode.set(ParseMode(mode))
+    try:
+        yield
+    finally:
+        _parse_mode.reset(token)
+
+
+def current_parse_mode() -> ParseMode | None:
+    """Parse mode set by the innermost :func:`use_parse_mode`, or ``None``."""
+    return _parse_mode.get()
+
+
+@cache
+def _compact_adapter(returning: type[PlategaObject]) -> TypeAdapter[Any] | None:
+    from aioplatega.types.compact import COMPACT_TYPES
+
+    compact = COMPACT_TYPES.get(returning)
+    if compact is None:
+        return None
+    return TypeAdapter(compact)
+
+
+def _load_object(returning: type[PlategaObject], raw: bytes) -> dict[str, Any]:
+    """Decode a JSON object without validating it against ``returning``."""
+    try:
+        data = from_json(raw)
+    except ValueError as exc:
+        error_type = "json_invalid"
+        ctx: dict[str, Any] = {"error": str(exc)}
+    else:
+        if isinstance(data, dict):
+            return data
+        error_type = "model_type"
+        ctx = {"class_name": returning.__name__}
+    raise ValidationError.from_exception_data(
+        returning.__name__, [{"type": error_type, "loc": (), "input": raw, "ctx": ctx}]
+    )
+
+
+def parse_response(returning: type[PlategaObject], raw: bytes, mode: ParseMode) -> Any:
+    """Build the response object for ``returning`` from a JSON body.
+
+    In :attr:`~ParseMode.COMPACT` mode, models without a compact counterpart
+    are fully validated. In :attr:`~ParseMode.TRUSTED` mode only the JSON
+    syntax is checked and a :class:`~aioplatega.types.trusted.TrustedObject`
+    view is returned.
+
+    Raises:
+        pydantic.ValidationError: If the body is not valid JSON or does not match the schema.
+    """
+    if mode is ParseMode.COMPACT:
+        adapter = _compact_adapter(returning)
+        if adapter is not None:
+            return adapter.validate_json(raw)
+    elif mode is ParseMode.TRUSTED:
+        return trusted_type(returning)(_load_object(returning, raw))
+    return returning.model_validate_json(raw)
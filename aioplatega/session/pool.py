@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import ssl
+from dataclasses import dataclass
+from functools import lru_cache
+
+import certifi
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings for :class:`~aioplatega.session.aiohttp.AiohttpSession`.
+
+    Attributes:
+        limit: Total number of simultaneous connections (``0`` means unlimited).
+        limit_per_host: Simultaneous connections to a single host (``0`` means unlimited).
+        keepalive_timeout: Seconds an idle connection is kept open for reuse.
+            Ignored when ``force_close`` is set.
+        ttl_dns_cache: Seconds resolved addresses are cached (``None`` caches forever).
+        force_close: Close every connection after its response instead of reusing it.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 0
+    keepalive_timeout: float = 15.0
+    ttl_dns_cache: int | None = 10
+    force_close: bool = False
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """Snapshot of the connection pool state.
+
+    Attributes:
+        active: Connections currently checked out by in-flight requests.
+        idle: Keep-alive connections available for reuse.
+        waiting: Requests queued because the pool limit is reached.
+        limit: Configured total connection limit.
+        limit_per_host: Configured per-host connection limit.
+    """
+
+    active: int = 0
+    idle: int = 0
+    waiting: int = 0
+    limit: int = 0
+    limit_per_host: int = 0
+
+
+@lru_cache(maxsize=1)
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide SSL context built from the ``certifi`` CA bundle.
+
+    The bundle is loaded once and the same context is shared by every session.
+    """
+    return ssl.create_default_context(cafile=certifi.where())
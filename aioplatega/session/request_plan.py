@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import cache
+from string import Formatter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from aioplatega.methods.base import PlategaMethod
+
+
+@dataclass(frozen=True)
+class RequestPlan:
+    """Precompiled description of how a method class maps to an HTTP request.
+
+    Attributes:
+        api_method: Path template with ``{field_name}`` placeholders.
+        http_method: ``"GET"`` or ``"POST"``.
+        aliases: Field name to wire name mapping for every field.
+        path_params: ``(field_name, alias)`` pairs substituted into the path.
+        payload_fields: Wire names sent as query parameters (``GET``) or in the
+            JSON body (``POST``).
+    """
+
+    api_method: str
+    http_method: str
+    aliases: dict[str, str]
+    path_params: tuple[tuple[str, str], ...]
+    payload_fields: frozenset[str]
+
+    def build(self, method: PlategaMethod[Any]) -> tuple[str, dict[str, Any]]:
+        """Serialize ``method`` once and split it into ``(path, payload)``."""
+        data = method.model_dump(mode="json", by_alias=True, exclude_none=True)
+        if not self.path_params:
+            return self.api_method, data
+        values = {name: data.pop(alias) for name, alias in self.path_params}
+        return self.api_method.format_map(values), data
+
+
+@cache
+def get_request_plan(method_cls: type[PlategaMethod[Any]]) -> RequestPlan:
+    """Return the request plan of ``method_cls``, compiling it on first use."""
+    fields = method_cls.model_fields
+    aliases = {
+        name: field.serialization_alias or field.alias or name for name, field in fields.items()
+    }
+    placeholders = [
+        name for _, name, _, _ in Formatter().parse(method_cls.__api_method__) if name is not None
+    ]
+    unknown = [name for name in placeholders if name not in aliases]
+    if unknown:
+        msg = f"{method_cls.__name__}.__api_method__ references unknown fields: {unknown}"
+        raise ValueError(msg)
+    path_params = tuple((name, aliases[name]) for name in placeholders)
+    return RequestPlan(
+        api_method=method_cls.__api_method__,
+        http_method=method_cls.__http_method__,
+        aliases=aliases,
+        path_params=path_params,
+        payload_fields=frozenset(
+            alias for name, alias in aliases.items() if name not in placeholders
+        ),
+    )
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+
+from aioplatega.methods.base import PlategaMethod
+from aioplatega.types.base import PlategaObject
+
+from .request_plan import get_request_plan
+
+
+@dataclass(frozen=True)
+class WarmupReport:
+    """Time in seconds spent in each warmup phase.
+
+    Attributes:
+        schemas: Building pydantic validators and request plans.
+        ssl_context: Loading the CA bundle into the shared SSL context.
+        dns: Resolving the API host.
+        connections: Opening keep-alive connections to the API host.
+        opened: Number of connections successfully opened.
+    """
+
+    schemas: float = 0.0
+    ssl_context: float = 0.0
+    dns: float = 0.0
+    connections: float = 0.0
+    opened: int = 0
+
+    @property
+    def total(self) -> float:
+        return self.schemas + self.ssl_context + self.dns + self.connections
+
+
+def _subclasses(cls: type[PlategaObject]) -> list[type[PlategaObject]]:
+    found: list[type[PlategaObject]] = []
+    pending = [cls]
+    while pending:
+        for subclass in pending.pop().__subclasses__():
+            found.append(subclass)
+            pending.append(subclass)
+    return found
+
+
+def build_schemas() -> float:
+    """Build the deferred validators of every loaded model and method.
+
+    :class:`~aioplatega.types.base.PlategaObject` sets ``defer_build=True``,
+    so without this the first validation of each model pays for it.
+    Returns the time spent in seconds.
+    """
+    # The packages import their modules lazily; resolve every public name
+    # so that all method and type classes are registered.
+    import aioplatega.methods
+    import aioplatega.types
+
+    for package in (aioplatega.methods, aioplatega.types):
+        for name in package.__all__:
+            getattr(package, name)
+
+    started = time.monotonic()
+    for model in _subclasses(PlategaObject):
+        if not model.__pydantic_complete__:
+            model.model_rebuild(force=True)
+        if issubclass(model, PlategaMethod) and hasattr(model, "__api_method__"):
+            get_request_plan(model)
+    return time.monotonic() - started
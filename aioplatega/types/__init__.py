@@ -1,15 +1,51 @@
-from .base import PlategaObject
-from .callback_payload import CallbackPayload
-from .conversion_item import ConversionItem
-from .conversions_response import ConversionsResponse
-from .create_transaction_request import CreateTransactionRequest
-from .create_transaction_response import CreateTransactionResponse
-from .payment_details import PaymentDetails
-from .rate_response import RateResponse
-from .transaction_status_response import TransactionStatusResponse
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import PlategaObject
+    from .callback_payload import CallbackPayload
+    from .compact import (
+        CompactConversionItem,
+        CompactConversionsResponse,
+        CompactPaymentDetails,
+        CompactRateResponse,
+        CompactTransactionStatusResponse,
+    )
+    from .conversion_item import ConversionItem
+    from .conversions_response import ConversionsResponse
+    from .create_transaction_request import CreateTransactionRequest
+    from .create_transaction_response import CreateTransactionResponse
+    from .payment_details import PaymentDetails
+    from .rate_response import RateResponse
+    from .transaction_status_response import TransactionStatusResponse
+    from .trusted import TrustedList, TrustedObject
+
+_LAZY_IMPORTS = {
+    "CallbackPayload": ".callback_payload",
+    "CompactConversionItem": ".compact",
+    "CompactConversionsResponse": ".compact",
+    "CompactPaymentDetails": ".compact",
+    "CompactRateResponse": ".compact",
+    "CompactTransactionStatusResponse": ".compact",
+    "ConversionItem": ".conversion_item",
+    "ConversionsResponse": ".conversions_response",
+    "CreateTransactionRequest": ".create_transaction_request",
+    "CreateTransactionResponse": ".create_transaction_response",
+    "PaymentDetails": ".payment_details",
+    "PlategaObject": ".base",
+    "RateResponse": ".rate_response",
+    "TransactionStatusResponse": ".transaction_status_response",
+    "TrustedList": ".trusted",
+    "TrustedObject": ".trusted",
+}
 
 __all__ = [
     "CallbackPayload",
+    "CompactConversionItem",
+    "CompactConversionsResponse",
+    "CompactPaymentDetails",
+    "CompactRateResponse",
+    "CompactTransactionStatusResponse",
     "ConversionItem",
     "ConversionsResponse",
     "CreateTransactionRequest",
@@ -18,4 +54,20 @@ __all__ = [
     "PlategaObject",
     "RateResponse",
     "TransactionStatusResponse",
+    "TrustedList",
+    "TrustedObject",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,90 @@
+"""Compact counterparts of the high-volume response models.
+
+Each class is a frozen, slotted pydantic dataclass with the same field names and
+aliases as its :class:`~aioplatega.types.base.PlategaObject` twin, so reading code
+works unchanged. Instances have no ``__dict__`` and no extra-field storage:
+fields the schema does not know are dropped.
+
+They are produced by sessions running in :attr:`~aioplatega.enums.ParseMode.COMPACT`.
+"""
+
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from pydantic import ConfigDict, Field
+from pydantic.dataclasses import dataclass
+
+from ..enums import PaymentStatus
+from .base import PlategaObject
+from .conversion_item import ConversionItem
+from .conversions_response import ConversionsResponse
+from .payment_details import PaymentDetails
+from .rate_response import RateResponse
+from .transaction_status_response import TransactionStatusResponse
+
+_CONFIG = ConfigDict(use_enum_values=True, populate_by_name=True)
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class CompactPaymentDetails:
+    amount: float
+    currency: str
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class CompactTransactionStatusResponse:
+    id: Optional[UUID] = None
+    status: Optional[PaymentStatus] = None
+    payment_details: Optional[CompactPaymentDetails] = Field(default=None, alias="paymentDetails")
+    merchant_name: Optional[str] = Field(default=None, alias="merchantName")
+    merchant_id: Optional[UUID] = Field(default=None, alias="merchantId")
+    commission: Optional[float] = Field(default=None, alias="comission")
+    payment_method: Optional[str] = Field(default=None, alias="paymentMethod")
+    expires_in: Optional[str] = Field(default=None, alias="expiresIn")
+    return_url: Optional[str] = Field(default=None, alias="return")
+    commission_usdt: Optional[float] = Field(default=None, alias="comissionUsdt")
+    amount_usdt: Optional[float] = Field(default=None, alias="amountUsdt")
+    qr: Optional[str] = None
+    pay_form_success_url: Optional[str] = Field(default=None, alias="payformSuccessUrl")
+    payload: Optional[str] = None
+    commission_type: Optional[int] = Field(default=None, alias="comissionType")
+    external_id: Optional[str] = Field(default=None, alias="externalId")
+    description: Optional[str] = None
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class CompactRateResponse:
+    payment_method: Optional[int] = Field(default=None, alias="paymentMethod")
+    currency_from: Optional[str] = Field(default=None, alias="currencyFrom")
+    currency_to: Optional[str] = Field(default=None, alias="currencyTo")
+    rate: Optional[float] = None
+    updated_at: Optional[datetime] = Field(default=None, alias="updatedAt")
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class CompactConversionItem:
+    id: Optional[int] = None
+    amount: Optional[float] = None
+    currency: Optional[str] = None
+    status: Optional[str] = None
+    created_at: Optional[datetime] = Field(default=None, alias="createdAt")
+
+
+@dataclass(frozen=True, slots=True, config=_CONFIG)
+class CompactConversionsResponse:
+    content: list[CompactConversionItem] = Field(default_factory=list)
+    total_elements: int = Field(default=0, alias="totalElements")
+    total_pages: int = Field(default=0, alias="totalPages")
+    page: int = 0
+    size: int = 0
+
+
+COMPACT_TYPES: dict[type[PlategaObject], Any] = {
+    ConversionItem: CompactConversionItem,
+    ConversionsResponse: CompactConversionsResponse,
+    PaymentDetails: CompactPaymentDetails,
+    RateResponse: CompactRateResponse,
+    TransactionStatusResponse: CompactTransactionStatusResponse,
+}
+"""Maps a response model to its compact counterpart."""
@@ -0,0 +1,169 @@
+"""Read-only views over response JSON that skip validation.
+
+Produced by sessions running in :attr:`~aioplatega.enums.ParseMode.TRUSTED`.
+Building a pydantic model costs about the same whether or not its fields are
+validated, so instead of models these views keep the decoded JSON and resolve
+attributes on access. Values are returned as decoded, e.g. UUIDs and datetimes
+stay strings; call :meth:`TrustedObject.to_model` for a fully validated model.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from functools import cache
+from typing import Any, ClassVar, Generic, TypeVar, get_args, overload
+
+from pydantic import TypeAdapter
+from pydantic_core import PydanticUndefined
+
+from .base import PlategaObject
+
+ModelT = TypeVar("ModelT", bound=PlategaObject)
+
+
+def _leaf_types(annotation: Any) -> Iterator[Any]:
+    args = get_args(annotation)
+    if not args:
+        yield annotation
+    for arg in args:
+        yield from _leaf_types(arg)
+
+
+def _nested_model(annotation: Any) -> type[PlategaObject] | None:
+    for leaf in _leaf_types(annotation):
+        if isinstance(leaf, type) and issubclass(leaf, PlategaObject):
+            return leaf
+    return None
+
+
+def _scalar_property(key: str, default: Any) -> property:
+    def getter(self: TrustedObject[Any]) -> Any:
+        return self._data.get(key, default)
+
+    return property(getter)
+
+
+def _nested_property(key: str, default: Any, model: type[PlategaObject]) -> property:
+    def getter(self: TrustedObject[Any]) -> Any:
+        value = self._data.get(key, default)
+        if isinstance(value, dict):
+            return trusted_type(model)(value)
+        if isinstance(value, list):
+            return TrustedList(model, value)
+        return value
+
+    return property(getter)
+
+
+@cache
+def trusted_type(model: type[ModelT]) -> type[TrustedObject[ModelT]]:
+    """Return the :class:`TrustedObject` subclass exposing the fields of ``model``."""
+    namespace: dict[str, Any] = {"__slots__": (), "__model__": model}
+    for name, field in model.model_fields.items():
+        key = field.alias or name
+        default = None if field.default is PydanticUndefined else field.default
+        if field.default_factory is not None:
+            default = field.get_default(call_default_factory=True)
+        nested = _nested_model(field.annotation)
+        if nested is None:
+            namespace[name] = _scalar_property(key, default)
+        else:
+            namespace[name] = _nested_property(key, default, nested)
+    return type(f"Trusted{model.__name__}", (TrustedObject,), namespace)
+
+
+def _rebuild(model: type[ModelT], data: dict[str, Any]) -> TrustedObject[ModelT]:
+    # Generated classes cannot be found by name, so pickles refer to the model.
+    return trusted_type(model)(data)
+
+
+class TrustedObject(Generic[ModelT]):
+    """Unvalidated view of a JSON object shaped like a response model.
+
+    Create instances with :func:`trusted_type`. Attributes use the model's field
+    names; fields missing from the JSON fall back to the model defaults (``None``
+    for required fields). Unknown fields are reachable under their JSON key,
+    unless it starts with an underscore. Nested objects and lists of objects
+    are wrapped on access. Views can be copied and pickled.
+    """
+
+    __slots__ = ("_data",)
+    __model__: ClassVar[type[Any]]
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        self._data = data
+
+    def __getattr__(self, name: str) -> Any:
+        # Private and special names are never JSON fields. ``_data`` itself
+        # is looked up here while ``copy`` and ``pickle`` build an instance.
+        if name.startswith("_"):
+            raise AttributeError(name)
+        try:
+            return self._data[name]
+        except KeyError:
+            msg = f"{self.__model__.__name__!r} object has no attribute {name!r}"
+            raise AttributeError(msg) from None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._data!r})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TrustedObject):
+            return NotImplemented
+        return self.__model__ is other.__model__ and self._data == other._data
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        return _rebuild, (self.__model__, self._data)
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """The decoded JSON object, keyed by API aliases."""
+        return self._data
+
+    def to_model(self) -> ModelT:
+        """Validate the underlying JSON into the response model."""
+        return self.__model__.model_validate(self._data)  # type: ignore[no-any-return]
+
+
+class TrustedList(Sequence[TrustedObject[ModelT]]):
+    """Unvalidated view of a JSON array of objects shaped like ``model``.
+
+    Items are wrapped in :class:`TrustedObject` views when accessed.
+    """
+
+    __slots__ = ("_items", "_model")
+
+    def __init__(self, model: type[ModelT], items: list[Any]) -> None:
+        self._model = model
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @overload
+    def __getitem__(self, index: int) -> TrustedObject[ModelT]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> TrustedList[ModelT]: ...
+
+    def __getitem__(self, index: int | slice) -> TrustedObject[ModelT] | TrustedList[ModelT]:
+        if isinstance(index, slice):
+            return TrustedList(self._model, self._items[index])
+        return trusted_type(self._model)(self._items[index])
+
+    def __iter__(self) -> Iterator[TrustedObject[ModelT]]:
+        return map(trusted_type(self._model), self._items)
+
+    def __repr__(self) -> str:
+        return f"TrustedList[{self._model.__name__}]({len(self._items)} items)"
+
+    @property
+    def raw(self) -> list[Any]:
+        """The decoded JSON array."""
+        return self._items
+
+    def to_models(self) -> list[ModelT]:
+        """Validate every item into ``model``."""
+        return TypeAdapter(list[self._model]).validate_python(self._items)  # type: ignore[name-defined]
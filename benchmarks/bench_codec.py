@@ -0,0 +1,101 @@
+"""Compare JSON codecs and response decoding paths.
+
+Run from the repository root with ``python -m benchmarks.bench_codec``. Codecs whose library is not
+installed are skipped.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from aioplatega.session.codec import BaseJSONCodec, MsgspecCodec, OrjsonCodec, StdlibJSONCodec
+from aioplatega.types import ConversionsResponse
+
+NUMBER = 2_000
+
+REQUEST_BODY = {
+    "paymentMethod": 2,
+    "paymentDetails": {"amount": 1500.0, "currency": "RUB"},
+    "description": "Order #42",
+    "return": "https://example.com/success",
+    "failedUrl": "https://example.com/fail",
+    "payload": "user=42;cart=1337",
+}
+
+RESPONSE_BODY = json.dumps(
+    {
+        "content": [
+            {
+                "id": index,
+                "amount": index * 1.25,
+                "currency": "RUB",
+                "status": "CONFIRMED",
+                "createdAt": "2025-01-01T12:00:00Z",
+            }
+            for index in range(100)
+        ],
+        "totalElements": 100,
+        "totalPages": 1,
+        "page": 0,
+        "size": 100,
+    }
+).encode()
+
+
+def load_codec(codec_cls: type[BaseJSONCodec]) -> BaseJSONCodec | None:
+    try:
+        return codec_cls()
+    except ImportError:
+        print(f"skipping {codec_cls.__name__}: library not installed")
+        return None
+
+
+def available_codecs() -> list[BaseJSONCodec]:
+    codecs = [load_codec(codec_cls) for codec_cls in (StdlibJSONCodec, OrjsonCodec, MsgspecCodec)]
+    return [codec for codec in codecs if codec is not None]
+
+
+def report(name: str, func: Callable[[], Any], baseline: float | None = None) -> float:
+    seconds = min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+    suffix = f"  ({baseline / seconds:.2f}x)" if baseline else ""
+    print(f"  {name:<40} {seconds * 1e6:9.2f} us{suffix}")
+    return seconds
+
+
+def main() -> None:
+    codecs = available_codecs()
+
+    print("Encode request body")
+    baseline = None
+    for codec in codecs:
+        result = report(
+            type(codec).__name__, lambda codec=codec: codec.dumps(REQUEST_BODY), baseline
+        )
+        baseline = baseline or result
+
+    print("Decode 100-item conversions page")
+    baseline = None
+    for codec in codecs:
+        result = report(
+            type(codec).__name__, lambda codec=codec: codec.loads(RESPONSE_BODY), baseline
+        )
+        baseline = baseline or result
+
+    ConversionsResponse.model_rebuild(force=True)
+    print("Decode and validate ConversionsResponse")
+    baseline = report(
+        "json.loads + model_validate",
+        lambda: ConversionsResponse.model_validate(json.loads(RESPONSE_BODY)),
+    )
+    report(
+        "model_validate_json (single read)",
+        lambda: ConversionsResponse.model_validate_json(RESPONSE_BODY),
+        baseline,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""Measure per-call dispatch overhead of ``GetTransactionStatus``, excluding network time.
+
+Compares the request plan used by ``AiohttpSession`` with the previous
+approach (two ``model_dump`` calls, a placeholder scan over every field and
+a fresh headers dict per call).
+
+Run from the repository root with ``python -m benchmarks.bench_dispatch``.
+"""
+
+from __future__ import annotations
+
+import timeit
+from typing import Any
+from uuid import UUID
+
+from aioplatega.methods import GetTransactionStatus
+from aioplatega.methods.base import PlategaMethod
+from aioplatega.session import AiohttpSession
+from aioplatega.session.request_plan import get_request_plan
+
+NUMBER = 20_000
+API_URL = "https://app.platega.io"
+METHOD = GetTransactionStatus(transaction_id=UUID("12345678-1234-5678-1234-567812345678"))
+SESSION = AiohttpSession()
+
+
+def legacy_prepare(method: PlategaMethod[Any]) -> tuple[str, dict[str, Any], dict[str, str]]:
+    path = method.__api_method__
+    for key, value in method.model_dump(by_alias=False, exclude_none=True).items():
+        placeholder = f"{{{key}}}"
+        if placeholder in path:
+            path = path.replace(placeholder, str(value))
+    headers = {"X-MerchantId": "merchant", "X-Secret": "secret"}
+    data = method.model_dump(mode="json", by_alias=True, exclude_none=True)
+    return f"{API_URL}{path}", data, headers
+
+
+def planned_prepare(method: PlategaMethod[Any]) -> tuple[str, dict[str, Any], dict[str, str]]:
+    plan = get_request_plan(type(method))
+    path, data = plan.build(method)
+    headers = SESSION._get_headers("merchant", "secret", plan.http_method)
+    return f"{API_URL}{path}", data, headers
+
+
+def main() -> None:
+    assert legacy_prepare(METHOD)[0] == planned_prepare(METHOD)[0]
+    print("GetTransactionStatus dispatch overhead")
+    baseline = min(timeit.repeat(lambda: legacy_prepare(METHOD), number=NUMBER, repeat=5))
+    planned = min(timeit.repeat(lambda: planned_prepare(METHOD), number=NUMBER, repeat=5))
+    print(f"  {'legacy (2x model_dump + scan)':<32} {baseline / NUMBER * 1e6:8.2f} us")
+    print(f"  {'request plan':<32} {planned / NUMBER * 1e6:8.2f} us  ({baseline / planned:.2f}x)")
+
+
+if __name__ == "__main__":
+    main()
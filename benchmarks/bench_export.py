@@ -0,0 +1,116 @@
+"""Compare exporting conversions through models with the columnar export.
+
+The model path validates one ``ConversionItem`` per operation before copying
+fields into arrays; the export reads trusted pages straight into columns.
+
+Run from the repository root with ``python -m benchmarks.bench_export``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import numpy as np
+
+from aioplatega.client import Platega
+from aioplatega.enums import ParseMode
+from aioplatega.session.base import BaseSession
+from aioplatega.session.parsing import current_parse_mode, parse_response
+from aioplatega.session.warmup import build_schemas
+
+PAGE_SIZE = 1_000
+PAGES = 100
+
+PAGE_BODY = json.dumps(
+    {
+        "content": [
+            {
+                "id": index,
+                "amount": index * 1.25,
+                "currency": "RUB" if index % 3 else "USDT",
+                "status": "CONFIRMED",
+                "createdAt": "2025-01-01T12:00:00Z",
+            }
+            for index in range(PAGE_SIZE)
+        ],
+        "totalElements": PAGE_SIZE * PAGES,
+        "totalPages": PAGES,
+        "size": PAGE_SIZE,
+    }
+).encode()
+
+
+class PageSession(BaseSession):
+    """Answers every page with the same pre-encoded body, parsed in the call's mode."""
+
+    async def make_request(self, merchant_id: str, secret: str, method: Any) -> Any:
+        return parse_response(
+            method.__returning__, PAGE_BODY, current_parse_mode() or ParseMode.VALIDATE
+        )
+
+    async def close(self) -> None:
+        pass
+
+
+async def through_models(client: Platega) -> dict[str, Any]:
+    items = [item async for item in client.iter_conversions(size=PAGE_SIZE)]
+    return {
+        "id": np.array([item.id for item in items], np.int64),
+        "amount": np.array([item.amount for item in items], np.float64),
+        "currency": np.array([item.currency for item in items], str),
+        "status": np.array([item.status for item in items], str),
+        "created_at": np.array(
+            [item.created_at.replace(tzinfo=None) for item in items], "datetime64[us]"
+        ),
+    }
+
+
+async def columnar(client: Platega) -> dict[str, Any]:
+    return await client.export_conversions(size=PAGE_SIZE).to_numpy()
+
+
+async def streamed_csv(client: Platega) -> int:
+    with open(os.devnull, "w", newline="") as file:
+        return await client.export_conversions(size=PAGE_SIZE).write_csv(file)
+
+
+def run(export: Callable[[Platega], Awaitable[Any]]) -> tuple[float, int]:
+    """Seconds taken by ``export``, then its peak traced memory in a second pass."""
+    client = Platega("m", "s", session=PageSession())
+    started = time.perf_counter()
+    asyncio.run(export(client))
+    seconds = time.perf_counter() - started
+
+    tracemalloc.start()
+    asyncio.run(export(client))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak
+
+
+def main() -> None:
+    build_schemas()
+    rows = PAGE_SIZE * PAGES
+    print(f"Export {rows:,} conversions in pages of {PAGE_SIZE:,}")
+    baseline = None
+    for name, export in (
+        ("models -> numpy", through_models),
+        ("columnar numpy", columnar),
+        ("streamed csv", streamed_csv),
+    ):
+        seconds, peak = run(export)
+        baseline = baseline or seconds
+        print(
+            f"  {name:<16} {seconds * 1e3:8.0f} ms  {rows / seconds:12,.0f} rows/s"
+            f"  ({baseline / seconds:.2f}x)  peak {peak / 2**20:7.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""Compare memory use and decode speed of the response parse modes.
+
+``trusted`` skips validation and reads fields from the decoded JSON on access.
+
+Run from the repository root with ``python -m benchmarks.bench_parse_modes``.
+"""
+
+from __future__ import annotations
+
+import json
+import timeit
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+from aioplatega.enums import ParseMode
+from aioplatega.session.parsing import parse_response
+from aioplatega.session.warmup import build_schemas
+from aioplatega.types import ConversionsResponse, TransactionStatusResponse
+
+ITEMS = 10_000
+NUMBER = 20
+
+CONVERSIONS_BODY = json.dumps(
+    {
+        "content": [
+            {
+                "id": index,
+                "amount": index * 1.25,
+                "currency": "RUB",
+                "status": "CONFIRMED",
+                "createdAt": "2025-01-01T12:00:00Z",
+            }
+            for index in range(ITEMS)
+        ],
+        "totalElements": ITEMS,
+        "totalPages": 1,
+        "page": 0,
+        "size": ITEMS,
+    }
+).encode()
+
+STATUS_BODY = json.dumps(
+    {
+        "id": "12345678-1234-5678-1234-567812345678",
+        "status": "CONFIRMED",
+        "paymentDetails": {"amount": 1500.0, "currency": "RUB"},
+        "merchantName": "Shop",
+        "merchantId": "87654321-4321-8765-4321-876543218765",
+        "comission": 15.0,
+        "paymentMethod": "SBPQR",
+        "expiresIn": "00:15:00",
+        "return": "https://example.com/success",
+        "description": "Order #42",
+    }
+).encode()
+
+
+def retained_bytes(build: Callable[[], Any]) -> int:
+    """Bytes still allocated after ``build`` returns, i.e. the size of its result."""
+    tracemalloc.start()
+    result = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return size
+
+
+def decode(mode: ParseMode) -> Any:
+    return parse_response(ConversionsResponse, CONVERSIONS_BODY, mode)
+
+
+def measure(func: Callable[[], Any]) -> float:
+    return min(timeit.repeat(func, number=NUMBER, repeat=5)) / NUMBER
+
+
+def rate(seconds: float, baseline: float) -> str:
+    return f"{ITEMS / seconds:12,.0f} items/s  ({baseline / seconds:.2f}x)"
+
+
+def main() -> None:
+    build_schemas()
+    modes = list(ParseMode)
+
+    print(f"Memory per item, {ITEMS} items")
+    for mode in modes:
+        page = retained_bytes(lambda mode=mode: decode(mode))
+        statuses = retained_bytes(
+            lambda mode=mode: [
+                parse_response(TransactionStatusResponse, STATUS_BODY, mode) for _ in range(ITEMS)
+            ]
+        )
+        print(
+            f"  {mode.value:<10} ConversionItem {page / ITEMS:8.0f} B"
+            f"   TransactionStatusResponse {statuses / ITEMS:8.0f} B"
+        )
+
+    print(f"Decode a {ITEMS}-item conversions page")
+    baseline = None
+    for mode in modes:
+        seconds = measure(lambda mode=mode: decode(mode))
+        baseline = baseline or seconds
+        print(f"  {mode.value:<10} {seconds * 1e3:8.2f} ms  {rate(seconds, baseline)}")
+
+    print(f"Decode a {ITEMS}-item conversions page and sum every amount")
+    baseline = None
+    for mode in modes:
+        seconds = measure(lambda mode=mode: sum(item.amount for item in decode(mode).content))
+        baseline = baseline or seconds
+        print(f"  {mode.value:<10} {seconds * 1e3:8.2f} ms  {rate(seconds, baseline)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compare vectorized group-by reports with Python loops over a million rows.
+
+Run from the repository root with ``python -m benchmarks.bench_reporting``.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+from aioplatega.reporting import commission_totals, group_by
+
+ROWS = 1_000_000
+
+
+def synthetic_columns() -> dict[str, Any]:
+    generator = np.random.default_rng(42)
+    start = np.datetime64("2025-01-01T00:00:00", "us")
+    return {
+        "id": np.arange(ROWS, dtype=np.int64),
+        "amount": generator.lognormal(6, 1.5, ROWS),
+        "currency": generator.choice(np.array(["RUB", "USDT", "BTC", "KZT"]), ROWS),
+        "status": generator.choice(np.array(["CONFIRMED", "PENDING", "CANCELED"]), ROWS),
+        "payment_method": generator.choice(np.array(["SBPQR", "CARD", "CRYPTO"]), ROWS),
+        "created_at": start + generator.integers(0, 90 * 86_400, ROWS).astype("timedelta64[s]"),
+        "commission": generator.uniform(0, 50, ROWS),
+        "commission_usdt": generator.uniform(0, 0.5, ROWS),
+    }
+
+
+def python_sums(rows: list[tuple[str, str, float]]) -> dict[tuple[str, str], list[float]]:
+    """The loop being replaced: sum and count per key over row tuples."""
+    totals: dict[tuple[str, str], list[float]] = defaultdict(lambda: [0, 0.0])
+    for currency, day, amount in rows:
+        total = totals[currency, day]
+        total[0] += 1
+        total[1] += amount
+    return totals
+
+
+def timed(func: Callable[[], Any]) -> tuple[float, Any]:
+    started = time.perf_counter()
+    result = func()
+    return time.perf_counter() - started, result
+
+
+def main() -> None:
+    columns = synthetic_columns()
+    rows = list(
+        zip(
+            columns["currency"].tolist(),
+            columns["created_at"].astype("datetime64[D]").astype(str).tolist(),
+            columns["amount"].tolist(),
+            strict=True,
+        )
+    )
+    print(f"{ROWS:,} synthetic rows")
+
+    loop, expected = timed(lambda: python_sums(rows))
+    vectorized, report = timed(lambda: group_by(columns, ["currency", "day"], values="amount"))
+    assert len(report) == len(expected)
+    print(f"  sum + count by currency, day    python {loop * 1e3:7.0f} ms")
+    print(
+        f"  {'':<31} numpy  {vectorized * 1e3:7.0f} ms  ({loop / vectorized:.1f}x),"
+        f" {len(report)} groups"
+    )
+
+    for label, func in (
+        (
+            "p50/p95 amount by currency",
+            lambda: group_by(columns, "currency", values="amount", percentiles=[0.5, 0.95]),
+        ),
+        (
+            "sums by status, payment method",
+            lambda: group_by(columns, ["status", "payment_method"], values="amount"),
+        ),
+        ("commission totals by currency", lambda: commission_totals(columns)),
+    ):
+        seconds, _ = timed(func)
+        print(f"  {label:<31} numpy  {seconds * 1e3:7.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
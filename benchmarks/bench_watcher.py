@@ -0,0 +1,95 @@
+"""Measure TransactionWatcher overhead as the number of watched transactions grows.
+
+Run from the repository root with ``python -m benchmarks.bench_watcher``. Requests are
+answered in memory, so the numbers reflect scheduling cost only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+import tracemalloc
+from typing import Any
+from uuid import UUID
+
+from aioplatega.client import Platega
+from aioplatega.client.watcher import PollSchedule, TransactionWatcher
+from aioplatega.methods.base import PlategaMethod
+from aioplatega.session.base import BaseSession
+from aioplatega.types import TransactionStatusResponse
+
+SIZES = (10_000, 100_000)
+IDLE_SECONDS = 1.0
+
+
+class InstantSession(BaseSession):
+    def __init__(self, status: str) -> None:
+        super().__init__()
+        self.status = status
+
+    async def make_request(
+        self, merchant_id: str, secret: str, method: PlategaMethod[Any]
+    ) -> TransactionStatusResponse:
+        return TransactionStatusResponse(status=self.status)
+
+    async def close(self) -> None:
+        pass
+
+
+def watch_all(client: Platega, size: int, schedule: PollSchedule) -> TransactionWatcher:
+    watcher = TransactionWatcher(client, schedule=schedule)
+    for index in range(size):
+        watcher.watch(UUID(int=index + 1), status="PENDING")
+    return watcher
+
+
+async def idle(size: int) -> None:
+    """Memory per watched transaction and CPU used while none is due."""
+    client = Platega("m", "s", session=InstantSession("PENDING"))
+    schedule = PollSchedule(min_interval=3600.0, max_interval=3600.0)
+
+    tracemalloc.start()
+    watcher = watch_all(client, size, schedule)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del watcher
+    gc.collect()
+
+    async with watch_all(client, size, schedule):
+        started = time.process_time()
+        await asyncio.sleep(IDLE_SECONDS)
+        cpu = time.process_time() - started
+    print(
+        f"  {size:>7} watched  idle CPU {cpu / IDLE_SECONDS * 100:5.2f}%"
+        f"  {memory / size:6.0f} B per transaction"
+    )
+
+
+async def polling(size: int) -> None:
+    """CPU per poll when ``size`` transactions are due at once and all settle."""
+    client = Platega("m", "s", session=InstantSession("CONFIRMED"))
+    schedule = PollSchedule(min_interval=0.0, max_interval=0.0)
+    async with TransactionWatcher(client, schedule=schedule, concurrency=50) as watcher:
+        for index in range(size):
+            watcher.watch(UUID(int=index + 1), status="PENDING")
+        started = time.process_time()
+        await watcher.join()
+        cpu = time.process_time() - started
+    print(
+        f"  {size:>7} watched  {cpu / size * 1e6:6.1f} us CPU per poll"
+        f"  {size / cpu:10,.0f} polls/s"
+    )
+
+
+async def main() -> None:
+    print("Waiting for the next poll")
+    for size in SIZES:
+        await idle(size)
+    print("Polling every transaction once")
+    for size in SIZES:
+        await polling(size)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,15 +1,24 @@
+import asyncio
 from uuid import UUID
 
 import pytest
+from pydantic import ValidationError
 
 from aioplatega.client import Platega
-from aioplatega.enums import PaymentMethodInt, PaymentStatus
+from aioplatega.client import batch as batch_module
+from aioplatega.enums import ParseMode, PaymentMethodInt, PaymentStatus
+from aioplatega.exceptions import PlategaRateLimitError
 from aioplatega.methods import (
     CreateTransaction,
     GetConversions,
     GetRate,
     GetTransactionStatus,
 )
+from aioplatega.session.aiohttp import AiohttpSession
+from aioplatega.session.deadline import remaining_time
+from aioplatega.session.middlewares import RateLimiterMiddleware
+from aioplatega.session.parsing import current_parse_mode
+from aioplatega.session.pool import PoolConfig
 from aioplatega.types import (
     ConversionsResponse,
     CreateTransactionResponse,
@@ -50,6 +59,50 @@ class TestClientDispatch:
         with pytest.raises(ValueError, match="test error"):
             await client(method)
 
+    async def test_call_applies_deadline(self, client, mock_session):
+        seen: list[float | None] = []
+
+        async def make_request(merchant_id, secret, method):
+            seen.append(remaining_time())
+
+        mock_session.make_request = make_request
+
+        await client(GetConversions(), deadline=0.5)
+        await client(GetConversions())
+
+        assert seen[0] is not None
+        assert 0 < seen[0] <= 0.5
+        assert seen[1] is None
+
+    async def test_call_applies_parse_mode(self, mock_session):
+        seen: list[ParseMode | None] = []
+
+        async def make_request(merchant_id, secret, method):
+            seen.append(current_parse_mode())
+
+        mock_session.make_request = make_request
+        compact = Platega("m", "s", session=mock_session, parse_mode=ParseMode.COMPACT)
+        default = Platega("m", "s", session=mock_session)
+
+        await compact(GetConversions())
+        await default(GetConversions())
+
+        assert seen == [ParseMode.COMPACT, None]
+
+    async def test_call_parse_mode_overrides_client(self, mock_session):
+        seen: list[ParseMode | None] = []
+
+        async def make_request(merchant_id, secret, method):
+            seen.append(current_parse_mode())
+
+        mock_session.make_request = make_request
+        client = Platega("m", "s", session=mock_session, parse_mode=ParseMode.COMPACT)
+
+        await client(GetConversions(), parse_mode=ParseMode.TRUSTED)
+        await client(GetConversions())
+
+        assert seen == [ParseMode.TRUSTED, ParseMode.COMPACT]
+
 
 class TestConvenienceMethods:
     async def test_create_transaction(self, client, mock_session):
@@ -149,7 +202,266 @@ class TestClientLifecycle:
         assert client._owns_session is True
         await client.close()
 
+    async def test_pool_config_passed_to_auto_created_session(self):
+        pool = PoolConfig(limit=5)
+        client = Platega(merchant_id="m", secret="s", pool=pool)
+        session = client._get_session()
+        assert isinstance(session, AiohttpSession)
+        assert session._pool is pool
+        await client.close()
+
+    async def test_auto_created_session_pauses_after_429(self, monkeypatch):
+        client = Platega(merchant_id="m", secret="s")
+        session = client._get_session()
+
+        async def rate_limited(merchant_id, secret, method):
+            raise PlategaRateLimitError(message="slow down", retry_after=30)
+
+        monkeypatch.setattr(session, "make_request", rate_limited)
+        with pytest.raises(PlategaRateLimitError):
+            await client(GetConversions())
+
+        (limiter,) = session.middleware
+        assert isinstance(limiter, RateLimiterMiddleware)
+        assert limiter.paused_for(GetConversions.__api_method__) > 29
+        await client.close()
+
+    async def test_warmup_delegates_to_session(self, client, mock_session):
+        report = await client.warmup(connections=3)
+        assert report.schemas >= 0
+        assert report.opened == 0
+
     async def test_owns_session_false_when_injected(self):
         mock = MockSession()
         client = Platega(merchant_id="m", secret="s", session=mock)
         assert client._owns_session is False
+
+
+class DelayedSession(MockSession):
+    """Answers ``GetConversions`` with its ``page`` after ``page / 100`` seconds.
+
+    Negative pages fail with ``ValueError``.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def make_request(self, merchant_id, secret, method):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(abs(method.page) / 100)
+        finally:
+            self.in_flight -= 1
+        if method.page < 0:
+            raise ValueError(f"page {method.page}")
+        return method.page
+
+
+class TestBatch:
+    async def test_results_in_input_order(self):
+        session = DelayedSession()
+        client = Platega("m", "s", session=session)
+
+        pages = [3, 1, 2, 0]
+        results = await client.batch(GetConversions(page=page) for page in pages)
+
+        assert results == pages
+
+    async def test_bounded_concurrency(self):
+        session = DelayedSession()
+        client = Platega("m", "s", session=session)
+
+        batch = client.batch([GetConversions(page=1) for _ in range(10)], concurrency=3)
+        await batch
+
+        assert session.max_in_flight == 3
+        assert batch.stats.completed == 10
+
+    async def test_failures_per_item(self):
+        client = Platega("m", "s", session=DelayedSession())
+
+        batch = client.batch([GetConversions(page=1), GetConversions(page=-1)])
+        results = await batch
+
+        assert results[0] == 1
+        assert isinstance(results[1], ValueError)
+        stats = batch.stats
+        assert (stats.completed, stats.succeeded, stats.failed) == (2, 1, 1)
+        assert stats.throughput > 0
+        assert 0 < stats.latency_p50 <= stats.latency_p95
+
+    async def test_fail_fast(self):
+        session = DelayedSession()
+        client = Platega("m", "s", session=session)
+
+        batch = client.batch(
+            [GetConversions(page=-1), GetConversions(page=50)], return_exceptions=False
+        )
+        with pytest.raises(ValueError, match="page -1"):
+            await batch
+
+        await asyncio.sleep(0)
+        assert session.in_flight == 0
+        assert batch.stats.completed == 1
+
+    async def test_as_completed(self):
+        client = Platega("m", "s", session=DelayedSession())
+
+        items = [item async for item in client.batch(GetConversions(page=p) for p in (5, -1, 0))]
+
+        assert [item.index for item in items] == [2, 1, 0]
+        assert items[0].unwrap() == 0
+        assert not items[1].ok
+        with pytest.raises(ValueError, match="page -1"):
+            items[1].unwrap()
+
+    async def test_as_completed_fail_fast(self):
+        client = Platega("m", "s", session=DelayedSession())
+
+        batch = client.batch(
+            [GetConversions(page=0), GetConversions(page=-1)], return_exceptions=False
+        )
+        with pytest.raises(ValueError, match="page -1"):
+            async for item in batch:
+                assert item.result == 0
+
+        assert batch.stats.completed == 2
+
+    async def test_runs_once(self):
+        client = Platega("m", "s", session=DelayedSession())
+        batch = client.batch([GetConversions()])
+        await batch
+
+        with pytest.raises(RuntimeError, match="only run once"):
+            await batch
+
+    def test_invalid_concurrency(self, client):
+        with pytest.raises(ValueError, match="concurrency"):
+            client.batch([], concurrency=0)
+
+
+class StatusSession(MockSession):
+    """Answers status lookups; the all-zero UUID fails with ``ValueError``."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def make_request(self, merchant_id, secret, method):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+        finally:
+            self.in_flight -= 1
+        if method.transaction_id.int == 0:
+            raise ValueError("unknown transaction")
+        return TransactionStatusResponse(id=method.transaction_id, status="PENDING")
+
+
+class TestStreamTransactionStatuses:
+    async def test_yields_results_and_errors(self):
+        client = Platega("m", "s", session=StatusSession())
+
+        async def ids():
+            yield UUID(int=1)
+            yield UUID(int=0)
+            yield str(UUID(int=2))
+
+        items = [item async for item in client.stream_transaction_statuses(ids())]
+
+        assert sorted(item.result.id.int for item in items if item.ok) == [1, 2]
+        (failed,) = [item for item in items if not item.ok]
+        assert failed.method.transaction_id == UUID(int=0)
+        assert isinstance(failed.error, ValueError)
+
+    async def test_malformed_id_fails_only_its_item(self):
+        client = Platega("m", "s", session=StatusSession())
+
+        async def ids():
+            yield UUID(int=1)
+            yield "not-a-uuid"
+            yield UUID(int=2)
+            yield str(UUID(int=3))
+
+        items = [item async for item in client.stream_transaction_statuses(ids())]
+
+        assert sorted(item.result.id.int for item in items if item.ok) == [1, 2, 3]
+        (failed,) = [item for item in items if not item.ok]
+        assert failed.index == 1
+        assert failed.method.transaction_id == "not-a-uuid"
+        assert isinstance(failed.error, ValidationError)
+
+    async def test_backpressure(self):
+        session = StatusSession()
+        client = Platega("m", "s", session=session)
+        pulled = 0
+        consumed = 0
+        max_ahead = 0
+
+        async def ids():
+            nonlocal pulled
+            for index in range(1, 2001):
+                pulled += 1
+                yield UUID(int=index)
+
+        async for _ in client.stream_transaction_statuses(ids(), concurrency=4):
+            consumed += 1
+            max_ahead = max(max_ahead, pulled - consumed)
+            await asyncio.sleep(0)
+
+        assert consumed == 2000
+        assert session.max_in_flight == 4
+        assert max_ahead <= 4
+
+    async def test_stops_on_error(self):
+        client = Platega("m", "s", session=StatusSession())
+
+        async def ids():
+            yield UUID(int=0)
+            yield UUID(int=1)
+
+        with pytest.raises(ValueError, match="unknown transaction"):
+            async for _ in client.stream_transaction_statuses(ids(), return_exceptions=False):
+                pass
+
+    async def test_stats_memory_is_bounded(self, monkeypatch):
+        monkeypatch.setattr(batch_module, "_LATENCY_SAMPLES", 16)
+        client = Platega("m", "s", session=StatusSession())
+
+        async def ids():
+            for index in range(1, 1001):
+                yield GetTransactionStatus(transaction_id=UUID(int=index))
+
+        batch = client.batch(ids(), concurrency=4)
+        async for _ in batch:
+            pass
+
+        assert batch.stats.completed == 1000
+        assert batch.stats.latency_p95 > 0
+        assert len(batch._latencies) == 16
+
+    async def test_closing_stops_pulling(self):
+        session = StatusSession()
+        client = Platega("m", "s", session=session)
+        pulled = 0
+
+        async def ids():
+            nonlocal pulled
+            for index in range(1, 1000):
+                pulled += 1
+                yield UUID(int=index)
+
+        stream = client.stream_transaction_statuses(ids(), concurrency=2)
+        async for _ in stream:
+            break
+        await stream.aclose()
+        pulled_at_close = pulled
+        await asyncio.sleep(0.01)
+
+        assert pulled == pulled_at_close <= 3
+        assert session.in_flight == 0
@@ -2,11 +2,14 @@ from aioplatega.exceptions import (
     ClientDecodeError,
     PlategaAPIError,
     PlategaBadRequestError,
+    PlategaCircuitOpenError,
     PlategaError,
     PlategaForbiddenError,
     PlategaNetworkError,
     PlategaNotFoundError,
+    PlategaRateLimitError,
     PlategaServerError,
+    PlategaTimeoutError,
     PlategaUnauthorizedError,
 )
 
@@ -23,11 +26,15 @@ class TestExceptionHierarchy:
         assert issubclass(PlategaUnauthorizedError, PlategaAPIError)
         assert issubclass(PlategaForbiddenError, PlategaAPIError)
         assert issubclass(PlategaNotFoundError, PlategaAPIError)
+        assert issubclass(PlategaRateLimitError, PlategaAPIError)
         assert issubclass(PlategaServerError, PlategaAPIError)
 
     def test_network_error_inherits_base(self):
         assert issubclass(PlategaNetworkError, PlategaError)
 
+    def test_timeout_error_inherits_network_error(self):
+        assert issubclass(PlategaTimeoutError, PlategaNetworkError)
+
     def test_decode_error_inherits_base(self):
         assert issubclass(ClientDecodeError, PlategaError)
 
@@ -87,3 +94,22 @@ class TestClientDecodeError:
     def test_construction(self):
         exc = ClientDecodeError("Failed to parse JSON")
         assert str(exc) == "Failed to parse JSON"
+
+
+class TestPlategaCircuitOpenError:
+    def test_attributes(self):
+        exc = PlategaCircuitOpenError("/transaction/{transaction_id}", 1.5)
+        assert exc.method == "/transaction/{transaction_id}"
+        assert exc.retry_after == 1.5
+        assert "is open" in str(exc)
+        assert isinstance(exc, PlategaError)
+
+
+class TestPlategaRateLimitError:
+    def test_retry_after(self):
+        exc = PlategaRateLimitError(message="slow down", status_code=429, retry_after=2.0)
+        assert exc.retry_after == 2.0
+        assert exc.status_code == 429
+
+    def test_retry_after_default(self):
+        assert PlategaRateLimitError(message="slow down").retry_after is None
@@ -0,0 +1,161 @@
+import io
+import json
+
+import pytest
+
+from aioplatega.client import ConversionColumns, Platega
+from aioplatega.enums import ParseMode
+from aioplatega.session.parsing import current_parse_mode, parse_response
+from aioplatega.types import ConversionItem
+from tests.conftest import MockSession
+
+RECORDS = [
+    {
+        "id": 1,
+        "amount": 10.5,
+        "currency": "RUB",
+        "status": "DONE",
+        "createdAt": "2025-01-01T10:00:00Z",
+    },
+    {
+        "id": 2,
+        "amount": 3.0,
+        "currency": "USDT",
+        "status": "DONE",
+        "createdAt": "2025-01-02T03:00:00+03:00",
+    },
+    {"id": 3, "currency": "RUB", "status": "PENDING", "createdAt": "2025-01-03T00:00:00.250000Z"},
+    {"id": 4, "amount": 1.25, "currency": "RUB", "extra": True},
+    {
+        "id": 5,
+        "amount": 7.0,
+        "currency": "USDT",
+        "status": "DONE",
+        "createdAt": "2025-01-05T12:30:00Z",
+    },
+]
+
+
+class RawConversionsSession(MockSession):
+    """Parses JSON conversion pages in the parse mode of each call."""
+
+    def __init__(self, records: list[dict]) -> None:
+        super().__init__()
+        self.records = records
+        self.modes: list[ParseMode | None] = []
+
+    async def make_request(self, merchant_id, secret, method):
+        self.modes.append(current_parse_mode())
+        start = method.page * method.size
+        raw = json.dumps(
+            {
+                "content": self.records[start : start + method.size],
+                "totalElements": len(self.records),
+                "totalPages": -(-len(self.records) // method.size),
+                "page": method.page,
+                "size": method.size,
+            }
+        ).encode()
+        return parse_response(
+            method.__returning__, raw, current_parse_mode() or ParseMode.VALIDATE
+        )
+
+
+@pytest.fixture
+def session() -> RawConversionsSession:
+    return RawConversionsSession(RECORDS)
+
+
+@pytest.fixture
+def export_client(session) -> Platega:
+    return Platega("m", "s", session=session)
+
+
+class TestConversionColumns:
+    def test_from_models(self):
+        columns = ConversionColumns.from_content(
+            [ConversionItem.model_validate(record) for record in RECORDS[:2]]
+        )
+
+        assert columns.id == [1, 2]
+        assert columns.currency == ["RUB", "USDT"]
+        assert columns.created_at == ["2025-01-01T10:00:00", "2025-01-02T00:00:00"]
+
+    def test_rows(self):
+        columns = ConversionColumns(
+            id=[1], amount=[2.0], currency=["RUB"], status=[None], created_at=[None]
+        )
+
+        assert list(columns.rows()) == [(1, 2.0, "RUB", None, None)]
+        assert len(columns) == 1
+
+
+class TestConversionsExport:
+    async def test_batches_use_trusted_pages(self, export_client, session):
+        batches = [batch async for batch in export_client.export_conversions(size=2).batches()]
+
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert set(session.modes) == {ParseMode.TRUSTED}
+        assert batches[0].created_at == ["2025-01-01T10:00:00", "2025-01-02T00:00:00"]
+        assert batches[1].amount == [None, 1.25]
+        assert batches[1].created_at == ["2025-01-03T00:00:00.250000", None]
+
+    async def test_to_numpy(self, export_client):
+        np = pytest.importorskip("numpy")
+
+        arrays = await export_client.export_conversions(size=2).to_numpy()
+
+        assert arrays["id"].tolist() == [1, 2, 3, 4, 5]
+        assert arrays["id"].dtype == np.int64
+        assert np.isnan(arrays["amount"][2])
+        assert arrays["currency"].tolist() == ["RUB", "USDT", "RUB", "RUB", "USDT"]
+        assert arrays["status"][3] == ""
+        assert arrays["created_at"][1] == np.datetime64("2025-01-02T00:00:00")
+        assert np.isnat(arrays["created_at"][3])
+
+    async def test_to_numpy_empty(self):
+        np = pytest.importorskip("numpy")
+        client = Platega("m", "s", session=RawConversionsSession([]))
+
+        arrays = await client.export_conversions().to_numpy()
+
+        assert all(len(array) == 0 for array in arrays.values())
+        assert arrays["created_at"].dtype == np.dtype("datetime64[us]")
+
+    async def test_to_arrow(self, export_client):
+        pa = pytest.importorskip("pyarrow")
+
+        table = await export_client.export_conversions(size=2).to_arrow()
+
+        assert table.num_rows == 5
+        assert table.column_names == ["id", "amount", "currency", "status", "created_at"]
+        assert table.schema.field("created_at").type == pa.timestamp("us", tz="UTC")
+        assert table.column("amount").null_count == 1
+        assert table.column("created_at").null_count == 1
+
+    async def test_write_csv(self, export_client):
+        file = io.StringIO()
+
+        count = await export_client.export_conversions(size=2).write_csv(file)
+
+        lines = file.getvalue().splitlines()
+        assert count == 5
+        assert lines[0] == "id,amount,currency,status,created_at"
+        assert lines[2] == "2,3.0,USDT,DONE,2025-01-02T00:00:00Z"
+        assert lines[4] == "4,1.25,RUB,,"
+
+    async def test_write_ndjson(self, export_client):
+        file = io.StringIO()
+
+        count = await export_client.export_conversions(size=3).write_ndjson(file)
+
+        records = [json.loads(line) for line in file.getvalue().splitlines()]
+        assert count == 5
+        assert records[0] == {
+            "id": 1,
+            "amount": 10.5,
+            "currency": "RUB",
+            "status": "DONE",
+            "created_at": "2025-01-01T10:00:00Z",
+        }
+        assert records[3]["created_at"] is None
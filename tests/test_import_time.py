@@ -0,0 +1,83 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+# Cumulative microseconds ``import aioplatega`` may spend, as reported by
+# ``python -X importtime``. Eager imports of pydantic and aiohttp take ~0.5s.
+IMPORT_BUDGET_US = 50_000
+
+HEAVY_MODULES = ("aiohttp", "certifi", "pydantic")
+
+
+def loaded_modules(statement: str) -> set[str]:
+    """Return top-level modules newly imported by ``statement`` in a fresh interpreter."""
+    code = (
+        "import sys\n"
+        "before = {name.partition('.')[0] for name in sys.modules}\n"
+        f"{statement}\n"
+        "after = {name.partition('.')[0] for name in sys.modules}\n"
+        "print(' '.join(sorted(after - before)))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+def test_package_import_is_lazy():
+    loaded = loaded_modules("import aioplatega")
+    assert loaded.isdisjoint(HEAVY_MODULES)
+
+
+def test_types_import_skips_transport():
+    loaded = loaded_modules("from aioplatega.types import CallbackPayload")
+    assert "pydantic" in loaded
+    assert "aiohttp" not in loaded
+    assert "certifi" not in loaded
+
+
+def test_methods_import_skips_transport():
+    loaded = loaded_modules("from aioplatega.methods import CreateTransaction")
+    assert "aiohttp" not in loaded
+
+
+def test_client_attribute_loads_on_access():
+    loaded = loaded_modules("import aioplatega; aioplatega.Platega")
+    assert "aiohttp" in loaded
+
+
+def test_unknown_attribute():
+    import aioplatega
+
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        _ = aioplatega.Missing
+
+
+def test_dir_lists_lazy_names():
+    import aioplatega
+    from aioplatega import session
+
+    assert "Platega" in dir(aioplatega)
+    assert "AiohttpSession" in dir(session)
+
+
+def test_session_deadline_is_function():
+    from aioplatega.session import deadline
+    from aioplatega.session.deadline import remaining_time
+
+    assert callable(deadline)
+    assert remaining_time() is None
+
+
+def test_import_time_budget():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import aioplatega"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    match = re.search(r"^import time:\s+\d+ \|\s+(\d+) \| aioplatega$", result.stderr, re.M)
+    assert match is not None
+    assert int(match.group(1)) < IMPORT_BUDGET_US
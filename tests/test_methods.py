@@ -7,7 +7,7 @@ from aioplatega.methods import (
     GetRate,
     GetTransactionStatus,
 )
-from aioplatega.methods.base import PlategaMethod
+from aioplatega.methods.base import PlategaMethod, RequestTimeout
 from aioplatega.types import (
     ConversionsResponse,
     CreateTransactionResponse,
@@ -24,6 +24,15 @@ class TestPlategaMethodBase:
         assert "__http_method__" in annotations
         assert "__returning__" in annotations
 
+    def test_default_timeout_is_none(self):
+        assert PlategaMethod.__timeout__ is None
+        assert GetTransactionStatus.__timeout__ is None
+
+    def test_create_transaction_timeout_tighter_than_conversions(self):
+        assert isinstance(CreateTransaction.__timeout__, RequestTimeout)
+        assert isinstance(GetConversions.__timeout__, RequestTimeout)
+        assert CreateTransaction.__timeout__.total < GetConversions.__timeout__.total
+
 
 class TestCreateTransaction:
     def test_class_vars(self):
@@ -0,0 +1,1184 @@
+import asyncio
+from typing import Any
+from uuid import UUID
+
+import pytest
+
+from aioplatega.enums import ParseMode, PaymentMethodInt
+from aioplatega.exceptions import (
+    PlategaBadRequestError,
+    PlategaCircuitOpenError,
+    PlategaDeadlineExceededError,
+    PlategaNetworkError,
+    PlategaRateLimitError,
+    PlategaServerError,
+    PlategaTimeoutError,
+)
+from aioplatega.methods import CreateTransaction, GetRate, GetTransactionStatus
+from aioplatega.methods.base import PlategaMethod
+from aioplatega.session.deadline import deadline, remaining_time
+from aioplatega.session.middlewares import (
+    AdaptiveConcurrencyMiddleware,
+    AdaptiveLimit,
+    BaseRequestMiddleware,
+    CacheEntry,
+    CircuitBreakerMiddleware,
+    CircuitState,
+    CoalescingMiddleware,
+    HedgingMiddleware,
+    MemoryCacheStorage,
+    RateCacheMiddleware,
+    RateCacheStats,
+    RateLimit,
+    RateLimiterMiddleware,
+    RetryBudget,
+    RetryMiddleware,
+    RetryPolicy,
+    StatusCacheMiddleware,
+    StatusCacheStats,
+    TokenBucket,
+    rate_cache,
+    status_cache,
+)
+from aioplatega.session.parsing import use_parse_mode
+from aioplatega.types import PaymentDetails, RateResponse, TransactionStatusResponse
+from tests.conftest import MockSession
+
+TRANSACTION_ID = UUID("12345678-1234-5678-1234-567812345678")
+
+
+class FlakySession(MockSession):
+    """Session that raises the queued errors before returning ``response``."""
+
+    def __init__(self, errors: list[Exception], response: Any = "ok") -> None:
+        super().__init__(response)
+        self.errors = list(errors)
+
+    async def make_request(
+        self,
+        merchant_id: str,
+        secret: str,
+        method: PlategaMethod[Any],
+    ) -> Any:
+        self.calls.append((merchant_id, secret, method))
+        if self.errors:
+            raise self.errors.pop(0)
+        return self.response
+
+
+def get_status() -> GetTransactionStatus:
+    return GetTransactionStatus(transaction_id=TRANSACTION_ID)
+
+
+def create_transaction() -> CreateTransaction:
+    return CreateTransaction(
+        payment_method=PaymentMethodInt.SBP_QR,
+        payment_details=PaymentDetails(amount=100.0, currency="RUB"),
+    )
+
+
+def server_error() -> PlategaServerError:
+    return PlategaServerError(message="boom", status_code=500)
+
+
+class TestRequestMiddlewareManager:
+    async def test_registration_order_is_outermost_first(self):
+        order: list[str] = []
+
+        class Tracer(BaseRequestMiddleware):
+            def __init__(self, name: str) -> None:
+                self.name = name
+
+            async def __call__(self, make_request, merchant_id, secret, method):
+                order.append(self.name)
+                return await make_request(merchant_id, secret, method)
+
+        session = MockSession(response="ok")
+        outer = session.middleware(Tracer("outer"))
+        session.middleware.register(Tracer("inner"))
+
+        assert await session("m", "s", get_status()) == "ok"
+        assert order == ["outer", "inner"]
+        assert len(session.middleware) == 2
+
+        session.middleware.unregister(outer)
+        assert list(session.middleware) == [session.middleware[0]]
+
+    async def test_no_middlewares_calls_make_request(self):
+        session = MockSession(response="ok")
+        assert await session("m", "s", get_status()) == "ok"
+        assert len(session.calls) == 1
+
+    def test_session_without_base_init(self):
+        # MockSession does not call ``BaseSession.__init__``, like transports
+        # written before middlewares existed.
+        session = MockSession(response="ok")
+
+        assert session.parse_mode is ParseMode.VALIDATE
+        assert session.middleware is session.middleware
+        assert len(session.middleware) == 0
+
+
+class TestRetryMiddleware:
+    async def test_retries_get_until_success(self):
+        session = FlakySession([server_error(), PlategaNetworkError("reset")])
+        retry = session.middleware(RetryMiddleware(RetryPolicy(base_delay=0)))
+
+        assert await session("m", "s", get_status()) == "ok"
+        assert len(session.calls) == 3
+        assert retry.stats.retries == 2
+        assert retry.stats.requests == 1
+
+    async def test_gives_up_after_max_attempts(self):
+        session = FlakySession([server_error()] * 5)
+        session.middleware(RetryMiddleware(RetryPolicy(max_attempts=2, base_delay=0)))
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+        assert len(session.calls) == 2
+
+    async def test_post_not_retried_by_default(self):
+        session = FlakySession([server_error()])
+        session.middleware(RetryMiddleware(RetryPolicy(base_delay=0)))
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", create_transaction())
+        assert len(session.calls) == 1
+
+    async def test_post_retried_when_opted_in(self):
+        session = FlakySession([server_error()])
+        policy = RetryPolicy(base_delay=0, http_methods=frozenset({"GET", "POST"}))
+        session.middleware(RetryMiddleware(policy))
+
+        assert await session("m", "s", create_transaction()) == "ok"
+        assert len(session.calls) == 2
+
+    async def test_client_errors_not_retried(self):
+        session = FlakySession([PlategaBadRequestError(message="bad", status_code=400)])
+        session.middleware(RetryMiddleware(RetryPolicy(base_delay=0)))
+
+        with pytest.raises(PlategaBadRequestError):
+            await session("m", "s", get_status())
+        assert len(session.calls) == 1
+
+    async def test_budget_limits_retries(self):
+        session = FlakySession([server_error()] * 3)
+        retry = session.middleware(
+            RetryMiddleware(RetryPolicy(base_delay=0), RetryBudget(ratio=0, burst=1))
+        )
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+        assert len(session.calls) == 2
+        assert retry.stats.exhausted == 1
+
+    async def test_rate_limit_waits_retry_after(self, monkeypatch):
+        delays: list[float] = []
+
+        async def fake_sleep(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+        session = FlakySession([PlategaRateLimitError(message="slow", retry_after=2.5)])
+        session.middleware(RetryMiddleware(RetryPolicy(base_delay=0)))
+
+        assert await session("m", "s", get_status()) == "ok"
+        assert delays == [2.5]
+
+    async def test_deadline_stops_retries(self):
+        class SlowBackoff(RetryPolicy):
+            def backoff(self, retry: int) -> float:
+                return 10.0
+
+        session = FlakySession([server_error()] * 3)
+        session.middleware(RetryMiddleware(SlowBackoff()))
+
+        with deadline(0.01), pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+        assert len(session.calls) == 1
+
+
+class TestRetryPolicy:
+    def test_backoff_is_bounded(self):
+        policy = RetryPolicy(base_delay=0.1, max_delay=0.3)
+        for retry in range(10):
+            assert 0 <= policy.backoff(retry) <= 0.3
+
+
+class TestRetryBudget:
+    def test_deposit_is_capped(self):
+        budget = RetryBudget(ratio=0.5, burst=2)
+        budget.deposit()
+        assert budget.tokens == 2
+
+    def test_withdraw_and_refill(self):
+        budget = RetryBudget(ratio=0.5, burst=1)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+
+
+class TestCircuitBreakerMiddleware:
+    async def test_opens_after_failure_rate(self):
+        events: list[tuple[str, CircuitState, CircuitState]] = []
+        session = FlakySession([server_error()] * 2)
+        breaker = session.middleware(
+            CircuitBreakerMiddleware(
+                failure_rate_threshold=0.5,
+                minimum_calls=2,
+                open_timeout=60,
+                on_state_change=lambda *event: events.append(event),
+            )
+        )
+        api_method = GetTransactionStatus.__api_method__
+
+        for _ in range(2):
+            with pytest.raises(PlategaServerError):
+                await session("m", "s", get_status())
+
+        assert breaker.state(api_method) is CircuitState.OPEN
+        assert events == [(api_method, CircuitState.CLOSED, CircuitState.OPEN)]
+
+        with pytest.raises(PlategaCircuitOpenError) as exc_info:
+            await session("m", "s", get_status())
+        assert exc_info.value.method == api_method
+        assert len(session.calls) == 2
+
+    async def test_caller_deadline_is_not_a_failure(self):
+        session = FlakySession([PlategaDeadlineExceededError("no time left")] * 3)
+        breaker = session.middleware(CircuitBreakerMiddleware(minimum_calls=1))
+
+        for _ in range(3):
+            with pytest.raises(PlategaDeadlineExceededError):
+                await session("m", "s", get_status())
+
+        assert breaker.state(GetTransactionStatus.__api_method__) is CircuitState.CLOSED
+        assert await session("m", "s", get_status()) == "ok"
+
+    async def test_circuits_are_per_endpoint(self):
+        session = FlakySession([server_error()])
+        breaker = session.middleware(CircuitBreakerMiddleware(minimum_calls=1))
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+
+        assert await session("m", "s", create_transaction()) == "ok"
+        assert breaker.states == {
+            GetTransactionStatus.__api_method__: CircuitState.OPEN,
+            CreateTransaction.__api_method__: CircuitState.CLOSED,
+        }
+
+    async def test_half_open_probe_closes_circuit(self):
+        session = FlakySession([server_error()])
+        breaker = session.middleware(CircuitBreakerMiddleware(minimum_calls=1, open_timeout=0))
+        api_method = GetTransactionStatus.__api_method__
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+        assert breaker.state(api_method) is CircuitState.HALF_OPEN
+
+        assert await session("m", "s", get_status()) == "ok"
+        assert breaker.state(api_method) is CircuitState.CLOSED
+
+    async def test_failed_probe_reopens_circuit(self):
+        session = FlakySession([server_error(), server_error()])
+        breaker = session.middleware(CircuitBreakerMiddleware(minimum_calls=1, open_timeout=0))
+        api_method = GetTransactionStatus.__api_method__
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+        breaker.open_timeout = 60
+        breaker._circuits[api_method].opened_at -= 60
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+        assert breaker.state(api_method) is CircuitState.OPEN
+
+    async def test_slow_calls_count_as_failures(self):
+        session = MockSession(response="ok")
+        breaker = session.middleware(
+            CircuitBreakerMiddleware(slow_call_threshold=-1, minimum_calls=1)
+        )
+
+        assert await session("m", "s", get_status()) == "ok"
+        assert breaker.state(GetTransactionStatus.__api_method__) is CircuitState.OPEN
+
+    async def test_client_errors_do_not_open(self):
+        session = FlakySession([PlategaBadRequestError(message="bad", status_code=400)])
+        breaker = session.middleware(CircuitBreakerMiddleware(minimum_calls=1))
+
+        with pytest.raises(PlategaBadRequestError):
+            await session("m", "s", get_status())
+        assert breaker.state(GetTransactionStatus.__api_method__) is CircuitState.CLOSED
+
+    async def test_reset(self):
+        session = FlakySession([server_error()])
+        breaker = session.middleware(CircuitBreakerMiddleware(minimum_calls=1))
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+        breaker.reset()
+
+        assert breaker.states == {}
+
+
+class TestTokenBucket:
+    async def test_burst_is_immediate(self):
+        bucket = TokenBucket(RateLimit(rate=1, burst=3))
+        for _ in range(3):
+            assert await bucket.acquire() == 0.0
+
+    async def test_waits_for_refill(self):
+        bucket = TokenBucket(RateLimit(rate=100, burst=1))
+        await bucket.acquire()
+        assert await bucket.acquire() > 0
+
+    async def test_fifo_order(self):
+        bucket = TokenBucket(RateLimit(rate=200, burst=1))
+        await bucket.acquire()
+        order: list[int] = []
+
+        async def waiter(index: int) -> None:
+            await bucket.acquire()
+            order.append(index)
+
+        await asyncio.gather(*(waiter(i) for i in range(5)))
+        assert order == [0, 1, 2, 3, 4]
+
+    async def test_cancelled_waiter_does_not_consume(self):
+        bucket = TokenBucket(RateLimit(rate=10, burst=1))
+        await bucket.acquire()
+
+        task = asyncio.create_task(bucket.acquire())
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        await asyncio.sleep(0.1)
+        assert bucket.tokens >= 0.99
+
+
+class TestRateLimiterMiddleware:
+    async def test_records_queue_time(self):
+        waits: list[tuple[str, float]] = []
+        session = MockSession(response="ok")
+        limiter = session.middleware(
+            RateLimiterMiddleware(
+                global_limit=RateLimit(rate=100, burst=1),
+                on_wait=lambda *event: waits.append(event),
+            )
+        )
+
+        await asyncio.gather(*(session("m", "s", get_status()) for _ in range(3)))
+
+        assert len(waits) == 3
+        assert waits[0] == (GetTransactionStatus.__api_method__, 0.0)
+        assert limiter.stats.requests == 3
+        assert limiter.stats.delayed == 2
+        assert limiter.stats.max_wait > 0
+
+    async def test_per_method_bucket(self):
+        session = MockSession(response="ok")
+        limiter = session.middleware(
+            RateLimiterMiddleware(
+                per_method={CreateTransaction.__api_method__: RateLimit(rate=100, burst=1)}
+            )
+        )
+
+        for _ in range(3):
+            await session("m", "s", get_status())
+        assert limiter.stats.delayed == 0
+
+        await session("m", "s", create_transaction())
+        await session("m", "s", create_transaction())
+        assert limiter.stats.delayed == 1
+
+    async def test_cancel_while_waiting_for_global_refunds_endpoint_token(self):
+        api_method = GetTransactionStatus.__api_method__
+        limiter = RateLimiterMiddleware(
+            global_limit=RateLimit(rate=1, burst=1),
+            per_method={api_method: RateLimit(rate=0.001, burst=1)},
+        )
+        await limiter._global.acquire()
+
+        task = asyncio.create_task(limiter.acquire(api_method))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert limiter._buckets[api_method].tokens >= 1
+
+    async def test_wait_is_bounded_by_deadline(self):
+        api_method = GetTransactionStatus.__api_method__
+        session = MockSession(response="ok")
+        limiter = session.middleware(
+            RateLimiterMiddleware(
+                global_limit=RateLimit(rate=1, burst=1),
+                per_method={api_method: RateLimit(rate=0.001, burst=1)},
+            )
+        )
+        await limiter._global.acquire()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        with deadline(0.05), pytest.raises(PlategaTimeoutError, match="rate limit"):
+            await session("m", "s", get_status())
+
+        assert loop.time() - started < 0.5
+        assert session.calls == []
+        assert limiter._buckets[api_method].tokens >= 1
+
+    def test_invalid_limit(self):
+        with pytest.raises(ValueError, match="rate"):
+            RateLimit(rate=0)
+        with pytest.raises(ValueError, match="burst"):
+            RateLimit(rate=1, burst=0)
+
+
+class TestRateLimiterPause:
+    async def test_429_pauses_endpoint(self):
+        session = FlakySession([PlategaRateLimitError(message="slow", retry_after=0.05)])
+        limiter = session.middleware(RateLimiterMiddleware())
+        api_method = GetTransactionStatus.__api_method__
+
+        with pytest.raises(PlategaRateLimitError):
+            await session("m", "s", get_status())
+        assert 0 < limiter.paused_for(api_method) <= 0.05
+        assert limiter.paused_for(CreateTransaction.__api_method__) == 0
+
+        assert await session("m", "s", get_status()) == "ok"
+        assert limiter.stats.max_wait > 0
+        assert limiter.paused_for(api_method) == 0
+
+    async def test_429_without_header_uses_default(self):
+        session = FlakySession([PlategaRateLimitError(message="slow")])
+        limiter = session.middleware(RateLimiterMiddleware(default_retry_after=30))
+
+        with pytest.raises(PlategaRateLimitError):
+            await session("m", "s", get_status())
+        assert limiter.paused_for(GetTransactionStatus.__api_method__) > 29
+
+    async def test_pause_is_bounded_by_deadline(self):
+        limiter = RateLimiterMiddleware()
+        limiter.pause(GetTransactionStatus.__api_method__, 1.0)
+
+        with deadline(0.05), pytest.raises(PlategaTimeoutError):
+            await limiter.acquire(GetTransactionStatus.__api_method__)
+
+        assert limiter.stats.requests == 0
+
+
+class TestAdaptiveLimit:
+    async def test_admits_up_to_limit(self):
+        gate = AdaptiveLimit(2)
+        await gate.acquire()
+        await gate.acquire()
+
+        waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert gate.waiting == 1
+
+        gate.release()
+        await waiter
+        assert gate.in_flight == 2
+
+    async def test_raising_limit_wakes_waiters(self):
+        gate = AdaptiveLimit(1)
+        await gate.acquire()
+        waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+
+        gate.limit = 2
+        gate.wake()
+        await waiter
+        assert gate.in_flight == 2
+
+    async def test_cancelled_waiter_leaves_queue(self):
+        gate = AdaptiveLimit(1)
+        await gate.acquire()
+        waiter = asyncio.create_task(gate.acquire())
+        await asyncio.sleep(0)
+
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        assert gate.waiting == 0
+
+        gate.release()
+        assert gate.in_flight == 0
+
+    async def test_wait_is_bounded_by_deadline(self):
+        gate = AdaptiveLimit(1)
+        await gate.acquire()
+
+        with deadline(0.02), pytest.raises(PlategaTimeoutError, match="concurrency slot"):
+            await gate.acquire()
+
+        assert gate.waiting == 0
+        gate.release()
+        assert gate.in_flight == 0
+
+
+class TestAdaptiveConcurrencyMiddleware:
+    async def test_fast_success_increases_limit(self):
+        session = MockSession(response="ok")
+        limiter = session.middleware(
+            AdaptiveConcurrencyMiddleware(initial_limit=2, latency_target=10)
+        )
+        api_method = GetTransactionStatus.__api_method__
+
+        for _ in range(4):
+            await session("m", "s", get_status())
+
+        assert limiter.limit(api_method) == 3
+        assert limiter.limits == {api_method: 3}
+
+    async def test_caller_deadline_does_not_cut_limit(self):
+        session = FlakySession([PlategaDeadlineExceededError("no time left")])
+        limiter = session.middleware(AdaptiveConcurrencyMiddleware(initial_limit=8))
+
+        with pytest.raises(PlategaDeadlineExceededError):
+            await session("m", "s", get_status())
+
+        assert limiter.limit(GetTransactionStatus.__api_method__) == 8
+
+    async def test_congestion_cuts_limit(self):
+        changes: list[tuple[str, int]] = []
+        session = FlakySession([PlategaTimeoutError("slow")])
+        limiter = session.middleware(
+            AdaptiveConcurrencyMiddleware(
+                initial_limit=8,
+                on_limit_change=lambda *change: changes.append(change),
+            )
+        )
+        api_method = GetTransactionStatus.__api_method__
+
+        with pytest.raises(PlategaTimeoutError):
+            await session("m", "s", get_status())
+
+        assert limiter.limit(api_method) == 4
+        assert changes == [(api_method, 4)]
+
+    async def test_limit_respects_bounds(self):
+        session = FlakySession([server_error()] * 3)
+        limiter = session.middleware(AdaptiveConcurrencyMiddleware(initial_limit=2, min_limit=2))
+
+        for _ in range(3):
+            with pytest.raises(PlategaServerError):
+                await session("m", "s", get_status())
+
+        assert limiter.limit(GetTransactionStatus.__api_method__) == 2
+
+    async def test_concurrent_failures_cut_once(self):
+        class SlowFailingSession(MockSession):
+            async def make_request(self, merchant_id, secret, method):
+                await asyncio.sleep(0.01)
+                raise server_error()
+
+        session = SlowFailingSession()
+        limiter = session.middleware(AdaptiveConcurrencyMiddleware(initial_limit=8))
+
+        results = await asyncio.gather(
+            *(session("m", "s", get_status()) for _ in range(4)),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(result, PlategaServerError) for result in results)
+        assert limiter.limit(GetTransactionStatus.__api_method__) == 4
+
+    async def test_client_errors_do_not_change_limit(self):
+        session = FlakySession([PlategaBadRequestError(message="bad", status_code=400)])
+        limiter = session.middleware(AdaptiveConcurrencyMiddleware(initial_limit=4))
+
+        with pytest.raises(PlategaBadRequestError):
+            await session("m", "s", get_status())
+        assert limiter.limit(GetTransactionStatus.__api_method__) == 4
+
+
+class GatedSession(MockSession):
+    """Session whose requests block until ``release`` is set."""
+
+    def __init__(self, response: Any = "ok") -> None:
+        super().__init__(response)
+        self.release = asyncio.Event()
+
+    async def make_request(self, merchant_id, secret, method):
+        self.calls.append((merchant_id, secret, method))
+        await self.release.wait()
+        if isinstance(self.response, Exception):
+            raise self.response
+        return self.response
+
+
+class TestCoalescingMiddleware:
+    async def test_identical_gets_share_one_request(self):
+        session = GatedSession(response=object())
+        coalescing = session.middleware(CoalescingMiddleware())
+
+        tasks = [asyncio.create_task(session("m", "s", get_status())) for _ in range(3)]
+        await asyncio.sleep(0)
+        session.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert len(session.calls) == 1
+        assert results[0] is results[1] is results[2]
+        assert coalescing.stats.hits == 2
+        assert coalescing.stats.misses == 1
+        assert coalescing.stats.hit_rate == 2 / 3
+        assert coalescing.in_flight == 0
+
+    async def test_different_fields_not_shared(self):
+        session = GatedSession()
+        session.middleware(CoalescingMiddleware())
+        other = GetTransactionStatus(transaction_id=UUID("87654321-4321-8765-4321-876543218765"))
+
+        tasks = [
+            asyncio.create_task(session("m", "s", get_status())),
+            asyncio.create_task(session("m", "s", other)),
+        ]
+        await asyncio.sleep(0)
+        session.release.set()
+        await asyncio.gather(*tasks)
+
+        assert len(session.calls) == 2
+
+    async def test_post_not_coalesced(self):
+        session = GatedSession()
+        session.middleware(CoalescingMiddleware())
+
+        tasks = [asyncio.create_task(session("m", "s", create_transaction())) for _ in range(2)]
+        await asyncio.sleep(0)
+        session.release.set()
+        await asyncio.gather(*tasks)
+
+        assert len(session.calls) == 2
+
+    async def test_cancelling_waiter_keeps_shared_request(self):
+        session = GatedSession()
+        session.middleware(CoalescingMiddleware())
+
+        first = asyncio.create_task(session("m", "s", get_status()))
+        second = asyncio.create_task(session("m", "s", get_status()))
+        await asyncio.sleep(0)
+
+        first.cancel()
+        await asyncio.sleep(0)
+        session.release.set()
+
+        assert await second == "ok"
+        assert first.cancelled()
+        assert len(session.calls) == 1
+
+    async def test_errors_are_shared(self):
+        session = GatedSession(response=server_error())
+        session.middleware(CoalescingMiddleware())
+
+        tasks = [asyncio.create_task(session("m", "s", get_status())) for _ in range(2)]
+        await asyncio.sleep(0)
+        session.release.set()
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        assert all(isinstance(result, PlategaServerError) for result in results)
+        assert len(session.calls) == 1
+
+    async def test_waiter_deadline(self):
+        session = GatedSession()
+        session.middleware(CoalescingMiddleware())
+
+        with deadline(0.01), pytest.raises(PlategaTimeoutError):
+            await session("m", "s", get_status())
+
+        session.release.set()
+        await asyncio.sleep(0)
+
+    async def test_first_caller_deadline_does_not_bound_shared_request(self):
+        class DeadlineSession(GatedSession):
+            async def make_request(self, merchant_id, secret, method):
+                remaining = remaining_time()
+                if remaining is None:
+                    return await super().make_request(merchant_id, secret, method)
+                try:
+                    return await asyncio.wait_for(
+                        super().make_request(merchant_id, secret, method), remaining
+                    )
+                except asyncio.TimeoutError as exc:
+                    raise PlategaTimeoutError("request timed out") from exc
+
+        session = DeadlineSession()
+        session.middleware(CoalescingMiddleware())
+
+        async def call(seconds: float) -> Any:
+            with deadline(seconds):
+                return await session("m", "s", get_status())
+
+        short = asyncio.create_task(call(0.02))
+        await asyncio.sleep(0)
+        long = asyncio.create_task(call(5))
+        await asyncio.sleep(0.05)
+        session.release.set()
+
+        with pytest.raises(PlategaTimeoutError, match="waiting for"):
+            await short
+        assert await long == "ok"
+        assert len(session.calls) == 1
+
+
+class ScriptedLatencySession(MockSession):
+    """Session whose n-th request sleeps ``latencies[n]`` and then returns or raises."""
+
+    def __init__(self, latencies: list[float], outcomes: list[Any] | None = None) -> None:
+        super().__init__()
+        self.latencies = latencies
+        self.outcomes = outcomes or [f"attempt-{index}" for index in range(len(latencies))]
+        self.cancelled = 0
+
+    async def make_request(self, merchant_id, secret, method):
+        index = len(self.calls)
+        self.calls.append((merchant_id, secret, method))
+        try:
+            await asyncio.sleep(self.latencies[index])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        outcome = self.outcomes[index]
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+class TestHedgingMiddleware:
+    async def test_fast_primary_is_not_hedged(self):
+        session = ScriptedLatencySession([0])
+        hedging = session.middleware(HedgingMiddleware(delay=0.05))
+
+        assert await session("m", "s", get_status()) == "attempt-0"
+        assert hedging.stats.hedges == 0
+        assert len(session.calls) == 1
+
+    async def test_slow_primary_is_hedged_and_loses(self):
+        session = ScriptedLatencySession([1, 0])
+        hedging = session.middleware(HedgingMiddleware(delay=0.01))
+
+        assert await session("m", "s", get_status()) == "attempt-1"
+        await asyncio.sleep(0)
+        assert hedging.stats.hedges == 1
+        assert hedging.stats.hedge_wins == 1
+        assert session.cancelled == 1
+
+    async def test_failed_hedge_falls_back_to_primary(self):
+        session = ScriptedLatencySession([0.05, 0], ["attempt-0", server_error()])
+        hedging = session.middleware(HedgingMiddleware(delay=0.01))
+
+        assert await session("m", "s", get_status()) == "attempt-0"
+        assert hedging.stats.hedge_wins == 0
+
+    async def test_both_failing_raises_primary_error(self):
+        primary_error = PlategaNetworkError("primary")
+        session = ScriptedLatencySession([0.05, 0], [primary_error, server_error()])
+        session.middleware(HedgingMiddleware(delay=0.01))
+
+        with pytest.raises(PlategaNetworkError, match="primary"):
+            await session("m", "s", get_status())
+
+    async def test_cancelled_primary_falls_back_to_hedge(self):
+        session = ScriptedLatencySession([0.05, 0.05], [asyncio.CancelledError(), "attempt-1"])
+        hedging = session.middleware(HedgingMiddleware(delay=0.01))
+
+        assert await session("m", "s", get_status()) == "attempt-1"
+        assert hedging.stats.hedge_wins == 1
+
+    async def test_cancelled_primary_and_failed_hedge_raise_hedge_error(self):
+        session = ScriptedLatencySession([0.03, 0.03], [asyncio.CancelledError(), server_error()])
+        session.middleware(HedgingMiddleware(delay=0.01))
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+
+    async def test_budget_limits_hedges(self):
+        session = ScriptedLatencySession([0.03, 0.03])
+        hedging = session.middleware(
+            HedgingMiddleware(delay=0.01, budget=RetryBudget(ratio=0, burst=0))
+        )
+
+        assert await session("m", "s", get_status()) == "attempt-0"
+        assert hedging.stats.skipped == 1
+        assert len(session.calls) == 1
+
+    async def test_post_not_hedged(self):
+        session = ScriptedLatencySession([0.03])
+        hedging = session.middleware(HedgingMiddleware(delay=0))
+
+        assert await session("m", "s", create_transaction()) == "attempt-0"
+        assert hedging.stats.requests == 0
+
+    def test_delay_from_observed_percentile(self):
+        hedging = HedgingMiddleware(
+            percentile=0.95, min_samples=10, initial_delay=1.0, refresh_every=1
+        )
+        assert hedging.hedge_delay("status") == 1.0
+
+        for index in range(1, 101):
+            hedging._record("status", index / 100)
+        assert hedging.hedge_delay("status") == 0.95
+
+    def test_delay_per_endpoint(self):
+        hedging = HedgingMiddleware(min_samples=10, initial_delay=1.0)
+
+        for _ in range(20):
+            hedging._record("status", 0.01)
+            hedging._record("conversions", 30.0)
+
+        assert hedging.hedge_delay("status") == 0.01
+        assert hedging.hedge_delay("conversions") == 30.0
+        assert hedging.hedge_delay("rate") == 1.0
+
+    def test_delay_is_recomputed_periodically(self):
+        hedging = HedgingMiddleware(percentile=0.5, min_samples=1, refresh_every=10)
+        hedging._record("status", 0.1)
+        assert hedging.hedge_delay("status") == 0.1
+
+        for _ in range(9):
+            hedging._record("status", 0.5)
+        assert hedging.hedge_delay("status") == 0.1
+
+        hedging._record("status", 0.5)
+        assert hedging.hedge_delay("status") == 0.5
+
+    async def test_caller_cancellation_cancels_attempts(self):
+        session = ScriptedLatencySession([1, 1])
+        session.middleware(HedgingMiddleware(delay=0.01))
+
+        task = asyncio.create_task(session("m", "s", get_status()))
+        await asyncio.sleep(0.03)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+
+        assert session.cancelled == 2
+
+
+class StatusSession(MockSession):
+    """Session answering status lookups with the status set for each transaction."""
+
+    def __init__(self, status: str = "PENDING") -> None:
+        super().__init__()
+        self.status = status
+
+    async def make_request(self, merchant_id, secret, method):
+        self.calls.append((merchant_id, secret, method))
+        return TransactionStatusResponse(id=method.transaction_id, status=self.status)
+
+
+class TestStatusCacheMiddleware:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [1_000_000.0]
+        monkeypatch.setattr(status_cache.time, "time", lambda: now[0])
+        return now
+
+    async def test_repeated_lookup_is_served_from_cache(self, clock):
+        session = StatusSession("CONFIRMED")
+        cache = session.middleware(StatusCacheMiddleware())
+
+        first = await session("m", "s", get_status())
+        second = await session("m", "s", get_status())
+
+        assert second is first
+        assert len(session.calls) == 1
+        assert cache.stats == StatusCacheStats(hits=1, misses=1)
+        assert cache.stats.hit_rate == 0.5
+
+    async def test_ttl_depends_on_status(self, clock):
+        session = StatusSession("PENDING")
+        session.middleware(StatusCacheMiddleware(ttls={"PENDING": 5.0, "CANCELED": None}))
+
+        await session("m", "s", get_status())
+        clock[0] += 4.9
+        await session("m", "s", get_status())
+        assert len(session.calls) == 1
+
+        clock[0] += 0.2
+        session.status = "CANCELED"
+        await session("m", "s", get_status())
+        assert len(session.calls) == 2
+
+        clock[0] += 365 * 86400
+        response = await session("m", "s", get_status())
+        assert response.status == "CANCELED"
+        assert len(session.calls) == 2
+
+    async def test_zero_ttl_is_not_stored(self, clock):
+        session = StatusSession("PENDING")
+        cache = session.middleware(StatusCacheMiddleware(ttls={"PENDING": 0}))
+
+        await session("m", "s", get_status())
+        await session("m", "s", get_status())
+
+        assert len(session.calls) == 2
+        assert len(cache.storage) == 0  # type: ignore[arg-type]
+
+    async def test_invalidate(self, clock):
+        session = StatusSession("CONFIRMED")
+        cache = session.middleware(StatusCacheMiddleware())
+
+        await session("m", "s", get_status())
+        with use_parse_mode(ParseMode.TRUSTED):
+            await session("m", "s", get_status())
+        await cache.invalidate("m", str(TRANSACTION_ID))
+        session.status = "CHARGEBACKED"
+        response = await session("m", "s", get_status())
+
+        assert response.status == "CHARGEBACKED"
+        assert len(session.calls) == 3
+        assert cache.stats.invalidations == 1
+
+    async def test_other_credentials_do_not_share_entries(self, clock):
+        session = StatusSession("CONFIRMED")
+        session.middleware(StatusCacheMiddleware())
+
+        await session("m", "s", get_status())
+        await session("m", "other-secret", get_status())
+        await session("other", "s", get_status())
+
+        assert len(session.calls) == 3
+
+    async def test_other_methods_pass_through(self):
+        session = MockSession(response="ok")
+        cache = session.middleware(StatusCacheMiddleware())
+
+        await session("m", "s", create_transaction())
+        await session("m", "s", create_transaction())
+
+        assert len(session.calls) == 2
+        assert cache.stats == StatusCacheStats()
+
+    async def test_errors_are_not_cached(self):
+        session = FlakySession(
+            [server_error()], TransactionStatusResponse(id=TRANSACTION_ID, status="CONFIRMED")
+        )
+        session.middleware(StatusCacheMiddleware())
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_status())
+        await session("m", "s", get_status())
+        await session("m", "s", get_status())
+
+        assert len(session.calls) == 2
+
+    async def test_custom_storage(self, clock):
+        class RecordingStorage(MemoryCacheStorage):
+            def __init__(self) -> None:
+                super().__init__()
+                self.stored: list[CacheEntry] = []
+
+            async def set(self, key: str, entry: CacheEntry) -> None:
+                self.stored.append(entry)
+                await super().set(key, entry)
+
+        storage = RecordingStorage()
+        session = StatusSession("PENDING")
+        session.middleware(StatusCacheMiddleware(storage, ttls={"PENDING": 3.0}))
+
+        await session("m", "s", get_status())
+
+        (entry,) = storage.stored
+        assert entry.stored_at == clock[0]
+        assert entry.expires_at == clock[0] + 3.0
+
+
+class TestMemoryCacheStorage:
+    async def test_evicts_least_recently_used(self):
+        storage = MemoryCacheStorage(maxsize=2)
+        await storage.set("a", CacheEntry("a", stored_at=0))
+        await storage.set("b", CacheEntry("b", stored_at=0))
+        await storage.get("a")
+        await storage.set("c", CacheEntry("c", stored_at=0))
+
+        assert await storage.get("b") is None
+        assert (await storage.get("a")) is not None
+        assert len(storage) == 2
+        assert storage.evictions == 1
+
+    async def test_delete_and_clear(self):
+        storage = MemoryCacheStorage()
+        await storage.set("a", CacheEntry("a", stored_at=0))
+        await storage.set("b", CacheEntry("b", stored_at=0))
+
+        await storage.delete("a")
+        await storage.delete("missing")
+        assert await storage.get("a") is None
+        await storage.clear()
+        assert len(storage) == 0
+
+    def test_invalid_maxsize(self):
+        with pytest.raises(ValueError, match="maxsize"):
+            MemoryCacheStorage(maxsize=0)
+
+
+class RateSession(MockSession):
+    """Session returning an increasing rate, blocking each request until ``release`` is set."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.release = asyncio.Event()
+        self.release.set()
+        self.fail = False
+
+    async def make_request(self, merchant_id, secret, method):
+        self.calls.append((merchant_id, secret, method))
+        await self.release.wait()
+        if self.fail:
+            raise server_error()
+        return RateResponse(rate=float(len(self.calls)))
+
+
+def get_rate(currency_to: str = "USDT") -> GetRate:
+    return GetRate(merchant_id="m", payment_method=2, currency_from="RUB", currency_to=currency_to)
+
+
+class TestRateCacheMiddleware:
+    @pytest.fixture
+    def clock(self, monkeypatch):
+        now = [1_000_000.0]
+        monkeypatch.setattr(rate_cache.time, "time", lambda: now[0])
+        return now
+
+    async def test_fresh_rate_is_served_from_cache(self, clock):
+        session = RateSession()
+        cache = session.middleware(RateCacheMiddleware(fresh_for=10))
+
+        first = await session("m", "s", get_rate())
+        clock[0] += 4
+        second = await session("m", "s", get_rate())
+
+        assert second is first
+        assert len(session.calls) == 1
+        assert cache.stats.fresh_hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.last_age == 4
+        assert cache.stats.hit_rate == 0.5
+
+    async def test_keys_are_separate(self, clock):
+        session = RateSession()
+        session.middleware(RateCacheMiddleware())
+
+        await session("m", "s", get_rate("USDT"))
+        await session("m", "s", get_rate("BTC"))
+        await session("m", "other-secret", get_rate("USDT"))
+
+        assert len(session.calls) == 3
+
+    async def test_requests_are_not_shared_across_secrets(self, clock):
+        session = RateSession()
+        session.middleware(RateCacheMiddleware())
+        session.release.clear()
+
+        tasks = [
+            asyncio.create_task(session("m", secret, get_rate())) for secret in ("s", "wrong")
+        ]
+        await asyncio.sleep(0)
+        session.release.set()
+        await asyncio.gather(*tasks)
+
+        assert [secret for _, secret, _ in session.calls] == ["s", "wrong"]
+
+    async def test_stale_rate_is_served_while_refreshing(self, clock):
+        session = RateSession()
+        cache = session.middleware(RateCacheMiddleware(fresh_for=10, max_staleness=60))
+        await session("m", "s", get_rate())
+
+        clock[0] += 30
+        session.release.clear()
+        stale = await asyncio.gather(*(session("m", "s", get_rate()) for _ in range(5)))
+
+        assert [response.rate for response in stale] == [1.0] * 5
+        assert len(session.calls) == 2
+        assert cache.refreshing == 1
+        assert cache.stats.stale_hits == 5
+        assert cache.stats.max_age == 30
+
+        session.release.set()
+        await asyncio.sleep(0)
+        response = await session("m", "s", get_rate())
+        assert response.rate == 2.0
+        assert cache.stats.refreshes == 2
+
+    async def test_callers_block_past_max_staleness(self, clock):
+        session = RateSession()
+        cache = session.middleware(RateCacheMiddleware(fresh_for=10, max_staleness=60))
+        await session("m", "s", get_rate())
+
+        clock[0] += 71
+        session.release.clear()
+        tasks = [asyncio.create_task(session("m", "s", get_rate())) for _ in range(3)]
+        await asyncio.sleep(0)
+        assert not any(task.done() for task in tasks)
+
+        session.release.set()
+        results = await asyncio.gather(*tasks)
+
+        assert [response.rate for response in results] == [2.0] * 3
+        assert len(session.calls) == 2
+        assert cache.stats.misses == 4
+
+    async def test_failed_background_refresh_keeps_stale_rate(self, clock):
+        session = RateSession()
+        cache = session.middleware(RateCacheMiddleware(fresh_for=10, max_staleness=60))
+        await session("m", "s", get_rate())
+
+        clock[0] += 30
+        session.fail = True
+        response = await session("m", "s", get_rate())
+        while cache.refreshing:
+            await asyncio.sleep(0)
+
+        assert response.rate == 1.0
+        assert cache.stats.refresh_errors == 1
+        assert cache.refreshing == 0
+        assert (await session("m", "s", get_rate())).rate == 1.0
+
+    async def test_blocking_caller_gets_refresh_error(self):
+        session = RateSession()
+        session.fail = True
+        session.middleware(RateCacheMiddleware())
+
+        with pytest.raises(PlategaServerError):
+            await session("m", "s", get_rate())
+
+    async def test_waiter_deadline_does_not_cancel_refresh(self):
+        session = RateSession()
+        session.release.clear()
+        cache = session.middleware(RateCacheMiddleware())
+
+        with deadline(0.01), pytest.raises(PlategaTimeoutError):
+            await session("m", "s", get_rate())
+
+        session.release.set()
+        await asyncio.sleep(0)
+        await session("m", "s", get_rate())
+        assert len(session.calls) == 1
+        assert cache.stats.fresh_hits == 1
+
+    async def test_invalidate(self, clock):
+        session = RateSession()
+        cache = session.middleware(RateCacheMiddleware())
+        await session("m", "s", get_rate())
+
+        await cache.invalidate("m", get_rate())
+        await session("m", "s", get_rate())
+
+        assert len(session.calls) == 2
+
+    async def test_other_methods_pass_through(self):
+        session = MockSession(response="ok")
+        cache = session.middleware(RateCacheMiddleware())
+
+        await session("m", "s", get_status())
+
+        assert cache.stats == RateCacheStats()
@@ -0,0 +1,264 @@
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from aioplatega.client import Platega
+from aioplatega.exceptions import PlategaServerError
+from aioplatega.session.deadline import deadline
+from aioplatega.session.middlewares import RetryBudget, RetryPolicy
+from aioplatega.types import ConversionItem, ConversionsResponse
+from tests.conftest import MockSession
+
+
+class ConversionsSession(MockSession):
+    """Serves ``total`` conversion items in pages, recording requested pages."""
+
+    def __init__(self, total: int) -> None:
+        super().__init__()
+        self.items = [ConversionItem(id=index, amount=float(index)) for index in range(total)]
+        self.pages: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failing_pages: set[int] = set()
+
+    async def make_request(self, merchant_id, secret, method):
+        self.calls.append((merchant_id, secret, method))
+        self.pages.append(method.page)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+        finally:
+            self.in_flight -= 1
+        if method.page in self.failing_pages:
+            raise PlategaServerError(message=f"page {method.page}", status_code=500)
+        start = method.page * method.size
+        return ConversionsResponse(
+            content=self.items[start : start + method.size],
+            total_elements=len(self.items),
+            total_pages=-(-len(self.items) // method.size),
+            page=method.page,
+            size=method.size,
+        )
+
+
+class TestIterConversions:
+    async def test_yields_every_item_once(self):
+        session = ConversionsSession(total=23)
+        client = Platega("m", "s", session=session)
+
+        items = [item async for item in client.iter_conversions(size=5)]
+
+        assert [item.id for item in items] == list(range(23))
+        assert session.pages == [0, 1, 2, 3, 4]
+
+    async def test_passes_filters(self):
+        session = ConversionsSession(total=3)
+        client = Platega("m", "s", session=session)
+
+        pages = [
+            page
+            async for page in client.iter_conversion_pages(
+                from_date="2025-01-01T00:00:00Z", to_date="2025-02-01T00:00:00Z", size=2
+            )
+        ]
+
+        assert [page.page for page in pages] == [0, 1]
+        method = session.calls[0][2]
+        assert method.from_date == "2025-01-01T00:00:00Z"
+        assert method.to_date == "2025-02-01T00:00:00Z"
+
+    async def test_empty_history(self):
+        session = ConversionsSession(total=0)
+        client = Platega("m", "s", session=session)
+
+        assert [item async for item in client.iter_conversions()] == []
+        assert session.pages == [0]
+
+    async def test_next_page_is_fetched_while_consuming(self):
+        session = ConversionsSession(total=10)
+        client = Platega("m", "s", session=session)
+        pages = client.iter_conversion_pages(size=2, prefetch=2)
+
+        first = await anext(pages)
+        await asyncio.sleep(0)
+
+        assert first.page == 0
+        assert session.pages == [0, 1, 2]
+        await pages.aclose()
+
+    async def test_without_prefetch_pages_are_fetched_on_demand(self):
+        session = ConversionsSession(total=10)
+        client = Platega("m", "s", session=session)
+        pages = client.iter_conversion_pages(size=2, prefetch=0)
+
+        await anext(pages)
+        await asyncio.sleep(0)
+        assert session.pages == [0]
+
+        await anext(pages)
+        assert session.pages == [0, 1]
+        await pages.aclose()
+
+    async def test_stopping_early_cancels_prefetched_pages(self):
+        session = ConversionsSession(total=100)
+        client = Platega("m", "s", session=session)
+
+        async with aclosing(client.iter_conversions(size=10, prefetch=3)) as items:
+            async for item in items:
+                if item.id == 5:
+                    break
+
+        assert session.in_flight == 0
+        assert len(session.pages) <= 4
+
+    async def test_errors_propagate(self):
+        session = ConversionsSession(total=10)
+        client = Platega("m", "s", session=session)
+        session.failing_pages.add(2)
+        items = []
+
+        with pytest.raises(PlategaServerError, match="page 2"):
+            async for item in client.iter_conversions(size=2):
+                items.append(item)  # noqa: PERF401
+
+        assert len(items) == 4
+
+    async def test_invalid_arguments(self, client):
+        with pytest.raises(ValueError, match="size"):
+            await anext(client.iter_conversion_pages(size=0))
+        with pytest.raises(ValueError, match="prefetch"):
+            await anext(client.iter_conversion_pages(prefetch=-1))
+
+
+class TestFetchConversions:
+    async def test_returns_items_in_page_order(self):
+        session = ConversionsSession(total=95)
+        client = Platega("m", "s", session=session)
+        fetch = client.fetch_conversions(size=10, concurrency=4)
+
+        items = await fetch
+
+        assert [item.id for item in items] == list(range(95))
+        assert session.pages[0] == 0
+        assert sorted(session.pages) == list(range(10))
+        assert session.max_in_flight <= 4
+        assert fetch.stats.pages == 10
+        assert fetch.stats.total_pages == 10
+        assert fetch.stats.items == 95
+        assert fetch.stats.pages_per_second > 0
+
+    async def test_fetches_pages_concurrently(self):
+        session = ConversionsSession(total=100)
+        client = Platega("m", "s", session=session)
+
+        await client.fetch_conversions(size=10, concurrency=4)
+
+        assert session.max_in_flight == 4
+
+    async def test_streams_pages_in_order(self):
+        session = ConversionsSession(total=50)
+        client = Platega("m", "s", session=session)
+
+        pages = [page.page async for page in client.fetch_conversions(size=5).pages()]
+
+        assert pages == list(range(10))
+
+    async def test_stream_is_bounded(self):
+        session = ConversionsSession(total=1000)
+        client = Platega("m", "s", session=session)
+
+        async with aclosing(client.fetch_conversions(size=10, concurrency=2).items()) as items:
+            await anext(items)
+            for _ in range(10):
+                await asyncio.sleep(0)
+            assert len(session.pages) <= 1 + 2 * 2
+
+        assert session.in_flight == 0
+
+    async def test_failed_pages_are_retried(self, monkeypatch):
+        async def no_sleep(delay):
+            pass
+
+        session = ConversionsSession(total=30)
+        client = Platega("m", "s", session=session)
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        session.failing_pages.add(1)
+        original = session.make_request
+
+        async def recover(merchant_id, secret, method):
+            try:
+                return await original(merchant_id, secret, method)
+            finally:
+                if session.pages.count(1) == 2:
+                    session.failing_pages.clear()
+
+        session.make_request = recover  # type: ignore[method-assign]
+        fetch = client.fetch_conversions(size=10)
+
+        items = await fetch
+
+        assert len(items) == 30
+        assert fetch.stats.retries == 2
+        assert session.pages.count(1) == 3
+
+    async def test_gives_up_after_max_attempts(self, monkeypatch):
+        async def no_sleep(delay):
+            pass
+
+        session = ConversionsSession(total=30)
+        client = Platega("m", "s", session=session)
+        monkeypatch.setattr(asyncio, "sleep", no_sleep)
+        session.failing_pages.add(2)
+
+        with pytest.raises(PlategaServerError, match="page 2"):
+            await client.fetch_conversions(size=10, retry=RetryPolicy(max_attempts=2))
+
+        assert session.pages.count(2) == 2
+
+    async def test_retries_draw_from_budget(self):
+        session = ConversionsSession(total=30)
+        client = Platega("m", "s", session=session)
+        session.failing_pages.add(1)
+        fetch = client.fetch_conversions(size=10, retry_budget=RetryBudget(ratio=0, burst=0))
+
+        with pytest.raises(PlategaServerError, match="page 1"):
+            await fetch
+
+        assert session.pages.count(1) == 1
+        assert fetch.stats.retries == 0
+
+    async def test_retries_stop_at_deadline(self):
+        session = ConversionsSession(total=30)
+        client = Platega("m", "s", session=session)
+        session.failing_pages.add(1)
+        policy = RetryPolicy(max_attempts=5, base_delay=10, max_delay=10)
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+
+        with deadline(0.5), pytest.raises(PlategaServerError, match="page 1"):
+            await client.fetch_conversions(size=10, retry=policy)
+
+        assert loop.time() - started < 0.5
+
+    async def test_single_page(self):
+        session = ConversionsSession(total=3)
+        client = Platega("m", "s", session=session)
+
+        assert len(await client.fetch_conversions(size=10)) == 3
+        assert session.pages == [0]
+
+    async def test_runs_once(self):
+        client = Platega("m", "s", session=ConversionsSession(total=3))
+        fetch = client.fetch_conversions()
+        await fetch
+
+        with pytest.raises(RuntimeError, match="only run once"):
+            await fetch
+
+    def test_invalid_arguments(self, client):
+        with pytest.raises(ValueError, match="size"):
+            client.fetch_conversions(size=0)
+        with pytest.raises(ValueError, match="concurrency"):
+            client.fetch_conversions(concurrency=0)
@@ -0,0 +1,179 @@
+import math
+import random
+import statistics
+from collections import defaultdict
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from aioplatega.reporting import (  # noqa: E402
+    GroupReport,
+    commission_totals,
+    group_by,
+    transaction_columns,
+)
+from aioplatega.types import PaymentDetails, TransactionStatusResponse  # noqa: E402
+
+
+@pytest.fixture
+def conversions():
+    generator = random.Random(42)
+    rows = 2_000
+    amounts = [generator.uniform(1, 1000) for _ in range(rows)]
+    for index in range(0, rows, 17):
+        amounts[index] = math.nan
+    return {
+        "id": np.arange(rows, dtype=np.int64),
+        "amount": np.array(amounts),
+        "currency": np.array([generator.choice(["RUB", "USDT", "BTC"]) for _ in range(rows)]),
+        "status": np.array([generator.choice(["DONE", "PENDING"]) for _ in range(rows)]),
+        "created_at": np.array(
+            [
+                f"2025-01-{generator.randint(1, 28):02d}T{generator.randint(0, 23):02d}:00"
+                for _ in range(rows)
+            ],
+            "datetime64[us]",
+        ),
+    }
+
+
+def reference(columns, by, value):
+    groups = defaultdict(list)
+    for index in range(len(columns[value])):
+        key = tuple(
+            str(columns["created_at"][index].astype("datetime64[D]"))
+            if name == "day"
+            else str(columns[name][index])
+            for name in by
+        )
+        groups[key].append(float(columns[value][index]))
+    return groups
+
+
+class TestGroupBy:
+    def test_matches_python_reference(self, conversions):
+        report = group_by(
+            conversions, ["currency", "status", "day"], values="amount", percentiles=[0.5, 0.95]
+        )
+        expected = reference(conversions, ["currency", "status", "day"], "amount")
+
+        assert len(report) == len(expected)
+        for row in report.rows():
+            amounts = expected[(row["currency"], row["status"], str(row["day"]))]
+            present = [amount for amount in amounts if not math.isnan(amount)]
+            assert row["count"] == len(amounts)
+            assert row["amount_sum"] == pytest.approx(sum(present))
+            quantiles = statistics.quantiles(present, n=20, method="inclusive")
+            assert row["amount_p50"] == pytest.approx(statistics.median(present))
+            assert row["amount_p95"] == pytest.approx(quantiles[18])
+
+    def test_groups_are_sorted_by_key(self, conversions):
+        report = group_by(conversions, "currency", values="amount")
+
+        assert report["currency"].tolist() == ["BTC", "RUB", "USDT"]
+        assert report["count"].sum() == 2_000
+
+    def test_without_keys_aggregates_everything(self, conversions):
+        report = group_by(conversions, values="amount", percentiles=[0, 1])
+
+        assert len(report) == 1
+        assert report["count"].tolist() == [2_000]
+        assert report["amount_p0"][0] == np.nanmin(conversions["amount"])
+        assert report["amount_p100"][0] == np.nanmax(conversions["amount"])
+
+    def test_group_without_values_has_nan_percentiles(self):
+        columns = {"currency": np.array(["RUB", "USDT"]), "amount": np.array([1.0, np.nan])}
+
+        report = group_by(columns, "currency", values="amount", percentiles=[0.5])
+
+        assert report["amount_sum"].tolist() == [1.0, 0.0]
+        assert math.isnan(report["amount_p50"][1])
+
+    def test_empty_columns(self, conversions):
+        empty = {name: column[:0] for name, column in conversions.items()}
+
+        report = group_by(empty, "currency", values="amount", percentiles=[0.5])
+
+        assert len(report) == 0
+        assert report["amount_sum"].dtype == np.float64
+
+    def test_unknown_column(self, conversions):
+        with pytest.raises(KeyError, match="payment_method"):
+            group_by(conversions, "payment_method")
+
+    def test_invalid_percentile(self, conversions):
+        with pytest.raises(ValueError, match="percentiles"):
+            group_by(conversions, values="amount", percentiles=[95])
+
+
+class TestTransactionColumns:
+    def test_builds_columns_and_commission_totals(self):
+        responses = [
+            TransactionStatusResponse(
+                status="CONFIRMED",
+                payment_method="SBPQR",
+                payment_details=PaymentDetails(amount=100.0, currency="RUB"),
+                commission=3.0,
+                commission_usdt=0.03,
+            ),
+            TransactionStatusResponse(
+                status="CONFIRMED",
+                payment_method="CARD",
+                payment_details=PaymentDetails(amount=50.0, currency="RUB"),
+                commission=1.5,
+            ),
+            TransactionStatusResponse(status="PENDING"),
+        ]
+
+        columns = transaction_columns(responses)
+        report = commission_totals(columns, by=["status", "payment_method"])
+
+        assert columns["currency"].tolist() == ["RUB", "RUB", ""]
+        assert np.isnan(columns["amount"][2])
+        assert isinstance(report, GroupReport)
+        assert list(report.rows()) == [
+            {
+                "status": "CONFIRMED",
+                "payment_method": "CARD",
+                "count": 1,
+                "commission_sum": 1.5,
+                "commission_usdt_sum": 0.0,
+            },
+            {
+                "status": "CONFIRMED",
+                "payment_method": "SBPQR",
+                "count": 1,
+                "commission_sum": 3.0,
+                "commission_usdt_sum": 0.03,
+            },
+            {
+                "status": "PENDING",
+                "payment_method": "",
+                "count": 1,
+                "commission_sum": 0.0,
+                "commission_usdt_sum": 0.0,
+            },
+        ]
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        pytest.param(np.arange(5_000)[::-1] * 10**9, id="sparse integers"),
+        pytest.param(np.array(["RUB"] * 4_999 + ["AAA"]), id="rare string"),
+        pytest.param(np.array([f"K{index % 977}" for index in range(5_000)]), id="many strings"),
+        pytest.param(np.array([3, -1, 7, 3] * 1_250, np.int32), id="dense integers"),
+        pytest.param(
+            np.array(["2025-01-02", "NaT", "2025-01-01"] * 1_000, "datetime64[D]"), id="dates"
+        ),
+    ],
+)
+def test_keys_match_numpy_unique(keys):
+    report = group_by({"key": keys, "value": np.ones(len(keys))}, "key", values="value")
+    uniques, counts = np.unique(keys, return_counts=True)
+
+    assert report["key"].dtype == keys.dtype
+    np.testing.assert_array_equal(report["key"], uniques)
+    np.testing.assert_array_equal(report["count"], counts)
+    np.testing.assert_array_equal(report["value_sum"], counts)
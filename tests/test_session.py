@@ -1,24 +1,43 @@
+import asyncio
 import json
+import subprocess
+import sys
 from unittest.mock import AsyncMock, patch
 from uuid import UUID
 
 import aresponses
 import pytest
 
-from aioplatega.enums import PaymentMethodInt
+from aioplatega.enums import ParseMode, PaymentMethodInt
 from aioplatega.exceptions import (
     ClientDecodeError,
     PlategaAPIError,
     PlategaBadRequestError,
+    PlategaDeadlineExceededError,
     PlategaForbiddenError,
     PlategaNetworkError,
     PlategaNotFoundError,
+    PlategaRateLimitError,
     PlategaServerError,
+    PlategaTimeoutError,
     PlategaUnauthorizedError,
 )
-from aioplatega.methods import CreateTransaction, GetRate, GetTransactionStatus
-from aioplatega.session.aiohttp import AiohttpSession
+from aioplatega.methods import (
+    CreateTransaction,
+    GetConversions,
+    GetRate,
+    GetTransactionStatus,
+    RequestTimeout,
+)
+from aioplatega.session.aiohttp import AiohttpSession, _parse_retry_after
+from aioplatega.session.codec import MsgspecCodec, OrjsonCodec, StdlibJSONCodec
+from aioplatega.session.deadline import deadline, no_deadline, remaining_time
+from aioplatega.session.parsing import current_parse_mode, use_parse_mode
+from aioplatega.session.pool import PoolConfig, PoolStats, get_ssl_context
+from aioplatega.session.request_plan import get_request_plan
+from aioplatega.session.warmup import WarmupReport, build_schemas
 from aioplatega.types import (
+    CompactTransactionStatusResponse,
     CreateTransactionResponse,
     PaymentDetails,
     RateResponse,
@@ -274,6 +293,56 @@ class TestAiohttpSessionErrors:
 
         await session.close()
 
+    async def test_429_rate_limited(self, session):
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(
+                API_HOST,
+                "/transaction/process",
+                "POST",
+                aresponses.Response(
+                    body=json.dumps({"message": "Too many requests"}),
+                    content_type="application/json",
+                    status=429,
+                    headers={"Retry-After": "3"},
+                ),
+            )
+            session._api_url = "http://app.platega.io"
+
+            method = CreateTransaction(
+                payment_method=PaymentMethodInt.SBP_QR,
+                payment_details=PaymentDetails(amount=100.0, currency="RUB"),
+            )
+
+            with pytest.raises(PlategaRateLimitError) as exc_info:
+                await session.make_request(MERCHANT_ID, SECRET, method)
+
+            assert exc_info.value.status_code == 429
+            assert exc_info.value.retry_after == 3.0
+
+        await session.close()
+
+    async def test_non_json_server_error_is_mapped(self, session):
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(
+                API_HOST,
+                "/transaction/process",
+                "POST",
+                aresponses.Response(body="Bad Gateway", content_type="text/plain", status=502),
+            )
+            session._api_url = "http://app.platega.io"
+
+            method = CreateTransaction(
+                payment_method=PaymentMethodInt.SBP_QR,
+                payment_details=PaymentDetails(amount=100.0, currency="RUB"),
+            )
+
+            with pytest.raises(PlategaServerError) as exc_info:
+                await session.make_request(MERCHANT_ID, SECRET, method)
+
+            assert exc_info.value.body == "Bad Gateway"
+
+        await session.close()
+
     async def test_non_json_error_response(self, session):
         async with aresponses.ResponsesMockServer() as arsps:
             arsps.add(
@@ -392,3 +461,485 @@ class TestAiohttpSessionLifecycle:
         session = AiohttpSession(api_url="https://custom.api.com")
         assert session._api_url == "https://custom.api.com"
         await session.close()
+
+
+class TestAiohttpSessionPool:
+    async def test_default_pool_config(self, session):
+        assert session._pool == PoolConfig()
+
+    async def test_connector_uses_pool_config(self):
+        pool = PoolConfig(limit=7, limit_per_host=3, keepalive_timeout=5.0, ttl_dns_cache=60)
+        session = AiohttpSession(pool=pool)
+        connector = session._get_session().connector
+
+        assert connector.limit == 7
+        assert connector.limit_per_host == 3
+        assert connector._keepalive_timeout == 5.0
+
+        await session.close()
+
+    async def test_force_close(self):
+        session = AiohttpSession(pool=PoolConfig(force_close=True))
+        connector = session._get_session().connector
+
+        assert connector.force_close is True
+
+        await session.close()
+
+    async def test_ssl_context_is_shared(self):
+        first = AiohttpSession()
+        second = AiohttpSession()
+
+        assert first._get_session().connector._ssl is get_ssl_context()
+        assert second._get_session().connector._ssl is get_ssl_context()
+
+        await first.close()
+        await second.close()
+
+    async def test_pool_stats_before_session(self):
+        session = AiohttpSession(pool=PoolConfig(limit=10, limit_per_host=2))
+        assert session.pool_stats == PoolStats(limit=10, limit_per_host=2)
+
+    async def test_pool_stats_after_request(self, session):
+        tid = "12345678-1234-5678-1234-567812345678"
+
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(
+                API_HOST,
+                f"/transaction/{tid}",
+                "GET",
+                aresponses.Response(
+                    body=json.dumps({"id": tid, "status": "PENDING"}),
+                    content_type="application/json",
+                    status=200,
+                ),
+            )
+            session._api_url = "http://app.platega.io"
+
+            await session.make_request(
+                MERCHANT_ID, SECRET, GetTransactionStatus(transaction_id=UUID(tid))
+            )
+            stats = session.pool_stats
+
+            assert stats.active == 0
+            assert stats.waiting == 0
+            assert stats.limit == 100
+
+        await session.close()
+
+
+class TestAiohttpSessionTimeouts:
+    def test_method_timeout_overrides_default(self, session):
+        timeout = session._client_timeout(GetConversions())
+        assert timeout.total == GetConversions.__timeout__.total
+        assert timeout.connect == GetConversions.__timeout__.connect
+        assert timeout.sock_read == GetConversions.__timeout__.read
+
+    def test_session_default_timeout(self):
+        session = AiohttpSession(timeout=RequestTimeout(connect=1.0, read=2.0, total=3.0))
+        method = GetTransactionStatus(transaction_id=UUID("12345678-1234-5678-1234-567812345678"))
+
+        timeout = session._client_timeout(method)
+
+        assert (timeout.connect, timeout.sock_read, timeout.total) == (1.0, 2.0, 3.0)
+
+    def test_deadline_caps_total(self, session):
+        with deadline(0.5):
+            timeout = session._client_timeout(GetConversions())
+        assert timeout.total <= 0.5
+
+    def test_expired_deadline_fails_fast(self, session):
+        with deadline(-1), pytest.raises(PlategaDeadlineExceededError, match="Deadline exceeded"):
+            session._client_timeout(GetConversions())
+
+    def test_nested_deadline_only_shortens(self):
+        with deadline(0.1), deadline(10):
+            remaining = remaining_time()
+        assert remaining is not None
+        assert remaining <= 0.1
+        assert remaining_time() is None
+
+    def test_no_deadline_lifts_deadline(self):
+        with deadline(0.1):
+            with no_deadline():
+                assert remaining_time() is None
+            assert remaining_time() is not None
+
+    async def test_slow_response_raises_timeout_error(self, session):
+        tid = "12345678-1234-5678-1234-567812345678"
+
+        async def slow_handler(request):
+            await asyncio.sleep(1)
+            return aresponses.Response(status=200)
+
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(API_HOST, f"/transaction/{tid}", "GET", slow_handler)
+            session._api_url = "http://app.platega.io"
+
+            method = GetTransactionStatus(transaction_id=UUID(tid))
+            with deadline(0.05), pytest.raises(PlategaTimeoutError):
+                await session.make_request(MERCHANT_ID, SECRET, method)
+
+        await session.close()
+
+    async def test_timeout_is_network_error(self, session):
+        session._api_url = "http://app.platega.io"
+        session._get_session()
+
+        method = CreateTransaction(
+            payment_method=PaymentMethodInt.SBP_QR,
+            payment_details=PaymentDetails(amount=100.0, currency="RUB"),
+        )
+
+        with (
+            patch.object(
+                session._session,
+                "post",
+                new_callable=AsyncMock,
+                side_effect=asyncio.TimeoutError(),
+            ),
+            pytest.raises(PlategaNetworkError),
+        ):
+            await session.make_request(MERCHANT_ID, SECRET, method)
+
+        await session.close()
+
+
+class TestParseRetryAfter:
+    def test_seconds(self):
+        assert _parse_retry_after("5") == 5.0
+        assert _parse_retry_after(" 1.5 ") == 1.5
+
+    def test_negative_seconds_clamped(self):
+        assert _parse_retry_after("-3") == 0.0
+
+    def test_http_date_in_past(self):
+        assert _parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_http_date_in_future(self):
+        assert _parse_retry_after("Fri, 31 Dec 2100 23:59:59 GMT") > 0
+
+    def test_missing_or_invalid(self):
+        assert _parse_retry_after(None) is None
+        assert _parse_retry_after("") is None
+        assert _parse_retry_after("soon") is None
+
+
+class RecordingCodec(StdlibJSONCodec):
+    def __init__(self) -> None:
+        self.dumped: list[object] = []
+        self.loaded: list[bytes] = []
+
+    def dumps(self, obj):
+        self.dumped.append(obj)
+        return super().dumps(obj)
+
+    def loads(self, data):
+        self.loaded.append(data)
+        return super().loads(data)
+
+
+class TestAiohttpSessionCodec:
+    async def test_request_body_uses_codec(self):
+        codec = RecordingCodec()
+        session = AiohttpSession(codec=codec)
+        received = {}
+
+        async def handler(request):
+            received.update(await request.json())
+            received["content_type"] = request.content_type
+            return aresponses.Response(
+                body=json.dumps(
+                    {"transactionId": "12345678-1234-5678-1234-567812345678", "status": "PENDING"}
+                ),
+                content_type="application/json",
+            )
+
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(API_HOST, "/transaction/process", "POST", handler)
+            session._api_url = "http://app.platega.io"
+
+            method = CreateTransaction(
+                payment_method=PaymentMethodInt.SBP_QR,
+                payment_details=PaymentDetails(amount=100.0, currency="RUB"),
+            )
+            result = await session.make_request(MERCHANT_ID, SECRET, method)
+
+        assert isinstance(result, CreateTransactionResponse)
+        assert codec.dumped == [
+            {"paymentMethod": 2, "paymentDetails": {"amount": 100.0, "currency": "RUB"}}
+        ]
+        assert received["paymentMethod"] == 2
+        assert received["content_type"] == "application/json"
+        assert codec.loaded == []
+
+        await session.close()
+
+    async def test_error_body_decoded_with_codec(self):
+        codec = RecordingCodec()
+        session = AiohttpSession(codec=codec)
+
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(
+                API_HOST,
+                "/transaction/process",
+                "POST",
+                aresponses.Response(
+                    body=json.dumps({"message": "Invalid"}),
+                    content_type="application/json",
+                    status=400,
+                ),
+            )
+            session._api_url = "http://app.platega.io"
+
+            method = CreateTransaction(
+                payment_method=PaymentMethodInt.SBP_QR,
+                payment_details=PaymentDetails(amount=100.0, currency="RUB"),
+            )
+            with pytest.raises(PlategaBadRequestError) as exc_info:
+                await session.make_request(MERCHANT_ID, SECRET, method)
+
+        assert exc_info.value.body == {"message": "Invalid"}
+        assert codec.loaded == [b'{"message": "Invalid"}']
+
+        await session.close()
+
+    async def test_decode_error_includes_body(self, session):
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(
+                API_HOST,
+                "/transaction/process",
+                "POST",
+                aresponses.Response(body="not json", content_type="text/plain", status=200),
+            )
+            session._api_url = "http://app.platega.io"
+
+            method = CreateTransaction(
+                payment_method=PaymentMethodInt.SBP_QR,
+                payment_details=PaymentDetails(amount=100.0, currency="RUB"),
+            )
+            with pytest.raises(ClientDecodeError, match="Failed to decode response.*not json"):
+                await session.make_request(MERCHANT_ID, SECRET, method)
+
+        await session.close()
+
+
+class TestAiohttpSessionParseMode:
+    STATUS_BODY = {"id": "12345678-1234-5678-1234-567812345678", "status": "CONFIRMED"}
+
+    async def fetch_status(self, session):
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(
+                API_HOST,
+                "/transaction/12345678-1234-5678-1234-567812345678",
+                "GET",
+                aresponses.Response(
+                    body=json.dumps(self.STATUS_BODY), content_type="application/json"
+                ),
+            )
+            session._api_url = "http://app.platega.io"
+            method = GetTransactionStatus(
+                transaction_id=UUID("12345678-1234-5678-1234-567812345678")
+            )
+            return await session.make_request(MERCHANT_ID, SECRET, method)
+
+    async def test_default_validates(self, session):
+        assert session.parse_mode is ParseMode.VALIDATE
+        result = await self.fetch_status(session)
+        assert isinstance(result, TransactionStatusResponse)
+        await session.close()
+
+    async def test_session_compact(self):
+        session = AiohttpSession(parse_mode=ParseMode.COMPACT)
+        result = await self.fetch_status(session)
+
+        assert isinstance(result, CompactTransactionStatusResponse)
+        assert result.id == UUID("12345678-1234-5678-1234-567812345678")
+        assert result.status == "CONFIRMED"
+        await session.close()
+
+    async def test_scope_overrides_session(self):
+        session = AiohttpSession(parse_mode=ParseMode.COMPACT)
+        with use_parse_mode(ParseMode.VALIDATE):
+            result = await self.fetch_status(session)
+
+        assert isinstance(result, TransactionStatusResponse)
+        assert current_parse_mode() is None
+        await session.close()
+
+    async def test_trusted(self):
+        session = AiohttpSession(parse_mode=ParseMode.TRUSTED)
+        self.STATUS_BODY = {**self.STATUS_BODY, "riskScore": 7}
+        result = await self.fetch_status(session)
+
+        assert result.id == "12345678-1234-5678-1234-567812345678"
+        assert result.riskScore == 7
+        assert isinstance(result.to_model(), TransactionStatusResponse)
+        await session.close()
+
+    async def test_trusted_decode_error(self):
+        session = AiohttpSession(parse_mode=ParseMode.TRUSTED)
+        self.STATUS_BODY = ["not", "an", "object"]
+        with pytest.raises(ClientDecodeError, match="Failed to parse response"):
+            await self.fetch_status(session)
+        await session.close()
+
+    async def test_compact_decode_error(self):
+        session = AiohttpSession(parse_mode=ParseMode.COMPACT)
+        self.STATUS_BODY = {"id": "not-a-uuid"}
+        with pytest.raises(ClientDecodeError, match="Failed to parse response"):
+            await self.fetch_status(session)
+        await session.close()
+
+
+class TestCodecs:
+    @pytest.mark.parametrize("codec_cls", [StdlibJSONCodec, OrjsonCodec, MsgspecCodec])
+    def test_roundtrip(self, codec_cls):
+        if codec_cls is OrjsonCodec:
+            pytest.importorskip("orjson")
+        if codec_cls is MsgspecCodec:
+            pytest.importorskip("msgspec")
+        codec = codec_cls()
+        payload = {"paymentMethod": 2, "description": "Заказ", "amount": 1.5}
+
+        encoded = codec.dumps(payload)
+
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == payload
+
+
+class TestRequestPlan:
+    def test_path_params_split_from_payload(self):
+        plan = get_request_plan(GetTransactionStatus)
+
+        assert plan.http_method == "GET"
+        assert plan.path_params == (("transaction_id", "transactionId"),)
+        assert plan.payload_fields == frozenset()
+
+    def test_build_formats_path(self):
+        tid = "12345678-1234-5678-1234-567812345678"
+        plan = get_request_plan(GetTransactionStatus)
+
+        path, payload = plan.build(GetTransactionStatus(transaction_id=UUID(tid)))
+
+        assert path == f"/transaction/{tid}"
+        assert payload == {}
+
+    def test_build_uses_aliases_and_json_mode(self):
+        plan = get_request_plan(GetConversions)
+
+        path, payload = plan.build(GetConversions(from_date="2025-01-01", page=2))
+
+        assert path == "/transaction/balance-unlock-operations"
+        assert payload == {"from": "2025-01-01", "page": 2, "size": 20}
+        assert plan.aliases["to_date"] == "to"
+
+    def test_plan_is_cached(self):
+        assert get_request_plan(GetRate) is get_request_plan(GetRate)
+
+    def test_unknown_placeholder(self):
+        # A stand-in rather than a PlategaMethod subclass, so build_schemas never sees it.
+        class Broken:
+            __api_method__ = "/rates/{missing}"
+            __http_method__ = "GET"
+            model_fields: dict = {}
+
+        with pytest.raises(ValueError, match="missing"):
+            get_request_plan(Broken)
+
+    async def test_path_fields_not_sent_as_query(self, session):
+        tid = "12345678-1234-5678-1234-567812345678"
+        received = {}
+
+        async def handler(request):
+            received["query"] = dict(request.query)
+            received["headers"] = dict(request.headers)
+            return aresponses.Response(
+                body=json.dumps({"id": tid}), content_type="application/json"
+            )
+
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(API_HOST, f"/transaction/{tid}", "GET", handler)
+            session._api_url = "http://app.platega.io"
+
+            await session.make_request(
+                MERCHANT_ID, SECRET, GetTransactionStatus(transaction_id=UUID(tid))
+            )
+
+        assert received["query"] == {}
+        assert received["headers"]["X-MerchantId"] == MERCHANT_ID
+        assert received["headers"]["X-Secret"] == SECRET
+
+        await session.close()
+
+    def test_headers_are_cached(self, session):
+        get_headers = session._get_headers(MERCHANT_ID, SECRET, "GET")
+        post_headers = session._get_headers(MERCHANT_ID, SECRET, "POST")
+
+        assert session._get_headers(MERCHANT_ID, SECRET, "GET") is get_headers
+        assert "Content-Type" not in get_headers
+        assert post_headers["Content-Type"] == "application/json"
+
+
+class TestWarmup:
+    def test_build_schemas_completes_models(self):
+        build_schemas()
+
+        assert TransactionStatusResponse.__pydantic_complete__
+        assert CreateTransaction.__pydantic_complete__
+        assert get_request_plan.cache_info().currsize >= 4
+
+    def test_build_schemas_loads_lazy_modules(self):
+        code = (
+            "from aioplatega.session.warmup import build_schemas\n"
+            "build_schemas()\n"
+            "from aioplatega.types import TransactionStatusResponse\n"
+            "print(TransactionStatusResponse.__pydantic_complete__)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+
+        assert result.stdout.strip() == "True"
+
+    async def test_base_session_warmup_builds_schemas(self, mock_session):
+        report = await mock_session.warmup()
+
+        assert isinstance(report, WarmupReport)
+        assert report.connections == 0
+        assert report.total == report.schemas
+
+    async def test_aiohttp_warmup_opens_connections(self, session, monkeypatch):
+        loop = asyncio.get_running_loop()
+        resolved = []
+
+        async def fake_getaddrinfo(host, port, **kwargs):
+            resolved.append((host, port))
+            return []
+
+        monkeypatch.setattr(loop, "getaddrinfo", fake_getaddrinfo)
+
+        async with aresponses.ResponsesMockServer() as arsps:
+            arsps.add(API_HOST, "/", "HEAD", aresponses.Response(status=200), repeat=2)
+            session._api_url = "http://app.platega.io"
+
+            report = await session.warmup(connections=2)
+
+        assert resolved == [("app.platega.io", 80)]
+        assert report.opened == 2
+        assert report.total >= report.connections > 0
+
+        await session.close()
+
+    async def test_aiohttp_warmup_dns_failure(self, session, monkeypatch):
+        loop = asyncio.get_running_loop()
+
+        async def failing_getaddrinfo(host, port, **kwargs):
+            raise OSError("Name or service not known")
+
+        monkeypatch.setattr(loop, "getaddrinfo", failing_getaddrinfo)
+
+        with pytest.raises(PlategaNetworkError, match="Failed to resolve"):
+            await session.warmup()
+
+        await session.close()
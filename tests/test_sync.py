@@ -0,0 +1,157 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from aioplatega.client import ConversionSync, Platega, SQLiteConversionStore, SyncCheckpoint
+from aioplatega.exceptions import PlategaServerError
+from aioplatega.types import ConversionItem, ConversionsResponse
+from tests.conftest import MockSession
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def parse(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+class HistorySession(MockSession):
+    """Serves conversions filtered by the ``from``/``to`` dates of each request."""
+
+    def __init__(self, items: list[ConversionItem]) -> None:
+        super().__init__()
+        self.items = items
+        self.windows: list[tuple[str | None, str | None]] = []
+        self.failing_windows: set[str] = set()
+
+    def add(self, created_at: datetime, amount: float = 1.0) -> None:
+        self.items.append(
+            ConversionItem(id=len(self.items) + 1, amount=amount, created_at=created_at)
+        )
+
+    async def make_request(self, merchant_id, secret, method):
+        if method.page == 0:
+            self.windows.append((method.from_date, method.to_date))
+        await asyncio.sleep(0)
+        if method.from_date in self.failing_windows:
+            raise PlategaServerError(message="boom", status_code=500)
+        selected = [
+            item
+            for item in self.items
+            if parse(method.from_date) <= item.created_at <= parse(method.to_date)
+        ]
+        start = method.page * method.size
+        return ConversionsResponse(
+            content=selected[start : start + method.size],
+            total_elements=len(selected),
+            total_pages=-(-len(selected) // method.size),
+            page=method.page,
+            size=method.size,
+        )
+
+
+@pytest.fixture
+def session() -> HistorySession:
+    history = HistorySession([])
+    for hour in range(0, 24 * 10, 3):
+        history.add(START + timedelta(hours=hour))
+    return history
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SQLiteConversionStore(tmp_path / "conversions.db")
+    yield store
+    store.close()
+
+
+class TestConversionSync:
+    async def test_backfill_splits_into_windows(self, session, store):
+        sync = ConversionSync(
+            Platega("m", "s", session=session), store, window=timedelta(days=2), size=7
+        )
+
+        report = await sync.run(since=START, until=START + timedelta(days=10))
+
+        assert report.windows == 5
+        assert len(session.windows) == 5
+        assert len(store) == len(session.items) == 80
+        assert report.items >= 80
+        assert report.checkpoint.last_id == 80
+        assert report.checkpoint.created_at == session.items[-1].created_at
+        assert report.checkpoint.window_end == START + timedelta(days=10)
+        assert store.pending_windows() == []
+
+    async def test_incremental_run_fetches_only_new_range(self, session, store):
+        client = Platega("m", "s", session=session)
+        sync = ConversionSync(client, store, window=timedelta(days=30), overlap=timedelta(0))
+        await sync.run(since=START, until=START + timedelta(days=10))
+        session.windows.clear()
+        session.add(START + timedelta(days=10, hours=1), amount=5.0)
+
+        report = await sync.run(until=START + timedelta(days=11))
+
+        assert session.windows == [("2025-01-11T00:00:00Z", "2025-01-12T00:00:00Z")]
+        assert report.items == 1
+        assert len(store) == 81
+        assert report.checkpoint.last_id == 81
+
+    async def test_overlap_upserts_without_duplicates(self, session, store):
+        client = Platega("m", "s", session=session)
+        sync = ConversionSync(client, store, overlap=timedelta(days=1))
+        await sync.run(since=START, until=START + timedelta(days=10))
+        session.items[-1] = session.items[-1].model_copy(update={"status": "CONFIRMED"})
+
+        report = await sync.run(until=START + timedelta(days=10))
+
+        assert report.items == 8
+        assert len(store) == 80
+        (status,) = store.connection.execute(
+            "SELECT status FROM conversions WHERE id = 80"
+        ).fetchone()
+        assert status == "CONFIRMED"
+
+    async def test_interrupted_backfill_resumes(self, session, store):
+        client = Platega("m", "s", session=session)
+        sync = ConversionSync(
+            client, store, window=timedelta(days=1), overlap=timedelta(0), concurrency=2
+        )
+        session.failing_windows.add("2025-01-05T00:00:00Z")
+
+        with pytest.raises(PlategaServerError):
+            await sync.run(since=START, until=START + timedelta(days=10))
+
+        pending = store.pending_windows()
+        assert (START + timedelta(days=4), START + timedelta(days=5)) in pending
+        assert len(pending) < 10
+
+        session.failing_windows.clear()
+        session.windows.clear()
+        report = await sync.run(until=START + timedelta(days=10))
+
+        assert report.windows == len(pending)
+        assert len(session.windows) == len(pending)
+        assert len(store) == 80
+        assert store.pending_windows() == []
+
+    async def test_first_run_requires_since(self, store, client):
+        with pytest.raises(ValueError, match="since"):
+            await ConversionSync(client, store).run()
+
+    def test_split(self, store, client):
+        sync = ConversionSync(client, store, window=timedelta(days=2))
+
+        assert sync.split(START, START + timedelta(days=3)) == [
+            (START, START + timedelta(days=2)),
+            (START + timedelta(days=2), START + timedelta(days=3)),
+        ]
+
+    def test_empty_store_checkpoint(self, store):
+        assert store.checkpoint() == SyncCheckpoint()
+        assert len(store) == 0
+
+    def test_invalid_arguments(self, store, client):
+        with pytest.raises(ValueError, match="window"):
+            ConversionSync(client, store, window=timedelta(0))
+        with pytest.raises(ValueError, match="concurrency"):
+            ConversionSync(client, store, concurrency=0)
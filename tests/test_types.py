@@ -1,12 +1,20 @@
-from datetime import datetime
+import copy
+import dataclasses
+import pickle
+from datetime import datetime, timezone
 from uuid import UUID
 
 import pytest
 from pydantic import ValidationError
 
-from aioplatega.enums import PaymentMethodInt, PaymentStatus
+from aioplatega.enums import ParseMode, PaymentMethodInt, PaymentStatus
+from aioplatega.session.parsing import parse_response
 from aioplatega.types import (
     CallbackPayload,
+    CompactConversionItem,
+    CompactConversionsResponse,
+    CompactPaymentDetails,
+    CompactTransactionStatusResponse,
     ConversionItem,
     ConversionsResponse,
     CreateTransactionRequest,
@@ -15,6 +23,8 @@ from aioplatega.types import (
     RateResponse,
     TransactionStatusResponse,
 )
+from aioplatega.types.compact import COMPACT_TYPES
+from aioplatega.types.trusted import TrustedList, TrustedObject
 
 
 class TestPlategaObject:
@@ -233,3 +243,133 @@ class TestConversionsResponse:
         data = resp.model_dump(by_alias=True)
         assert "totalElements" in data
         assert "totalPages" in data
+
+
+class TestCompactTypes:
+    @pytest.mark.parametrize(("model", "compact"), list(COMPACT_TYPES.items()))
+    def test_same_fields_and_aliases(self, model, compact):
+        compact_fields = {f.name: f for f in dataclasses.fields(compact)}
+        assert set(compact_fields) == set(model.model_fields)
+        for name, info in model.model_fields.items():
+            assert compact.__pydantic_fields__[name].alias == info.alias
+
+    def test_slots(self):
+        item = CompactConversionItem(id=1, amount=10.0)
+        assert not hasattr(item, "__dict__")
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            item.amount = 20.0  # type: ignore[misc]
+
+    def test_parse_compact(self):
+        raw = (
+            b'{"content": [{"id": 1, "amount": 5, "createdAt": "2025-01-01T00:00:00Z",'
+            b' "unknown": true}], "totalElements": 1, "totalPages": 1}'
+        )
+        resp = parse_response(ConversionsResponse, raw, ParseMode.COMPACT)
+
+        assert isinstance(resp, CompactConversionsResponse)
+        assert resp.total_pages == 1
+        item = resp.content[0]
+        assert isinstance(item, CompactConversionItem)
+        assert item.amount == 5.0
+        assert item.created_at == datetime(2025, 1, 1, tzinfo=timezone.utc)
+        assert not hasattr(item, "unknown")
+
+    def test_parse_compact_enum_values(self):
+        raw = b'{"status": "CONFIRMED", "paymentDetails": {"amount": 1, "currency": "RUB"}}'
+        resp = parse_response(TransactionStatusResponse, raw, ParseMode.COMPACT)
+
+        assert isinstance(resp, CompactTransactionStatusResponse)
+        assert resp.status == "CONFIRMED"
+        assert type(resp.status) is str
+        assert resp.payment_details == CompactPaymentDetails(amount=1.0, currency="RUB")
+
+    def test_parse_without_compact_counterpart(self):
+        raw = b'{"transactionId": "12345678-1234-5678-1234-567812345678", "status": "PENDING"}'
+        resp = parse_response(CreateTransactionResponse, raw, ParseMode.COMPACT)
+        assert isinstance(resp, CreateTransactionResponse)
+
+    def test_parse_validate(self):
+        resp = parse_response(ConversionsResponse, b'{"content": []}', ParseMode.VALIDATE)
+        assert isinstance(resp, ConversionsResponse)
+
+
+class TestTrustedParsing:
+    BODY = (
+        b'{"content": [{"id": 1, "amount": 5.5, "createdAt": "2025-01-01T00:00:00Z",'
+        b' "fee": 0.1}, {"id": 2}], "totalElements": 2, "totalPages": 1, "cursor": "abc"}'
+    )
+
+    def test_reads_fields_by_name(self):
+        resp = parse_response(ConversionsResponse, self.BODY, ParseMode.TRUSTED)
+
+        assert isinstance(resp, TrustedObject)
+        assert resp.total_elements == 2
+        assert resp.page == 0
+        assert resp.cursor == "abc"
+        with pytest.raises(AttributeError, match="'ConversionsResponse' object has no attribute"):
+            _ = resp.missing
+
+    def test_nested_list(self):
+        resp = parse_response(ConversionsResponse, self.BODY, ParseMode.TRUSTED)
+
+        content = resp.content
+        assert isinstance(content, TrustedList)
+        assert len(content) == 2
+        first, second = content
+        assert first.amount == 5.5
+        assert first.created_at == "2025-01-01T00:00:00Z"
+        assert first.fee == 0.1
+        assert second.amount is None
+        assert content[1:].raw == [{"id": 2}]
+        assert content.to_models()[0] == ConversionItem(
+            id=1, amount=5.5, created_at=datetime(2025, 1, 1, tzinfo=timezone.utc), fee=0.1
+        )
+
+    def test_nested_object(self):
+        raw = b'{"status": "CONFIRMED", "paymentDetails": {"amount": 1, "currency": "RUB"}}'
+        resp = parse_response(TransactionStatusResponse, raw, ParseMode.TRUSTED)
+
+        assert resp.status == "CONFIRMED"
+        assert resp.payment_details.currency == "RUB"
+        assert resp.payment_details.to_model() == PaymentDetails(amount=1, currency="RUB")
+
+    def test_union_with_scalar(self):
+        raw = (
+            b'{"transactionId": "12345678-1234-5678-1234-567812345678",'
+            b' "status": "PENDING", "paymentDetails": "100 RUB"}'
+        )
+        resp = parse_response(CreateTransactionResponse, raw, ParseMode.TRUSTED)
+        assert resp.payment_details == "100 RUB"
+        assert resp.to_model().transaction_id == UUID("12345678-1234-5678-1234-567812345678")
+
+    @pytest.mark.parametrize("clone", [copy.copy, copy.deepcopy])
+    def test_copy(self, clone):
+        resp = parse_response(ConversionsResponse, self.BODY, ParseMode.TRUSTED)
+
+        cloned = clone(resp)
+
+        assert cloned == resp
+        assert type(cloned) is type(resp)
+        assert clone(resp.content)[0] == resp.content[0]
+
+    def test_pickle(self):
+        resp = parse_response(ConversionsResponse, self.BODY, ParseMode.TRUSTED)
+
+        restored = pickle.loads(pickle.dumps(resp))
+
+        assert restored == resp
+        assert type(restored) is type(resp)
+        assert restored.content[0].fee == 0.1
+        assert pickle.loads(pickle.dumps(resp.content)).raw == resp.content.raw
+
+    def test_private_names_are_not_fields(self):
+        resp = parse_response(ConversionsResponse, self.BODY, ParseMode.TRUSTED)
+
+        assert not hasattr(resp, "__deepcopy__")
+        with pytest.raises(AttributeError):
+            _ = resp._missing
+
+    @pytest.mark.parametrize("raw", [b"not json", b"[1, 2]"])
+    def test_still_checks_json(self, raw):
+        with pytest.raises(ValidationError):
+            parse_response(ConversionsResponse, raw, ParseMode.TRUSTED)
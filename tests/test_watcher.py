@@ -0,0 +1,228 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+import pytest
+
+from aioplatega.client import Platega
+from aioplatega.client.watcher import (
+    PollSchedule,
+    TransactionUpdate,
+    TransactionWatcher,
+    _parse_expires_in,
+)
+from aioplatega.types import TransactionStatusResponse
+from tests.conftest import MockSession
+
+FAST = PollSchedule(min_interval=0.01, max_interval=0.02, expiry_grace=0.0)
+
+
+class ScriptedStatusSession(MockSession):
+    """Returns the next scripted status of each transaction; the last one repeats.
+
+    Exceptions in a script are raised instead of returned.
+    """
+
+    def __init__(self, scripts=None, expires_in=None) -> None:
+        super().__init__()
+        self.scripts = scripts or {}
+        self.default = ["CONFIRMED"]
+        self.expires_in = expires_in
+        self.polls: dict[UUID, int] = {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def make_request(self, merchant_id, secret, method):
+        transaction_id = method.transaction_id
+        count = self.polls.get(transaction_id, 0)
+        self.polls[transaction_id] = count + 1
+        script = self.scripts.get(transaction_id, self.default)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0)
+        finally:
+            self.in_flight -= 1
+        status = script[min(count, len(script) - 1)]
+        if isinstance(status, Exception):
+            raise status
+        return TransactionStatusResponse(
+            id=transaction_id, status=status, expires_in=self.expires_in
+        )
+
+
+def make_watcher(session, **kwargs):
+    kwargs.setdefault("schedule", FAST)
+    return TransactionWatcher(Platega("m", "s", session=session), **kwargs)
+
+
+class TestTransactionWatcher:
+    async def test_reports_transition_and_stops(self):
+        tid = UUID(int=1)
+        session = ScriptedStatusSession({tid: ["PENDING", "PENDING", "CONFIRMED"]})
+
+        async with make_watcher(session) as watcher:
+            updates = watcher.updates()
+            watcher.watch(tid, status="PENDING")
+            update = await asyncio.wait_for(updates.__anext__(), 1)
+            await watcher.join()
+
+        assert update.transaction_id == tid
+        assert (update.previous_status, update.status) == ("PENDING", "CONFIRMED")
+        assert update.final
+        assert not update.expired
+        assert update.response.status == "CONFIRMED"
+        assert session.polls[tid] == 3
+        assert tid not in watcher
+        stats = watcher.stats
+        assert (stats.watched, stats.polls, stats.updates, stats.finished) == (0, 3, 1, 1)
+
+    async def test_callback_receives_intermediate_changes(self):
+        tid = UUID(int=1)
+        session = ScriptedStatusSession({tid: ["PENDING", "CANCELED"]})
+        received: list[TransactionUpdate] = []
+
+        async with make_watcher(session, on_update=received.append) as watcher:
+            watcher.watch(tid)
+            await asyncio.wait_for(watcher.join(), 1)
+
+        assert [(u.previous_status, u.status, u.final) for u in received] == [
+            (None, "PENDING", False),
+            ("PENDING", "CANCELED", True),
+        ]
+
+    async def test_failing_callback_does_not_stop_polling(self, caplog):
+        tids = [UUID(int=index) for index in range(1, 6)]
+        session = ScriptedStatusSession({tid: ["PENDING", "CONFIRMED"] for tid in tids})
+
+        received: list[TransactionUpdate] = []
+
+        def fail(update):
+            received.append(update)
+            raise RuntimeError("callback failed")
+
+        async with make_watcher(session, on_update=fail, concurrency=2) as watcher:
+            for tid in tids:
+                watcher.watch(tid, status="PENDING")
+            await asyncio.wait_for(watcher.join(), 1)
+
+        assert {update.transaction_id for update in received} == set(tids)
+        assert watcher.stats.finished == 5
+        assert watcher.stats.callback_errors == 5
+        assert "on_update failed" in caplog.text
+
+    async def test_terminal_status_without_change(self):
+        tid = UUID(int=1)
+        session = ScriptedStatusSession({tid: ["CONFIRMED"]})
+        received: list[TransactionUpdate] = []
+
+        async with make_watcher(session, on_update=received.append) as watcher:
+            watcher.watch(tid, status="CONFIRMED")
+            await asyncio.wait_for(watcher.join(), 1)
+
+        assert len(received) == 1
+        assert received[0].final
+
+    async def test_expiry(self):
+        tid = UUID(int=1)
+        session = ScriptedStatusSession({tid: ["PENDING"]}, expires_in="0.03")
+        received: list[TransactionUpdate] = []
+
+        async with make_watcher(session, on_update=received.append) as watcher:
+            watcher.watch(tid, status="PENDING")
+            await asyncio.wait_for(watcher.join(), 1)
+
+        assert received[-1].expired
+        assert received[-1].final
+        assert received[-1].status == "PENDING"
+        assert watcher.stats.expired == 1
+
+    async def test_max_age(self):
+        tid = UUID(int=1)
+        session = ScriptedStatusSession({tid: ["PENDING"]})
+        schedule = PollSchedule(min_interval=0.01, max_interval=0.01, max_age=60.0)
+
+        async with make_watcher(session, schedule=schedule) as watcher:
+            watcher.watch(tid, status="PENDING", age=59.98)
+            await asyncio.wait_for(watcher.join(), 1)
+
+        assert watcher.stats.expired == 1
+
+    async def test_errors_are_retried(self):
+        tid = UUID(int=1)
+        session = ScriptedStatusSession({tid: [ValueError("boom"), "CONFIRMED"]})
+
+        async with make_watcher(session) as watcher:
+            watcher.watch(tid, status="PENDING")
+            await asyncio.wait_for(watcher.join(), 1)
+
+        assert watcher.stats.errors == 1
+        assert watcher.stats.finished == 1
+
+    async def test_unwatch(self):
+        tid = UUID(int=1)
+        session = ScriptedStatusSession({tid: ["PENDING"]})
+
+        async with make_watcher(session) as watcher:
+            watcher.watch(str(tid), status="PENDING")
+            assert len(watcher) == 1
+            await asyncio.sleep(0.05)
+            watcher.unwatch(tid)
+            polls = session.polls[tid]
+            await asyncio.sleep(0.05)
+
+        assert session.polls[tid] == polls
+        assert watcher.stats.updates == 0
+
+    async def test_many_transactions_bounded_concurrency(self):
+        session = ScriptedStatusSession()
+
+        async with make_watcher(session, concurrency=8) as watcher:
+            for index in range(1, 2001):
+                watcher.watch(UUID(int=index), status="PENDING")
+            await asyncio.wait_for(watcher.join(), 5)
+
+        assert watcher.stats.finished == 2000
+        assert sum(session.polls.values()) == 2000
+        assert session.max_in_flight <= 8
+
+    async def test_close_ends_iteration(self):
+        watcher = make_watcher(ScriptedStatusSession())
+        watcher.start()
+        updates = watcher.updates()
+        waiter = asyncio.ensure_future(updates.__anext__())
+        await asyncio.sleep(0)
+        await watcher.close()
+
+        with pytest.raises(StopAsyncIteration):
+            await waiter
+
+
+class TestPollSchedule:
+    def test_interval_grows_with_age(self):
+        schedule = PollSchedule(min_interval=2.0, max_interval=60.0, age_factor=0.1)
+        assert schedule.interval(0) == 2.0
+        assert schedule.interval(100) == 10.0
+        assert schedule.interval(3600) == 60.0
+
+
+class TestParseExpiresIn:
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            (None, None),
+            ("", None),
+            ("90", 90.0),
+            ("00:15:00", 900.0),
+            ("1.02:00:30", 93630.0),
+            ("soon", None),
+        ],
+    )
+    def test_formats(self, value, expected):
+        assert _parse_expires_in(value) == expected
+
+    def test_timestamp(self):
+        moment = datetime.now(timezone.utc) + timedelta(minutes=10)
+        remaining = _parse_expires_in(moment.isoformat().replace("+00:00", "Z"))
+        assert remaining is not None
+        assert 590 < remaining <= 600